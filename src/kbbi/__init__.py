@@ -8,4 +8,51 @@
 .. moduleauthor:: sage <laymonage@gmail.com>
 """
 
+import sys as _sys
+from types import ModuleType as _ModuleType
+
 from .kbbi import *  # NOQA
+from .kbbi import __all__ as _semua
+
+# Nama yang baru diimpor saat pertama kali diakses agar "import kbbi" tetap
+# ringan: nama -> (modul, atribut). Modul yang diawali titik relatif
+# terhadap paket ini. Atribut None berarti modul itu sendiri.
+_NAMA_MALAS = {
+    # Dahulu ikut diekspor oleh "from .kbbi import *".
+    "requests": ("requests", None),
+    "BeautifulSoup": ("bs4", "BeautifulSoup"),
+    "TembolokLaman": (".tembolok", "TembolokLaman"),
+    "TembolokObjek": (".tembolok", "TembolokObjek"),
+    "IndeksSaran": (".saran", "IndeksSaran"),
+    "PembatasLaju": (".pembatas", "PembatasLaju"),
+    "PenjadwalPencarian": (".penjadwal", "PenjadwalPencarian"),
+    "KebijakanCobaUlang": (".coba_ulang", "KebijakanCobaUlang"),
+    "PenyimpanKuki": (".kuki", "PenyimpanKuki"),
+}
+
+__all__ = _semua + [n for n, (m, _) in _NAMA_MALAS.items() if m[0] == "."]
+
+
+class _PaketKBBI(_ModuleType):
+    # Pengganti __getattr__ tingkat modul (PEP 562) yang baru tersedia
+    # sejak Python 3.7.
+
+    def __getattr__(self, nama):
+        try:
+            modul, atribut = _NAMA_MALAS[nama]
+        except KeyError:
+            raise AttributeError(
+                f"module {self.__name__!r} has no attribute {nama!r}"
+            ) from None
+        from importlib import import_module
+
+        nilai = import_module(modul, self.__name__)
+        if atribut is not None:
+            nilai = getattr(nilai, atribut)
+        return nilai
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()) | set(_NAMA_MALAS))
+
+
+_sys.modules[__name__].__class__ = _PaketKBBI
@@ -0,0 +1,279 @@
+"""
+:mod:`kbbi.arsip` -- Arsip luring KBBI Python
+=============================================
+
+.. module:: kbbi.arsip
+   :platform: Unix, Windows, Mac
+   :synopsis: Modul ini mengandung implementasi arsip luring untuk kbbi.
+.. moduleauthor:: sage <laymonage@gmail.com>
+
+Arsip adalah sebuah berkas berisi hasil serialisasi laman-laman KBBI beserta
+indeks hash kuerinya. Berkas tersebut dibaca melalui mmap sehingga pencarian
+tidak perlu memuat seluruh berkas dan banyak proses dapat menggunakan satu
+salinan yang sama melalui page cache sistem operasi.
+
+Susunan berkas (semua bilangan little-endian):
+
+- kepala: penanda, versi, jumlah kueri, ukuran tabel, posisi tabel;
+- rekaman: hasil serialisasi dalam JSON (UTF-8), ditulis berurutan;
+- kunci: kueri yang telah dinormalisasi (UTF-8), ditulis berurutan;
+- tabel: tabel hash dengan linear probing, setiap slot berisi hash kueri,
+  posisi dan panjang kunci, serta posisi dan panjang rekaman.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+
+from .kbbi import (
+    KBBI,
+    TidakAdaDiTembolok,
+    TidakDitemukan,
+    kueri_dari_pranala,
+)
+from .tembolok import TembolokObjek
+
+PENANDA = b"KBBIARSP"
+VERSI = 1
+
+_KEPALA = struct.Struct("<8sIIQQ")
+_SLOT = struct.Struct("<QQIQI")
+
+
+def _hash(kunci):
+    return int.from_bytes(
+        hashlib.blake2b(kunci, digest_size=8).digest(), "little"
+    )
+
+
+def _kunci(kueri):
+    return TembolokObjek.normalisasi(kueri).encode("utf-8")
+
+
+class PembuatArsip:
+    """Penulis berkas arsip dari hasil-hasil KBBI.serialisasi.
+
+    Berkas ditulis ke lokasi sementara terlebih dahulu dan baru dipindahkan
+    ke lokasi tujuan ketika PembuatArsip ditutup.
+    """
+
+    def __init__(self, lokasi):
+        """Membuat penulis arsip baru.
+
+        :param lokasi: Lokasi berkas arsip yang akan dibuat
+        :type lokasi: str atau PathLike
+        """
+        self.lokasi = os.fspath(lokasi)
+        self._lokasi_sementara = f"{self.lokasi}.sementara"
+        self._berkas = open(self._lokasi_sementara, "wb")
+        self._berkas.write(bytes(_KEPALA.size))
+        self._indeks = {}
+
+    def tambah(self, serialisasi, kueri=None):
+        """Menambahkan hasil serialisasi sebuah laman ke dalam arsip.
+
+        Jika kueri yang sama ditambahkan lebih dari sekali, hasil yang
+        terakhir yang akan digunakan.
+
+        :param serialisasi: Dictionary hasil KBBI.serialisasi
+        :type serialisasi: dict
+        :param kueri: Kata kunci pencarian laman tersebut (jika tidak
+            diberikan, kueri diambil dari pranala)
+        :type kueri: str
+        """
+        if kueri is None:
+            kueri = kueri_dari_pranala(serialisasi["pranala"])
+        data = json.dumps(
+            serialisasi, ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8")
+        self._indeks[_kunci(kueri)] = (self._berkas.tell(), len(data))
+        self._berkas.write(data)
+
+    def _tulis_tabel(self):
+        posisi_kunci = {}
+        for kunci in self._indeks:
+            posisi_kunci[kunci] = self._berkas.tell()
+            self._berkas.write(kunci)
+        ukuran_tabel = 1
+        while ukuran_tabel < len(self._indeks) * 2:
+            ukuran_tabel *= 2
+        tabel = bytearray(ukuran_tabel * _SLOT.size)
+        for kunci, (posisi, panjang) in self._indeks.items():
+            nilai_hash = _hash(kunci)
+            i = nilai_hash & (ukuran_tabel - 1)
+            while _SLOT.unpack_from(tabel, i * _SLOT.size)[4]:
+                i = (i + 1) & (ukuran_tabel - 1)
+            _SLOT.pack_into(
+                tabel,
+                i * _SLOT.size,
+                nilai_hash,
+                posisi_kunci[kunci],
+                len(kunci),
+                posisi,
+                panjang,
+            )
+        posisi_tabel = self._berkas.tell()
+        self._berkas.write(tabel)
+        self._berkas.seek(0)
+        self._berkas.write(
+            _KEPALA.pack(
+                PENANDA, VERSI, len(self._indeks), ukuran_tabel, posisi_tabel
+            )
+        )
+
+    def tutup(self):
+        """Menyelesaikan penulisan dan memindahkan arsip ke lokasi tujuan."""
+        if self._berkas.closed:
+            return
+        with self._berkas:
+            self._tulis_tabel()
+        os.replace(self._lokasi_sementara, self.lokasi)
+
+    def batalkan(self):
+        """Membatalkan penulisan dan menghapus berkas sementara."""
+        if self._berkas.closed:
+            return
+        self._berkas.close()
+        os.remove(self._lokasi_sementara)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, tipe, *args):
+        if tipe is None:
+            self.tutup()
+        else:
+            self.batalkan()
+
+
+def buat_arsip(lokasi, daftar_serialisasi):
+    """Membuat berkas arsip dari kumpulan hasil KBBI.serialisasi.
+
+    :param lokasi: Lokasi berkas arsip yang akan dibuat
+    :type lokasi: str atau PathLike
+    :param daftar_serialisasi: Kumpulan dictionary hasil KBBI.serialisasi
+    :type daftar_serialisasi: iterable
+    :returns: Jumlah laman yang ditambahkan
+    :rtype: int
+    """
+    jumlah = 0
+    with PembuatArsip(lokasi) as pembuat:
+        for serialisasi in daftar_serialisasi:
+            pembuat.tambah(serialisasi)
+            jumlah += 1
+    return jumlah
+
+
+class Arsip:
+    """Pembaca berkas arsip yang dibuat dengan PembuatArsip."""
+
+    kelas_kbbi = KBBI
+
+    def __init__(self, lokasi):
+        """Membuka berkas arsip untuk dibaca.
+
+        :param lokasi: Lokasi berkas arsip
+        :type lokasi: str atau PathLike
+        """
+        self.lokasi = os.fspath(lokasi)
+        with open(self.lokasi, "rb") as berkas:
+            self._mm = mmap.mmap(berkas.fileno(), 0, access=mmap.ACCESS_READ)
+        kepala = _KEPALA.unpack_from(self._mm)
+        if kepala[:2] != (PENANDA, VERSI):
+            self._mm.close()
+            raise ValueError(f"{self.lokasi} bukan berkas arsip KBBI.")
+        _, _, self._jumlah, self._ukuran_tabel, self._posisi_tabel = kepala
+
+    def _slot(self, i):
+        return _SLOT.unpack_from(self._mm, self._posisi_tabel + i * _SLOT.size)
+
+    def _cari(self, kueri):
+        kunci = _kunci(kueri)
+        nilai_hash = _hash(kunci)
+        i = nilai_hash & (self._ukuran_tabel - 1)
+        while True:
+            hash_slot, posisi_kunci, panjang_kunci, posisi, panjang = (
+                self._slot(i)
+            )
+            if not panjang:
+                return None
+            if (
+                hash_slot == nilai_hash
+                and self._mm[posisi_kunci : posisi_kunci + panjang_kunci]
+                == kunci
+            ):
+                return posisi, panjang
+            i = (i + 1) & (self._ukuran_tabel - 1)
+
+    def ambil_bita(self, kueri):
+        """Mengambil hasil serialisasi sebuah kueri dalam bentuk JSON.
+
+        :param kueri: Kata kunci pencarian
+        :type kueri: str
+        :returns: JSON (UTF-8) hasil serialisasi atau None jika kueri
+            tidak ada di arsip
+        :rtype: bytes
+        """
+        hasil = self._cari(kueri)
+        if hasil is None:
+            return None
+        posisi, panjang = hasil
+        return self._mm[posisi : posisi + panjang]
+
+    def ambil(self, kueri):
+        """Mengambil hasil serialisasi sebuah kueri.
+
+        :param kueri: Kata kunci pencarian
+        :type kueri: str
+        :returns: Dictionary hasil serialisasi atau None jika kueri tidak
+            ada di arsip
+        :rtype: dict
+        """
+        data = self.ambil_bita(kueri)
+        if data is None:
+            return None
+        return json.loads(data)
+
+    def cari(self, kueri):
+        """Membuat objek KBBI untuk sebuah kueri dari arsip.
+
+        Seperti konstruktor KBBI, galat TidakDitemukan akan dimunculkan jika
+        laman kueri tersebut tidak memiliki entri.
+
+        :param kueri: Kata kunci pencarian
+        :type kueri: str
+        :returns: Objek KBBI untuk kueri yang diberikan
+        :rtype: KBBI
+        """
+        serialisasi = self.ambil(kueri)
+        if serialisasi is None:
+            raise TidakAdaDiTembolok(kueri)
+        kbbi = self.kelas_kbbi.dari_serialisasi(serialisasi, kueri)
+        if not kbbi.entri:
+            raise TidakDitemukan(kbbi.nama, objek=kbbi)
+        return kbbi
+
+    def __contains__(self, kueri):
+        return self._cari(kueri) is not None
+
+    def __iter__(self):
+        for i in range(self._ukuran_tabel):
+            _, posisi_kunci, panjang_kunci, _, panjang = self._slot(i)
+            if panjang:
+                kunci = self._mm[posisi_kunci : posisi_kunci + panjang_kunci]
+                yield kunci.decode("utf-8")
+
+    def __len__(self):
+        return self._jumlah
+
+    def tutup(self):
+        """Menutup berkas arsip."""
+        self._mm.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.tutup()
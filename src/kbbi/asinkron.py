@@ -0,0 +1,282 @@
+"""
+:mod:`kbbi.asinkron` -- Klien asinkron KBBI Python
+==================================================
+
+.. module:: kbbi.asinkron
+   :platform: Unix, Windows, Mac
+   :synopsis: Modul ini mengandung implementasi klien asyncio untuk kbbi.
+.. moduleauthor:: sage <laymonage@gmail.com>
+
+Modul ini membutuhkan paket httpx (``pip install kbbi[asinkron]``).
+"""
+
+import asyncio
+
+import httpx
+
+from .kbbi import (
+    KBBI,
+    AutentikasiKBBI,
+    Galat,
+    HasilPencarian,
+    KukiTidakDitemukan,
+    Laman,
+    TerjadiKesalahan,
+    TidakDitemukan,
+    _ukur_tahap,
+    _ukuran_laman,
+)
+
+
+def buat_klien(batas_koneksi=10):
+    """Membuat klien HTTP asinkron dengan kumpulan koneksi terbatas.
+
+    :param batas_koneksi: Jumlah maksimum koneksi yang dibuka bersamaan
+    :type batas_koneksi: int
+    :returns: Klien HTTP asinkron
+    :rtype: httpx.AsyncClient
+    """
+    return httpx.AsyncClient(
+        follow_redirects=True,
+        limits=httpx.Limits(
+            max_connections=batas_koneksi,
+            max_keepalive_connections=batas_koneksi,
+        ),
+    )
+
+
+class AsyncKBBI(KBBI):
+    """Sebuah laman dalam KBBI daring yang diambil secara asinkron.
+
+    Gunakan AsyncKBBI.cari untuk membuat objek ini.
+    """
+
+    def __init__(self, kueri, auth=None, pembatas=None, coba_ulang=None):
+        self.nama = kueri
+        self.entri = []
+        self.saran_entri = []
+        self._init_pembatas(pembatas)
+        self._coba_ulang = coba_ulang
+        self._init_lokasi()
+
+    @classmethod
+    async def cari(
+        cls, kueri, auth=None, klien=None, pembatas=None, coba_ulang=None
+    ):
+        """Membuat objek AsyncKBBI baru berdasarkan kueri yang diberikan.
+
+        :param kueri: Kata kunci pencarian
+        :type kueri: str
+        :param auth: objek AsyncAutentikasiKBBI
+        :type auth: AsyncAutentikasiKBBI
+        :param klien: Klien yang digunakan jika auth tidak diberikan
+        :type klien: httpx.AsyncClient
+        :param pembatas: objek PembatasLaju yang digunakan sebelum mengambil
+            laman dari KBBI Daring (selain pembatas yang diatur dengan
+            atur_pembatas_laju)
+        :type pembatas: PembatasLaju
+        :param coba_ulang: objek KebijakanCobaUlang untuk mengulangi
+            pengambilan laman yang gagal sementara
+        :type coba_ulang: KebijakanCobaUlang
+        :returns: Objek AsyncKBBI untuk kueri yang diberikan
+        :rtype: AsyncKBBI
+        """
+        if auth is not None and not isinstance(auth, AsyncAutentikasiKBBI):
+            raise ValueError("'auth' harus berupa objek AsyncAutentikasiKBBI.")
+        kbbi = cls(kueri, auth, pembatas=pembatas, coba_ulang=coba_ulang)
+        klien_baru = None
+        if auth is not None:
+            kbbi.sesi = auth.sesi
+        elif klien is not None:
+            kbbi.sesi = klien
+        else:
+            kbbi.sesi = klien_baru = buat_klien()
+        try:
+            with _ukur_tahap("ambil", kueri) as pengukur:
+                if kbbi._coba_ulang is None:
+                    respons = await kbbi._ambil_respons()
+                else:
+                    respons = await _jalankan_coba_ulang(
+                        kbbi._coba_ulang, kbbi._ambil_respons
+                    )
+                if pengukur is not None:
+                    pengukur.bita = _ukuran_laman(respons)
+        finally:
+            if klien_baru is not None:
+                await klien_baru.aclose()
+        laman = Laman(str(respons.url), respons.text, respons.headers)
+        laman.status_code = respons.status_code
+        kbbi._proses_laman(laman)
+        return kbbi
+
+    async def _ambil_respons(self):
+        if self._pembatas:
+            # PembatasLaju menunggu dengan time.sleep, jalankan di luar
+            # event loop agar pencarian lain tidak ikut tertahan.
+            loop = asyncio.get_event_loop()
+            for pembatas in self._pembatas:
+                await loop.run_in_executor(None, pembatas.ambil)
+        return await self.sesi.get(f"{self.host}/{self.lokasi}")
+
+    def segarkan(self, *args, **kwargs):
+        """Tidak didukung, gunakan AsyncKBBI.cari untuk mengambil ulang."""
+        raise NotImplementedError(
+            "Gunakan AsyncKBBI.cari untuk mengambil ulang laman."
+        )
+
+    @classmethod
+    def segarkan_banyak(cls, *args, **kwargs):
+        """Tidak didukung, gunakan AsyncKBBI.banyak untuk mengambil ulang."""
+        raise NotImplementedError(
+            "Gunakan AsyncKBBI.banyak untuk mengambil ulang laman."
+        )
+
+    @classmethod
+    async def banyak(
+        cls,
+        daftar_kueri,
+        auth=None,
+        batas=8,
+        klien=None,
+        pembatas=None,
+        coba_ulang=None,
+    ):
+        """Mencari banyak kueri secara bersamaan.
+
+        Galat pada sebuah kueri tidak menghentikan pencarian kueri lainnya,
+        tetapi disimpan dalam hasil pencarian kueri tersebut.
+
+        :param daftar_kueri: Kumpulan kata kunci pencarian
+        :type daftar_kueri: iterable
+        :param auth: objek AsyncAutentikasiKBBI
+        :type auth: AsyncAutentikasiKBBI
+        :param batas: Jumlah maksimum pencarian yang berjalan bersamaan
+        :type batas: int
+        :param klien: Klien yang digunakan jika auth tidak diberikan
+        :type klien: httpx.AsyncClient
+        :param pembatas: objek PembatasLaju, lihat AsyncKBBI.cari
+        :type pembatas: PembatasLaju
+        :param coba_ulang: objek KebijakanCobaUlang, lihat AsyncKBBI.cari
+        :type coba_ulang: KebijakanCobaUlang
+        :returns: Daftar HasilPencarian sesuai urutan daftar_kueri
+        :rtype: list
+        """
+        semafor = asyncio.Semaphore(batas)
+        klien_baru = None
+        if auth is None and klien is None:
+            klien = klien_baru = buat_klien(batas)
+
+        async def cari(kueri):
+            async with semafor:
+                try:
+                    objek = await cls.cari(
+                        kueri, auth, klien, pembatas, coba_ulang
+                    )
+                except TidakDitemukan as e:
+                    return HasilPencarian(kueri, e.objek, e)
+                except (Galat, httpx.HTTPError) as e:
+                    return HasilPencarian(kueri, None, e)
+                return HasilPencarian(kueri, objek, None)
+
+        try:
+            return await asyncio.gather(*(cari(k) for k in daftar_kueri))
+        finally:
+            if klien_baru is not None:
+                await klien_baru.aclose()
+
+
+def _periksa(respons):
+    if "Beranda/Error" in str(respons.url):
+        raise TerjadiKesalahan()
+    if respons.status_code == 429 or respons.status_code >= 500:
+        respons.raise_for_status()
+
+
+async def _jalankan_coba_ulang(kebijakan, fungsi):
+    # Padanan KebijakanCobaUlang.jalankan untuk coroutine dan galat httpx.
+    kebijakan._cek_sirkuit()
+    percobaan = 0
+    while True:
+        percobaan += 1
+        try:
+            hasil = await fungsi()
+            _periksa(hasil)
+        except (
+            TerjadiKesalahan,
+            httpx.TransportError,
+            httpx.HTTPStatusError,
+        ) as e:
+            jeda = kebijakan._jeda_berikutnya(percobaan, e)
+            if jeda is None:
+                raise
+            await asyncio.sleep(jeda)
+        else:
+            kebijakan._catat(berhasil=True)
+            return hasil
+
+
+class AsyncAutentikasiKBBI(AutentikasiKBBI):
+    """Gunakan fitur pengguna terdaftar secara asinkron.
+
+    Gunakan AsyncAutentikasiKBBI.buat untuk membuat objek ini.
+    """
+
+    def __init__(self, lokasi_kuki=None, batas_koneksi=10):
+        self.sesi = buat_klien(batas_koneksi)
+        self.lokasi_kuki = lokasi_kuki or self.lokasi_kuki
+
+    @classmethod
+    async def buat(
+        cls, posel=None, sandi=None, lokasi_kuki=None, batas_koneksi=10
+    ):
+        """Melakukan autentikasi dengan alamat posel dan sandi yang diberikan.
+
+        Jika posel dan sandi tidak diberikan, autentikasi akan menggunakan kuki
+        yang tersimpan (jika ada).
+
+        :param posel: Alamat posel yang terdaftar di KBBI Daring
+        :type email: str
+        :param sandi: Kata sandi untuk akun dengan alamat posel yang diberikan
+        :type sandi: str
+        :param lokasi_kuki: Lokasi kuki yang akan dimuat/disimpan
+        :type lokasi_kuki: str atau PathLike
+        :param batas_koneksi: Jumlah maksimum koneksi yang dibuka bersamaan
+        :type batas_koneksi: int
+        :returns: Objek AsyncAutentikasiKBBI yang telah terautentikasi
+        :rtype: AsyncAutentikasiKBBI
+        """
+        auth = cls(lokasi_kuki, batas_koneksi)
+        try:
+            if posel is None and sandi is None:
+                try:
+                    auth.ambil_kuki()
+                except FileNotFoundError as e:
+                    raise KukiTidakDitemukan(auth.lokasi_kuki) from e
+            else:
+                token = await auth._ambil_token()
+                await auth._autentikasi(posel, sandi, token)
+        except BaseException:
+            await auth.tutup()
+            raise
+        return auth
+
+    async def _ambil_token(self):
+        laman = await self.sesi.get(f"{self.host}/{self.lokasi}")
+        return self._cari_token(laman.text)
+
+    async def _autentikasi(self, posel, sandi, token):
+        laman = await self.sesi.post(
+            f"{self.host}/{self.lokasi}",
+            data=self._payload(posel, sandi, token),
+        )
+        self._cek_galat_autentikasi(str(laman.url))
+
+    async def tutup(self):
+        """Menutup klien HTTP beserta koneksi-koneksinya."""
+        await self.sesi.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.tutup()
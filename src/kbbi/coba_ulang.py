@@ -0,0 +1,203 @@
+"""
+:mod:`kbbi.coba_ulang` -- Kebijakan coba ulang KBBI Python
+==========================================================
+
+.. module:: kbbi.coba_ulang
+   :platform: Unix, Windows, Mac
+   :synopsis: Modul ini mengandung kebijakan coba ulang dan pemutus sirkuit.
+.. moduleauthor:: sage <laymonage@gmail.com>
+"""
+
+import random
+import threading
+import time
+from datetime import datetime, timezone
+
+from .kbbi import (
+    AkunDibekukan,
+    BatasSehari,
+    SirkuitTerbuka,
+    TerjadiKesalahan,
+    _ModulMalas,
+)
+
+requests = _ModulMalas("requests", globals())
+
+
+class KebijakanCobaUlang:
+    """Kebijakan coba ulang untuk kegagalan sementara saat mengakses KBBI.
+
+    Percobaan diulang dengan jeda eksponensial beserta jitter (atau sesuai
+    header Retry-After jika ada). Kebijakan ini juga berfungsi sebagai
+    pemutus sirkuit: setelah sejumlah kegagalan berturut-turut, permintaan
+    berikutnya langsung gagal dengan SirkuitTerbuka hingga waktu_pulih
+    berlalu, lalu satu percobaan diizinkan untuk menguji pemulihan.
+
+    Galat yang dapat diulang adalah TerjadiKesalahan, kegagalan koneksi,
+    batas waktu, serta respons HTTP 429 dan 5xx. Galat lainnya (misalnya
+    BatasSehari dan AkunDibekukan) langsung dimunculkan kembali.
+    """
+
+    _waktu = staticmethod(time.monotonic)
+    _tidur = staticmethod(time.sleep)
+    _acak = staticmethod(random.random)
+
+    def __init__(
+        self,
+        maks_coba=3,
+        jeda_awal=0.5,
+        jeda_maks=30,
+        faktor=2,
+        ambang_pemutus=5,
+        waktu_pulih=60,
+    ):
+        """Membuat kebijakan coba ulang baru.
+
+        :param maks_coba: Jumlah maksimum percobaan (termasuk yang pertama)
+        :type maks_coba: int
+        :param jeda_awal: Jeda maksimum sebelum percobaan kedua (dalam detik)
+        :type jeda_awal: int atau float
+        :param jeda_maks: Jeda maksimum antarpercobaan (dalam detik), termasuk
+            jeda dari Retry-After
+        :type jeda_maks: int atau float
+        :param faktor: Faktor pengali jeda untuk setiap percobaan berikutnya
+        :type faktor: int atau float
+        :param ambang_pemutus: Jumlah kegagalan berturut-turut yang membuka
+            sirkuit, None untuk menonaktifkan pemutus sirkuit
+        :type ambang_pemutus: int
+        :param waktu_pulih: Lama sirkuit terbuka (dalam detik)
+        :type waktu_pulih: int atau float
+        """
+        self.maks_coba = maks_coba
+        self.jeda_awal = jeda_awal
+        self.jeda_maks = jeda_maks
+        self.faktor = faktor
+        self.ambang_pemutus = ambang_pemutus
+        self.waktu_pulih = waktu_pulih
+        self.gagal_berturut = 0
+        self._dibuka = None
+        self._kunci = threading.Lock()
+
+    @staticmethod
+    def dapat_diulang(galat):
+        """Menentukan apakah percobaan yang gagal dengan galat ini dapat
+        diulang.
+
+        :param galat: Galat yang terjadi
+        :type galat: Exception
+        :rtype: bool
+        """
+        if isinstance(galat, (BatasSehari, AkunDibekukan)):
+            return False
+        if isinstance(galat, TerjadiKesalahan):
+            return True
+        if isinstance(galat, requests.HTTPError):
+            status = galat.response.status_code
+            return status == 429 or status >= 500
+        return isinstance(galat, (requests.ConnectionError, requests.Timeout))
+
+    @staticmethod
+    def periksa(respons):
+        """Memunculkan galat yang dapat diulang untuk respons yang gagal.
+
+        :param respons: Hasil pemanggilan yang akan diperiksa
+        """
+        url = getattr(respons, "url", None)
+        if isinstance(url, str) and "Beranda/Error" in url:
+            raise TerjadiKesalahan()
+        status = getattr(respons, "status_code", None)
+        if status is not None and (status == 429 or status >= 500):
+            raise requests.HTTPError(
+                f"{status} Server Error untuk url: {url}", response=respons
+            )
+
+    def _jeda(self, percobaan, galat):
+        jeda = self._acak() * min(
+            self.jeda_maks, self.jeda_awal * self.faktor ** (percobaan - 1)
+        )
+        respons = getattr(galat, "response", None)
+        if respons is not None:
+            retry_after = _baca_retry_after(respons.headers.get("Retry-After"))
+            if retry_after is not None:
+                jeda = max(jeda, retry_after)
+        return jeda
+
+    def _jeda_berikutnya(self, percobaan, galat):
+        # Mencatat kegagalan dan mengembalikan jeda sebelum percobaan
+        # berikutnya, atau None jika galat harus dimunculkan kembali.
+        self._catat(berhasil=False)
+        if percobaan >= self.maks_coba or self.sirkuit_terbuka:
+            return None
+        jeda = self._jeda(percobaan, galat)
+        if jeda > self.jeda_maks:
+            return None
+        return jeda
+
+    def _cek_sirkuit(self):
+        with self._kunci:
+            if self._dibuka is None:
+                return
+            if self._waktu() - self._dibuka < self.waktu_pulih:
+                raise SirkuitTerbuka()
+            # Setengah terbuka: izinkan satu percobaan dan tutup kembali
+            # sirkuit untuk permintaan lain hingga percobaan itu selesai.
+            self._dibuka = self._waktu()
+
+    def _catat(self, berhasil):
+        with self._kunci:
+            if berhasil:
+                self.gagal_berturut = 0
+                self._dibuka = None
+                return
+            self.gagal_berturut += 1
+            if (
+                self.ambang_pemutus is not None
+                and self.gagal_berturut >= self.ambang_pemutus
+            ):
+                self._dibuka = self._waktu()
+
+    @property
+    def sirkuit_terbuka(self):
+        """Apakah pemutus sirkuit sedang terbuka."""
+        return self._dibuka is not None
+
+    def jalankan(self, fungsi, *args, **kwargs):
+        """Memanggil fungsi dan mengulanginya jika gagal sementara.
+
+        :param fungsi: Fungsi yang akan dipanggil dengan argumen lainnya
+        :type fungsi: callable
+        :returns: Hasil pemanggilan fungsi
+        """
+        self._cek_sirkuit()
+        percobaan = 0
+        while True:
+            percobaan += 1
+            try:
+                hasil = fungsi(*args, **kwargs)
+                self.periksa(hasil)
+            except Exception as e:
+                if not self.dapat_diulang(e):
+                    raise
+                jeda = self._jeda_berikutnya(percobaan, e)
+                if jeda is None:
+                    raise
+                self._tidur(jeda)
+            else:
+                self._catat(berhasil=True)
+                return hasil
+
+
+def _baca_retry_after(nilai):
+    if not nilai:
+        return None
+    try:
+        return max(0, float(nilai))
+    except ValueError:
+        pass
+    try:
+        from email.utils import parsedate_to_datetime
+
+        waktu = parsedate_to_datetime(nilai)
+    except (TypeError, ValueError):
+        return None
+    return max(0, (waktu - datetime.now(timezone.utc)).total_seconds())
@@ -8,56 +8,344 @@
 .. moduleauthor:: sage <laymonage@gmail.com>
 """
 
-import argparse
+import atexit
+import codecs
+import copy
+import io
 import json
+import os
 import re
 import sys
+import threading
+import time
+from collections import Counter, deque, namedtuple
+from contextlib import contextmanager
+from functools import lru_cache
+from importlib import import_module
+from importlib.util import find_spec
+from itertools import islice
 from pathlib import Path
-from urllib.parse import quote
+from urllib.parse import quote, unquote
 
-import requests
 from appdirs import AppDirs
-from bs4 import BeautifulSoup
+
+__all__ = [
+    "APPDIR",
+    "DATA_DIR",
+    "PENGEKSTRAK",
+    "KBBI",
+    "Entri",
+    "KelasKata",
+    "Makna",
+    "Etimologi",
+    "atur_pengurai",
+    "ambil_pengurai",
+    "ambil_teks_dalam_label",
+    "ekstraksi_aman",
+    "kueri_dari_pranala",
+    "bungkus_label",
+    "PenulisJSON",
+    "HasilPencarian",
+    "Peristiwa",
+    "tambah_pengamat",
+    "hapus_pengamat",
+    "amati",
+    "sesi_bersama",
+    "atur_sesi_bersama",
+    "tutup_sesi_bersama",
+    "Laman",
+    "ambil_laman_alir",
+    "atur_pembatas_laju",
+    "AutentikasiKBBI",
+    "Galat",
+    "TidakDitemukan",
+    "LamanTidakValid",
+    "EntriTidakValid",
+    "TerjadiKesalahan",
+    "BatasSehari",
+    "KuotaHabis",
+    "AkunDibekukan",
+    "SirkuitTerbuka",
+    "TidakAdaDiTembolok",
+    "GagalAutentikasi",
+    "KukiTidakDitemukan",
+    "autentikasi",
+    "main",
+    "init",
+]
+
+
+class _ModulMalas:
+    """Modul yang baru diimpor ketika salah satu atributnya diakses.
+
+    Setelah diimpor, nama global modul ini (dalam ruang_nama, bawaan: modul
+    kbbi.kbbi) diganti dengan modul aslinya sehingga akses berikutnya tidak
+    lagi melalui objek ini. Dengan begitu,
+    "import kbbi" tidak perlu memuat requests dan bs4 yang cukup berat.
+    """
+
+    def __init__(self, nama, ruang_nama=None):
+        self._nama = nama
+        self._ruang_nama = globals() if ruang_nama is None else ruang_nama
+
+    def __getattr__(self, atribut):
+        modul = import_module(self._nama)
+        self._ruang_nama[self._nama] = modul
+        return getattr(modul, atribut)
+
+    def __repr__(self):
+        return f"<modul malas {self._nama!r}>"
+
+
+requests = _ModulMalas("requests")
+bs4 = _ModulMalas("bs4")
 
 APPDIR = AppDirs("kbbi", "laymonage")
 DATA_DIR = Path(APPDIR.user_data_dir)
-DATA_DIR.mkdir(parents=True, exist_ok=True)
 
 
 class KBBI:
     """Sebuah laman dalam KBBI daring."""
 
     host = "https://kbbi.kemdikbud.go.id"
-
-    def __init__(self, kueri, auth=None):
+    _pengurai = None
+    _malas = False
+    _indeks_saran = None
+    _pembatas = ()
+    _coba_ulang = None
+    _validator = (None, None)
+    _sidik = None
+    _eksekutor_urai = None
+
+    def __init__(
+        self,
+        kueri,
+        auth=None,
+        tembolok=None,
+        sesi=None,
+        pengurai=None,
+        alir=False,
+        malas=False,
+        indeks_saran=None,
+        pembatas=None,
+        coba_ulang=None,
+        eksekutor_urai=None,
+    ):
         """Membuat objek KBBI baru berdasarkan kueri yang diberikan.
 
         :param kueri: Kata kunci pencarian
         :type kueri: str
         :param auth: objek AutentikasiKBBI
         :type auth: AutentikasiKBBI
+        :param tembolok: objek TembolokLaman untuk menyimpan laman yang
+            telah diambil
+        :type tembolok: TembolokLaman
+        :param sesi: Sesi yang digunakan jika auth tidak diberikan
+        :type sesi: requests.Session
+        :param pengurai: Nama pengurai HTML untuk BeautifulSoup, lihat
+            atur_pengurai
+        :type pengurai: str
+        :param alir: Ambil laman secara bertahap dan berhenti mengunduh
+            setelah bagian entri selesai
+        :type alir: bool
+        :param malas: Tunda penguraian makna, etimologi, dan kata terkait
+            setiap entri hingga atribut tersebut pertama kali diakses
+        :type malas: bool
+        :param indeks_saran: objek IndeksSaran untuk mengisi saran_entri
+            jika kueri tidak ditemukan dan KBBI Daring tidak memberikan saran
+        :type indeks_saran: IndeksSaran
+        :param pembatas: objek PembatasLaju yang digunakan sebelum mengambil
+            laman dari KBBI Daring (selain pembatas yang diatur dengan
+            atur_pembatas_laju)
+        :type pembatas: PembatasLaju
+        :param coba_ulang: objek KebijakanCobaUlang untuk mengulangi
+            pengambilan laman yang gagal sementara
+        :type coba_ulang: KebijakanCobaUlang
+        :param eksekutor_urai: Eksekutor (misalnya ProcessPoolExecutor) yang
+            digunakan untuk menguraikan entri sehingga penguraian tidak
+            tertahan oleh GIL; entri selalu diurai tanpa penundaan (malas)
+        :type eksekutor_urai: concurrent.futures.Executor
         """
         self.nama = kueri
         self.entri = []
         self.saran_entri = []
+        self._pengurai = pengurai
+        self._malas = malas
+        self._indeks_saran = indeks_saran
+        self._init_pembatas(pembatas)
+        self._coba_ulang = coba_ulang
+        self._eksekutor_urai = eksekutor_urai
         self._init_lokasi()
-        self._init_sesi(auth)
-        laman = self.sesi.get(f"{self.host}/{self.lokasi}")
-        self._cek_autentikasi(laman)
-        self._cek_galat(laman)
-        self._init_entri(laman)
+        self._init_sesi(auth, sesi)
+        with _ukur_tahap("ambil", self.nama) as pengukur:
+            laman = self._ambil_laman(auth is not None, tembolok, alir)
+            if pengukur is not None:
+                pengukur.bita = _ukuran_laman(laman)
+        self._proses_laman(laman)
+
+    @classmethod
+    def banyak(
+        cls,
+        daftar_kueri,
+        auth=None,
+        pekerja=8,
+        berurutan=True,
+        proses=None,
+        **kwargs,
+    ):
+        """Mencari banyak kueri secara bersamaan dengan sejumlah pekerja.
+
+        Semua pencarian menggunakan satu sesi yang sama. Galat pada
+        sebuah kueri tidak menghentikan pencarian kueri lainnya, tetapi
+        disimpan dalam hasil pencarian kueri tersebut. Argumen lainnya akan
+        diteruskan ke konstruktor KBBI.
+
+        Jika proses diberikan, laman diambil oleh utas-utas pekerja dan
+        entri-entrinya diurai oleh sekumpulan proses terpisah. Setiap utas
+        menunggu hingga laman yang diambilnya selesai diurai sebelum
+        mengambil laman berikutnya sehingga paling banyak terdapat sejumlah
+        pekerja laman yang menunggu untuk diurai. Karena itu, gunakan
+        pekerja yang lebih banyak daripada proses agar semua proses tetap
+        sibuk.
+
+        :param daftar_kueri: Kumpulan kata kunci pencarian
+        :type daftar_kueri: iterable
+        :param auth: objek AutentikasiKBBI
+        :type auth: AutentikasiKBBI
+        :param pekerja: Jumlah maksimum pencarian yang berjalan bersamaan
+        :type pekerja: int
+        :param berurutan: Kembalikan hasil sesuai urutan daftar_kueri
+            (jika False, hasil dikembalikan sesuai urutan selesainya)
+        :type berurutan: bool
+        :param proses: Jumlah proses untuk menguraikan laman (0 untuk
+            sejumlah inti CPU); jika None, laman diurai oleh utas pekerja
+        :type proses: int
+        :returns: Generator HasilPencarian untuk setiap kueri
+        :rtype: generator
+        """
+        sesi_baru = None
+        if auth is None and kwargs.get("sesi") is None:
+            sesi_baru = kwargs["sesi"] = _buat_sesi(pekerja)
+        eksekutor_urai = None
+        if proses is not None:
+            from concurrent.futures import ProcessPoolExecutor
+
+            eksekutor_urai = ProcessPoolExecutor(proses or None)
+            kwargs["eksekutor_urai"] = eksekutor_urai
 
-    def _init_sesi(self, auth):
+        def cari(kueri):
+            try:
+                return HasilPencarian(kueri, cls(kueri, auth, **kwargs), None)
+            except TidakDitemukan as e:
+                return HasilPencarian(kueri, e.objek, e)
+            except (Galat, requests.RequestException) as e:
+                return HasilPencarian(kueri, None, e)
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        try:
+            with ThreadPoolExecutor(pekerja) as eksekutor:
+                for hasil in _petakan(
+                    eksekutor, cari, daftar_kueri, pekerja * 2, berurutan
+                ):
+                    if eksekutor_urai is not None and hasil.objek is not None:
+                        # Eksekutor ini dihentikan setelah pencarian selesai.
+                        hasil.objek._eksekutor_urai = None
+                    yield hasil
+        finally:
+            if eksekutor_urai is not None:
+                eksekutor_urai.shutdown()
+            if sesi_baru is not None:
+                sesi_baru.close()
+
+    def _init_sesi(self, auth, sesi=None):
         if auth is not None:
             if not isinstance(auth, AutentikasiKBBI):
                 raise ValueError("'auth' harus berupa objek AutentikasiKBBI.")
             self.sesi = auth.sesi
+        elif sesi is not None:
+            self.sesi = sesi
         else:
-            self.sesi = requests.Session()
+            self.sesi = sesi_bersama()
+
+    def _punya_sesi(self):
+        # Objek dari dari_html/dari_serialisasi belum memiliki sesi.
+        return getattr(self, "sesi", None) is not None
+
+    def _ambil_laman(self, terautentikasi, tembolok=None, alir=False):
+        basi = None
+        if tembolok is not None:
+            laman = tembolok.ambil(self.lokasi, terautentikasi, basi=True)
+            if laman is not None and not laman.basi:
+                return laman
+            if tembolok.luring:
+                raise TidakAdaDiTembolok(self.nama)
+            basi = laman
+        validator = (None, None)
+        if basi is not None:
+            validator = _validator_laman(basi)
+        laman = self._ambil_laman_bersyarat(validator, alir)
+        if basi is not None and _tidak_diubah(laman):
+            tembolok.perbarui(self.lokasi, terautentikasi)
+            basi.basi = False
+            return basi
+        if tembolok is not None:
+            tembolok.simpan(self.lokasi, terautentikasi, laman)
+        return laman
+
+    def _ambil_laman_bersyarat(self, validator, alir=False):
+        # Laman hanya dikirim ulang oleh server jika telah berubah sejak
+        # laman dengan validator (ETag, Last-Modified) tersebut diambil.
+        etag, diubah = validator
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if diubah:
+            headers["If-Modified-Since"] = diubah
+        if self._coba_ulang is None:
+            return self._ambil_laman_daring(alir, headers)
+        return self._coba_ulang.jalankan(
+            self._ambil_laman_daring, alir, headers
+        )
+
+    def _ambil_laman_daring(self, alir=False, headers=None):
+        for pembatas in self._pembatas:
+            pembatas.ambil()
+        url = f"{self.host}/{self.lokasi}"
+        if alir:
+            return ambil_laman_alir(self.sesi, url, headers=headers)
+        if headers:
+            return self.sesi.get(url, headers=headers)
+        return self.sesi.get(url)
+
+    def _proses_laman(self, laman):
+        self._validator = _validator_laman(laman)
+        # Sidik hanya dibutuhkan segarkan jika laman tidak memiliki
+        # validator untuk permintaan bersyarat.
+        self._sidik = None
+        if self._validator == (None, None):
+            self._sidik = _sidik_entri(laman.text)
+        if not _pengamat:
+            self._cek_autentikasi(laman)
+            self._cek_galat(laman)
+            self._init_entri(laman)
+            return
+        bita = _ukuran_laman(laman)
+        with _ukur_tahap("cek_autentikasi", self.nama, bita):
+            self._cek_autentikasi(laman)
+        with _ukur_tahap("cek_galat", self.nama, bita):
+            self._cek_galat(laman)
+        with _ukur_tahap("init_entri", self.nama, bita):
+            self._init_entri(laman)
 
     def _cek_autentikasi(self, laman):
         self.terautentikasi = "loginLink" not in laman.text
 
+    def _init_pembatas(self, pembatas):
+        self._pembatas = tuple(
+            p for p in (_pembatas_laju, pembatas) if p is not None
+        )
+
     def _init_lokasi(self):
         kasus_khusus = [
             "." in self.nama,
@@ -74,36 +362,179 @@ class KBBI:
         if "Beranda/Error" in laman.url:
             raise TerjadiKesalahan()
         if "Beranda/BatasSehari" in laman.url:
+            for pembatas in self._pembatas:
+                pembatas.tandai_habis()
             raise BatasSehari()
         if "Account/Banned" in laman.url:
             raise AkunDibekukan()
         if "Entri tidak ditemukan." in laman.text:
             self._init_saran(laman)
+            if not self.saran_entri and self._indeks_saran is not None:
+                self.saran_entri = self._indeks_saran.saran(self.nama)
             raise TidakDitemukan(self.nama, objek=self)
+        if not _status_berhasil(laman):
+            raise LamanTidakValid(self.nama, laman.status_code)
 
     def _init_saran(self, laman):
         if "Berikut beberapa saran entri lain yang mirip." not in laman.text:
             return
-        sup = BeautifulSoup(laman.text, "html.parser")
+        sup = bs4.BeautifulSoup(
+            laman.text, _pengurai_sup(ambil_pengurai(self._pengurai))
+        )
         self.saran_entri = [
             saran.text.strip() for saran in sup.find_all(class_="col-md-3")
         ]
 
     def _init_entri(self, laman):
-        sup = BeautifulSoup(laman.text, "html.parser")
-        estr = ""
-        label = sup.find("hr").next_sibling
+        pengurai = ambil_pengurai(self._pengurai)
+        if self._eksekutor_urai is not None:
+            tugas = self._eksekutor_urai.submit(
+                _urai_entri,
+                laman.text,
+                self.nama,
+                self.terautentikasi,
+                pengurai,
+            )
+            self.entri.extend(tugas.result())
+            return
+        if pengurai == PENGEKSTRAK and not self.terautentikasi:
+            from .pengekstrak import ekstrak_entri
+
+            entri = ekstrak_entri(laman.text, self.nama)
+            if not entri:
+                raise LamanTidakValid(self.nama)
+            self.entri.extend(entri)
+            return
+        sup = bs4.BeautifulSoup(laman.text, _pengurai_sup(pengurai))
+        elabel = []
+        label = sup.find("hr")
+        if label is None:
+            raise LamanTidakValid(self.nama)
+        label = label.next_sibling
+        ada_judul = False
         while not (label.name == "hr" and label.get("style") is None):
             if label.name == "h2":
                 if label.get("style") == "color:gray":  # Lampiran
                     label = label.next_sibling
                     continue
-                if estr:
-                    self.entri.append(Entri(estr, self.terautentikasi))
-                    estr = ""
-            estr += str(label).strip()
+                ada_judul = True
+                if elabel:
+                    self.entri.append(self._buat_entri(elabel))
+                    elabel = []
+            if not _teks_kosong(label):
+                elabel.append(label)
             label = label.next_sibling
-        self.entri.append(Entri(estr, self.terautentikasi))
+            if label is None:
+                raise LamanTidakValid(self.nama)
+        if not ada_judul:
+            raise LamanTidakValid(self.nama)
+        self.entri.append(self._buat_entri(elabel))
+
+    def _buat_entri(self, elabel):
+        with _ukur_tahap("entri", self.nama):
+            return Entri(
+                bungkus_label(elabel), self.terautentikasi, malas=self._malas
+            )
+
+    def segarkan(self, auth=None, tembolok=None, sesi=None):
+        """Memperbarui objek ini dengan laman terbaru dari KBBI Daring.
+
+        Laman diminta secara bersyarat (If-None-Match/If-Modified-Since)
+        jika laman sebelumnya memiliki ETag/Last-Modified. Jika server
+        tidak mengirimkan validator tersebut, sidik (hash) bagian entri
+        laman dibandingkan dengan laman sebelumnya. Entri yang telah diurai
+        hanya diurai ulang jika laman berubah.
+
+        :param auth: objek AutentikasiKBBI
+        :type auth: AutentikasiKBBI
+        :param tembolok: objek TembolokLaman untuk menyimpan laman terbaru
+        :type tembolok: TembolokLaman
+        :param sesi: Sesi yang digunakan jika auth tidak diberikan (bawaan:
+            sesi objek ini)
+        :type sesi: requests.Session
+        :returns: "direvalidasi" jika server menyatakan laman tidak berubah,
+            "tidak_berubah" jika bagian entri laman sama dengan sebelumnya,
+            atau "diurai" jika laman diurai ulang (termasuk jika entri
+            tidak lagi ditemukan)
+        :rtype: str
+        """
+        if auth is None and sesi is None and self._punya_sesi():
+            # Sesi (dan status autentikasi) objek ini dipakai kembali agar
+            # objek yang terautentikasi tidak beralih ke sesi anonim.
+            terautentikasi = self.terautentikasi
+        else:
+            terautentikasi = auth is not None
+            self._init_sesi(auth, sesi)
+        with _ukur_tahap("ambil", self.nama) as pengukur:
+            laman = self._ambil_laman_bersyarat(self._validator)
+            if pengukur is not None:
+                pengukur.bita = _ukuran_laman(laman)
+        if _tidak_diubah(laman):
+            if tembolok is not None:
+                tembolok.perbarui(self.lokasi, terautentikasi)
+            return "direvalidasi"
+        if tembolok is not None:
+            tembolok.simpan(self.lokasi, terautentikasi, laman)
+        if _laman_galat(laman.url):
+            self._cek_galat(laman)
+        if self._sidik is not None and _sidik_entri(laman.text) == self._sidik:
+            self._validator = _validator_laman(laman)
+            return "tidak_berubah"
+        # Laman diurai ke salinan objek ini agar entri lama tetap utuh jika
+        # penguraian gagal.
+        baru = copy.copy(self)
+        baru.entri = []
+        baru.saran_entri = []
+        try:
+            baru._proses_laman(laman)
+        except TidakDitemukan:
+            pass
+        vars(self).update(vars(baru))
+        return "diurai"
+
+    @classmethod
+    def segarkan_banyak(cls, daftar_objek, auth=None, pekerja=8, **kwargs):
+        """Menyegarkan banyak objek KBBI secara bersamaan.
+
+        Argumen lainnya akan diteruskan ke KBBI.segarkan. Jika auth dan sesi
+        tidak diberikan, setiap objek memakai sesinya sendiri; sesi baru
+        hanya digunakan untuk objek yang belum memiliki sesi.
+
+        :param daftar_objek: Kumpulan objek KBBI yang akan disegarkan
+        :type daftar_objek: iterable
+        :param auth: objek AutentikasiKBBI
+        :type auth: AutentikasiKBBI
+        :param pekerja: Jumlah maksimum penyegaran yang berjalan bersamaan
+        :type pekerja: int
+        :returns: Jumlah laman untuk setiap hasil KBBI.segarkan, serta
+            "galat" untuk laman yang gagal disegarkan
+        :rtype: collections.Counter
+        """
+        sesi_baru = None
+        if auth is None and kwargs.get("sesi") is None:
+            sesi_baru = _buat_sesi(pekerja)
+
+        def segarkan(objek):
+            argumen = kwargs
+            if sesi_baru is not None and not objek._punya_sesi():
+                argumen = {**kwargs, "sesi": sesi_baru}
+            try:
+                return objek.segarkan(auth, **argumen)
+            except (Galat, requests.RequestException):
+                return "galat"
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        try:
+            with ThreadPoolExecutor(pekerja) as eksekutor:
+                return Counter(
+                    _petakan(
+                        eksekutor, segarkan, daftar_objek, pekerja * 2, False
+                    )
+                )
+        finally:
+            if sesi_baru is not None:
+                sesi_baru.close()
 
     def serialisasi(self, fitur_pengguna=True):
         """Mengembalikan hasil serialisasi objek KBBI ini.
@@ -111,18 +542,92 @@ class KBBI:
         :returns: Dictionary hasil serialisasi
         :rtype: dict
         """
-        kbbi = {
-            "pranala": f"{self.host}/{self.lokasi}",
-            "entri": [
-                entri.serialisasi(fitur_pengguna) for entri in self.entri
-            ],
-        }
-        if self.terautentikasi and fitur_pengguna and not self.entri:
-            kbbi["saran_entri"] = self.saran_entri
+        with _ukur_tahap("serialisasi", self.nama):
+            kbbi = {
+                "pranala": f"{self.host}/{self.lokasi}",
+                "entri": [
+                    entri.serialisasi(fitur_pengguna) for entri in self.entri
+                ],
+            }
+            if fitur_pengguna and not self.entri:
+                if self.terautentikasi or self.saran_entri:
+                    kbbi["saran_entri"] = self.saran_entri
+        return kbbi
+
+    @classmethod
+    def dari_serialisasi(cls, serialisasi, kueri=None):
+        """Membuat objek KBBI dari hasil serialisasi tanpa mengakses jaringan.
+
+        :param serialisasi: Dictionary hasil KBBI.serialisasi
+        :type serialisasi: dict
+        :param kueri: Kata kunci pencarian (jika tidak diberikan, kueri
+            diambil dari pranala)
+        :type kueri: str
+        :returns: Objek KBBI yang serialisasinya sama dengan serialisasi
+        :rtype: KBBI
+        """
+        kbbi = cls.__new__(cls)
+        kbbi.lokasi = serialisasi["pranala"].split("/", 3)[3]
+        kbbi.nama = kueri or kueri_dari_pranala(serialisasi["pranala"])
+        kbbi.entri = [Entri.dari_serialisasi(e) for e in serialisasi["entri"]]
+        kbbi.saran_entri = serialisasi.get("saran_entri", [])
+        # Saran entri juga dapat berasal dari IndeksSaran tanpa autentikasi,
+        # jadi hanya daftar saran kosong (yang hanya diserialisasi untuk
+        # objek terautentikasi) dan etimologi entri yang menandakannya.
+        kbbi.terautentikasi = serialisasi.get("saran_entri") == [] or any(
+            entri.terautentikasi for entri in kbbi.entri
+        )
+        return kbbi
+
+    @classmethod
+    def dari_html(
+        cls,
+        html,
+        kueri,
+        url=None,
+        pengurai=None,
+        malas=False,
+        indeks_saran=None,
+    ):
+        """Membuat objek KBBI dari HTML laman tanpa mengakses jaringan.
+
+        Galat yang sama dengan konstruktor KBBI akan dimunculkan jika laman
+        tersebut merupakan laman galat atau tidak memiliki entri.
+
+        :param html: HTML laman KBBI daring untuk kueri tersebut
+        :type html: str
+        :param kueri: Kata kunci pencarian
+        :type kueri: str
+        :param url: URL laman tersebut (bawaan: URL laman kueri)
+        :type url: str
+        :param pengurai: Nama pengurai HTML untuk BeautifulSoup, lihat
+            atur_pengurai
+        :type pengurai: str
+        :param malas: Tunda penguraian makna, etimologi, dan kata terkait
+            setiap entri hingga atribut tersebut pertama kali diakses
+        :type malas: bool
+        :param indeks_saran: objek IndeksSaran untuk mengisi saran_entri
+            jika kueri tidak ditemukan
+        :type indeks_saran: IndeksSaran
+        :returns: Objek KBBI hasil penguraian laman tersebut
+        :rtype: KBBI
+        """
+        kbbi = cls.__new__(cls)
+        kbbi.nama = kueri
+        kbbi.entri = []
+        kbbi.saran_entri = []
+        kbbi._pengurai = pengurai
+        kbbi._malas = malas
+        kbbi._indeks_saran = indeks_saran
+        kbbi._init_lokasi()
+        kbbi.sesi = None
+        if url is None:
+            url = f"{kbbi.host}/{kbbi.lokasi}"
+        kbbi._proses_laman(Laman(url, html))
         return kbbi
 
     def __str__(self, contoh=True, terkait=True, fitur_pengguna=True):
-        if self.terautentikasi and fitur_pengguna and self.saran_entri:
+        if fitur_pengguna and self.saran_entri:
             return (
                 "Berikut beberapa saran entri lain yang mirip.\n"
                 f"{', '.join(self.saran_entri)}"
@@ -139,8 +644,45 @@ class KBBI:
 class Entri:
     """Sebuah entri dalam sebuah laman KBBI daring."""
 
-    def __init__(self, entri_html, terautentikasi=False):
-        entri = BeautifulSoup(entri_html, "html.parser")
+    __slots__ = (
+        "terautentikasi",
+        "nama",
+        "nomor",
+        "kata_dasar",
+        "pelafalan",
+        "bentuk_tidak_baku",
+        "varian",
+        "terkait",
+        "etimologi",
+        "makna",
+        "_entri",
+        "_kunci",
+    )
+    _atribut_malas = frozenset(("terkait", "etimologi", "makna"))
+
+    def __init__(
+        self, entri_html, terautentikasi=False, pengurai=None, malas=False
+    ):
+        """Membuat objek Entri baru dari HTML entri yang diberikan.
+
+        :param entri_html: String HTML atau label (misal hasil
+            bungkus_label) yang berisi sebuah entri
+        :type entri_html: str atau Tag
+        :param terautentikasi: Apakah entri berasal dari laman yang
+            terautentikasi
+        :type terautentikasi: bool
+        :param pengurai: Nama pengurai HTML jika entri_html berupa string
+        :type pengurai: str
+        :param malas: Tunda penguraian makna, etimologi, dan kata terkait
+            hingga atribut tersebut pertama kali diakses
+        :type malas: bool
+        """
+        if isinstance(entri_html, bs4.Tag):
+            entri = entri_html
+        else:
+            entri = bs4.BeautifulSoup(
+                entri_html, _pengurai_sup(ambil_pengurai(pengurai))
+            )
         judul = entri.find("h2")
         self.terautentikasi = terautentikasi
         self._init_nama(judul)
@@ -148,6 +690,59 @@ class Entri:
         self._init_kata_dasar(judul)
         self._init_pelafalan(judul)
         self._init_varian(judul)
+        if malas:
+            self._entri = entri
+            self._kunci = threading.Lock()
+        else:
+            self._entri = None
+            self._kunci = None
+            self._init_isi(entri)
+
+    def __getattr__(self, nama):
+        # Hanya dipanggil jika atribut belum ada, yaitu saat entri malas
+        # belum diurai seluruhnya.
+        if nama in self._atribut_malas:
+            kunci = self._kunci
+            if kunci is not None:
+                with kunci:
+                    self._urai_malas()
+            try:
+                return object.__getattribute__(self, nama)
+            except AttributeError:
+                pass
+        raise AttributeError(
+            f"'{type(self).__name__}' object has no attribute '{nama}'"
+        )
+
+    def _urai_malas(self):
+        if self._entri is None:
+            return
+        try:
+            self._init_isi(self._entri)
+        except Exception as e:
+            # Galat lain (termasuk AttributeError) tidak boleh dianggap
+            # sebagai atribut yang tidak ada oleh __getattr__.
+            raise EntriTidakValid(self.nama) from e
+        self._entri = self._kunci = None
+
+    def __getstate__(self):
+        # Kunci tidak dapat di-pickle dan dibuat ulang oleh __setstate__.
+        keadaan = {}
+        for atribut in self.__slots__:
+            try:
+                keadaan[atribut] = object.__getattribute__(self, atribut)
+            except AttributeError:
+                pass
+        keadaan["_kunci"] = None
+        return None, keadaan
+
+    def __setstate__(self, keadaan):
+        for atribut, nilai in keadaan[1].items():
+            object.__setattr__(self, atribut, nilai)
+        if self._entri is not None:
+            self._kunci = threading.Lock()
+
+    def _init_isi(self, entri):
         self._init_terkait(entri)
         self._init_etimologi(entri)
         self._init_makna(entri)
@@ -201,18 +796,22 @@ class Entri:
             self.varian = varian.text[len("varian: ") :].strip().split(", ")
 
     def _init_etimologi(self, entri):
-        self.etimologi = None
+        etimologi = self._label_etimologi(entri)
+        self.etimologi = None if etimologi is None else Etimologi(etimologi)
+
+    def _label_etimologi(self, entri):
         if not self.terautentikasi:
-            return
+            return None
         etimologi = entri.find(text="Etimologi:")
         if etimologi is None:
-            return
+            return None
         etimologi = etimologi.parent.next_sibling
-        etistr = ""
+        etilabel = []
         while etimologi.name != "br":
-            etistr += str(etimologi).strip()
+            if not _teks_kosong(etimologi):
+                etilabel.append(etimologi)
             etimologi = etimologi.next_sibling
-        self.etimologi = Etimologi(etistr)
+        return bungkus_label(etilabel, "[", "]")
 
     def _init_terkait(self, entri):
         if not self.terautentikasi:
@@ -234,6 +833,9 @@ class Entri:
                     self.terkait[jenis] = [k.text for k in kumpulan if k]
 
     def _init_makna(self, entri):
+        self.makna = [Makna(m) for m in self._label_makna(entri)]
+
+    def _label_makna(self, entri):
         prakategorial = entri.find(color="darkgreen")
         if prakategorial:
             makna = [prakategorial]
@@ -246,7 +848,7 @@ class Entri:
             terkait = sum([bool(t) for t in self.terkait.values()])
             if terkait:
                 makna = makna[:-terkait]
-        self.makna = [Makna(m) for m in makna]
+        return makna
 
     def serialisasi(self, fitur_pengguna=True):
         entri = {
@@ -266,6 +868,43 @@ class Entri:
             entri.update(self.terkait)
         return entri
 
+    @classmethod
+    def dari_serialisasi(cls, serialisasi):
+        """Membuat objek Entri dari hasil Entri.serialisasi.
+
+        :param serialisasi: Dictionary hasil Entri.serialisasi
+        :type serialisasi: dict
+        :returns: Objek Entri yang serialisasinya sama dengan serialisasi
+        :rtype: Entri
+        """
+        entri = cls.__new__(cls)
+        entri._entri = entri._kunci = None
+        entri.terautentikasi = "etimologi" in serialisasi
+        entri.nama = serialisasi["nama"]
+        entri.nomor = serialisasi["nomor"]
+        entri.kata_dasar = serialisasi["kata_dasar"]
+        entri.pelafalan = serialisasi["pelafalan"]
+        entri.bentuk_tidak_baku = serialisasi["bentuk_tidak_baku"]
+        entri.varian = serialisasi["varian"]
+        entri.makna = [Makna.dari_serialisasi(m) for m in serialisasi["makna"]]
+        entri.etimologi = None
+        entri.terkait = None
+        if entri.terautentikasi:
+            if serialisasi["etimologi"] is not None:
+                entri.etimologi = Etimologi.dari_serialisasi(
+                    serialisasi["etimologi"]
+                )
+            entri.terkait = {
+                jenis: serialisasi[jenis]
+                for jenis in (
+                    "kata_turunan",
+                    "gabungan_kata",
+                    "peribahasa",
+                    "idiom",
+                )
+            }
+        return entri
+
     def _makna(self, contoh=True):
         if len(self.makna) > 1:
             return "\n".join(
@@ -322,9 +961,60 @@ class Entri:
         return f"<Entri: {self._nama()}>"
 
 
+class KelasKata(dict):
+    """Sebuah kelas kata (kode, nama, dan deskripsi) dalam sebuah makna.
+
+    Kelas kata yang sama digunakan bersama oleh semua makna sehingga objek
+    ini tidak dapat diubah. Gunakan KelasKata.buat untuk membuat objek ini.
+    """
+
+    __slots__ = ()
+    _semua = {}
+
+    @classmethod
+    def buat(cls, kode, nama, deskripsi):
+        """Mengembalikan objek KelasKata untuk nilai-nilai yang diberikan.
+
+        :param kode: Kode kelas kata, misalnya "n"
+        :type kode: str
+        :param nama: Nama kelas kata, misalnya "Nomina"
+        :type nama: str
+        :param deskripsi: Deskripsi kelas kata, misalnya "kata benda"
+        :type deskripsi: str
+        :returns: Objek KelasKata yang digunakan bersama
+        :rtype: KelasKata
+        """
+        kunci = (kode, nama, deskripsi)
+        kelas = cls._semua.get(kunci)
+        if kelas is None:
+            kelas = cls._semua.setdefault(
+                kunci,
+                cls(
+                    kode=sys.intern(kode),
+                    nama=sys.intern(nama),
+                    deskripsi=sys.intern(deskripsi),
+                ),
+            )
+        return kelas
+
+    def _tidak_dapat_diubah(self, *args, **kwargs):
+        raise TypeError("KelasKata tidak dapat diubah.")
+
+    __setitem__ = __delitem__ = __ior__ = _tidak_dapat_diubah
+    clear = pop = popitem = setdefault = update = _tidak_dapat_diubah
+
+    def __reduce__(self):
+        return (
+            type(self).buat,
+            (self["kode"], self["nama"], self["deskripsi"]),
+        )
+
+
 class Makna:
     """Sebuah makna dalam sebuah entri KBBI daring."""
 
+    __slots__ = ("submakna", "kelas", "info", "contoh")
+
     def __init__(self, makna_label):
         self._init_submakna(makna_label)
         self._init_kelas(makna_label)
@@ -376,15 +1066,13 @@ class Makna:
             pisah = k["title"].strip().split(": ")
             nama = pisah[0].strip()
             deskripsi = pisah[1].strip() if len(pisah) > 1 else ""
-            self.kelas.append(
-                {"kode": kode, "nama": nama, "deskripsi": deskripsi}
-            )
+            self.kelas.append(KelasKata.buat(kode, nama, deskripsi))
 
         self.info = ""
         if info:
             info = info.text.strip()
             if not any(info == k["kode"] for k in self.kelas):
-                self.info = info
+                self.info = sys.intern(info)
 
     def _init_contoh(self, makna_label):
         indeks = makna_label.text.find(": ")
@@ -396,12 +1084,32 @@ class Makna:
 
     def serialisasi(self):
         return {
-            "kelas": self.kelas,
+            # KelasKata digunakan bersama, jadi salinannya yang dikembalikan.
+            "kelas": [dict(k) for k in self.kelas],
             "submakna": self.submakna,
             "info": self.info,
             "contoh": self.contoh,
         }
 
+    @classmethod
+    def dari_serialisasi(cls, serialisasi):
+        """Membuat objek Makna dari hasil Makna.serialisasi.
+
+        :param serialisasi: Dictionary hasil Makna.serialisasi
+        :type serialisasi: dict
+        :returns: Objek Makna yang serialisasinya sama dengan serialisasi
+        :rtype: Makna
+        """
+        makna = cls.__new__(cls)
+        makna.kelas = [
+            KelasKata.buat(k["kode"], k["nama"], k["deskripsi"])
+            for k in serialisasi["kelas"]
+        ]
+        makna.submakna = serialisasi["submakna"]
+        makna.info = sys.intern(serialisasi["info"])
+        makna.contoh = serialisasi["contoh"]
+        return makna
+
     def _kelas(self):
         return " ".join(f"({k['kode']})" for k in self.kelas)
 
@@ -425,9 +1133,25 @@ class Makna:
 class Etimologi:
     """Sebuah etimologi dalam sebuah entri KBBI daring."""
 
-    def __init__(self, etimologi_html):
-        etimologi_html = etimologi_html.lstrip("[").rstrip("]")
-        etimologi = BeautifulSoup(etimologi_html, "html.parser")
+    __slots__ = ("bahasa", "kelas", "asal_kata", "pelafalan", "arti")
+
+    def __init__(self, etimologi_html, pengurai=None):
+        """Membuat objek Etimologi baru dari HTML etimologi yang diberikan.
+
+        :param etimologi_html: String HTML atau label (misal hasil
+            bungkus_label) yang berisi etimologi tanpa tanda kurung siku
+            di tepinya
+        :type etimologi_html: str atau Tag
+        :param pengurai: Nama pengurai HTML jika etimologi_html berupa string
+        :type pengurai: str
+        """
+        if isinstance(etimologi_html, bs4.Tag):
+            etimologi = etimologi_html
+        else:
+            etimologi_html = etimologi_html.lstrip("[").rstrip("]")
+            etimologi = bs4.BeautifulSoup(
+                etimologi_html, _pengurai_sup(ambil_pengurai(pengurai))
+            )
         self._init_bahasa(etimologi)
         self._init_kelas(etimologi)
         self._init_asal_kata(etimologi)
@@ -436,11 +1160,11 @@ class Etimologi:
 
     def _init_bahasa(self, etimologi):
         bahasa = etimologi.find("i", style="color:darkred")
-        self.bahasa = ekstraksi_aman(bahasa)
+        self.bahasa = sys.intern(ekstraksi_aman(bahasa))
 
     def _init_kelas(self, etimologi):
         kelas = etimologi.find_all("span", style="color:red")
-        self.kelas = [ekstraksi_aman(k) for k in kelas]
+        self.kelas = [sys.intern(ekstraksi_aman(k)) for k in kelas]
 
     def _init_asal_kata(self, etimologi):
         asal = etimologi.find("b")
@@ -462,6 +1186,23 @@ class Etimologi:
             "arti": self.arti,
         }
 
+    @classmethod
+    def dari_serialisasi(cls, serialisasi):
+        """Membuat objek Etimologi dari hasil Etimologi.serialisasi.
+
+        :param serialisasi: Dictionary hasil Etimologi.serialisasi
+        :type serialisasi: dict
+        :returns: Objek Etimologi yang serialisasinya sama dengan serialisasi
+        :rtype: Etimologi
+        """
+        etimologi = cls.__new__(cls)
+        etimologi.kelas = [sys.intern(k) for k in serialisasi["kelas"]]
+        etimologi.bahasa = sys.intern(serialisasi["bahasa"])
+        etimologi.asal_kata = serialisasi["asal_kata"]
+        etimologi.pelafalan = serialisasi["pelafalan"]
+        etimologi.arti = serialisasi["arti"]
+        return etimologi
+
     def _kelas(self):
         return " ".join(f"({k})" for k in self.kelas)
 
@@ -482,6 +1223,51 @@ class Etimologi:
         return f"<Etimologi: {self.asal_kata}>"
 
 
+_pengurai = None
+PENGEKSTRAK = "pengekstrak"
+
+
+def atur_pengurai(pengurai=None):
+    """Mengatur pengurai HTML bawaan yang digunakan oleh BeautifulSoup.
+
+    :param pengurai: Nama pengurai, misalnya "lxml" atau "html.parser".
+        Jika None, "lxml" akan digunakan apabila terinstal dan
+        "html.parser" apabila tidak. Jika "pengekstrak", entri laman
+        tanpa autentikasi diekstrak langsung dari peristiwa html.parser
+        tanpa membangun pohon BeautifulSoup (lihat kbbi.pengekstrak);
+        laman lainnya tetap diurai dengan pengurai otomatis.
+    :type pengurai: str
+    """
+    global _pengurai
+    _pengurai = pengurai
+
+
+def ambil_pengurai(pengurai=None):
+    """Mengembalikan nama pengurai HTML yang akan digunakan.
+
+    :param pengurai: Nama pengurai yang diinginkan, pengurai bawaan (lihat
+        atur_pengurai) akan digunakan jika None
+    :type pengurai: str
+    :returns: Nama pengurai HTML
+    :rtype: str
+    """
+    return pengurai or _pengurai or _pengurai_otomatis()
+
+
+def _pengurai_sup(pengurai):
+    # Nama pengurai yang dapat diberikan kepada BeautifulSoup.
+    if pengurai == PENGEKSTRAK:
+        return _pengurai_otomatis()
+    return pengurai
+
+
+@lru_cache(maxsize=None)
+def _pengurai_otomatis():
+    if find_spec("lxml") is not None:
+        return "lxml"
+    return "html.parser"
+
+
 def ambil_teks_dalam_label(sup, ambil_italic=False):
     """Mengambil semua teks dalam sup label HTML (tanpa anak-anaknya).
 
@@ -504,14 +1290,542 @@ def ekstraksi_aman(sup):
     return ""
 
 
+def kueri_dari_pranala(pranala):
+    """Mengembalikan kueri pencarian dari pranala sebuah laman KBBI.
+
+    :param pranala: Pranala laman, misalnya hasil KBBI.serialisasi
+    :type pranala: str
+    :returns: Kueri pencarian untuk laman tersebut
+    :rtype: str
+    """
+    lokasi = pranala.split("/", 3)[3]
+    if lokasi.startswith("entri/"):
+        return unquote(lokasi[len("entri/") :])
+    return unquote(lokasi.split("frasa=", 1)[1])
+
+
+def bungkus_label(daftar_label, awal="", akhir=""):
+    """Memindahkan label-label yang bersebelahan ke dalam sebuah label baru.
+
+    Teks di antara label akan di-strip (teks kosong akan dibuang) sehingga
+    hasilnya sama dengan mengurai ulang gabungan str(label).strip() dari
+    setiap label, tetapi tanpa mengurai ulang HTML.
+
+    :param daftar_label: Label-label yang akan dibungkus
+    :type daftar_label: list
+    :param awal: Karakter yang dibuang dari awal teks pertama
+    :type awal: str
+    :param akhir: Karakter yang dibuang dari akhir teks terakhir
+    :type akhir: str
+    :returns: Label baru yang berisi label-label tersebut
+    :rtype: Tag
+    """
+    wadah = bs4.Tag(name="div")
+    terakhir = len(daftar_label) - 1
+    for i, label in enumerate(daftar_label):
+        if type(label) is bs4.NavigableString:
+            teks = label.strip()
+            if i == 0:
+                teks = teks.lstrip(awal)
+            if i == terakhir:
+                teks = teks.rstrip(akhir)
+            if not teks:
+                continue
+            label = bs4.NavigableString(teks)
+        wadah.append(label)
+    return wadah
+
+
+def _teks_kosong(label):
+    return type(label) is bs4.NavigableString and not label.strip()
+
+
+class PenulisJSON:
+    """Penulis hasil serialisasi KBBI secara bertahap ke sebuah berkas.
+
+    Setiap objek diserialisasi dan langsung ditulis sehingga penggunaan
+    memori tidak bergantung pada jumlah objek yang ditulis. Objek ditulis
+    sebagai JSON Lines (satu objek per baris) atau sebagai satu larik JSON
+    yang sama dengan hasil json.dump terhadap daftar semua serialisasinya.
+    """
+
+    def __init__(
+        self,
+        berkas,
+        larik=False,
+        indentasi=None,
+        fitur_pengguna=True,
+        cepat=False,
+    ):
+        """Membuat penulis baru.
+
+        :param berkas: Objek berkas (teks atau biner) tujuan
+        :param larik: Tulis sebagai satu larik JSON alih-alih JSON Lines
+        :type larik: bool
+        :param indentasi: Indentasi JSON, None untuk satu baris per objek
+        :type indentasi: int
+        :param fitur_pengguna: Sertakan fitur pengguna dalam serialisasi
+        :type fitur_pengguna: bool
+        :param cepat: Gunakan orjson jika terpasang dan indentasi None atau
+            2 (hasilnya JSON yang setara, tetapi tanpa spasi setelah
+            pemisah dan tanpa escape karakter non-ASCII)
+        :type cepat: bool
+        """
+        self.berkas = berkas
+        self.larik = larik
+        self.indentasi = indentasi
+        self.fitur_pengguna = fitur_pengguna
+        self.jumlah = 0
+        self._biner = isinstance(berkas, (io.RawIOBase, io.BufferedIOBase))
+        self._jeda = "\n" + " " * (indentasi or 0)
+        self._orjson = None
+        if cepat and indentasi in (None, 2) and find_spec("orjson"):
+            self._orjson = import_module("orjson")
+        self._pengkode = json.JSONEncoder(indent=indentasi)
+
+    def _kodekan(self, data):
+        if self._orjson is not None:
+            opsi = self._orjson.OPT_INDENT_2 if self.indentasi else 0
+            return self._orjson.dumps(data, option=opsi).decode("utf-8")
+        return self._pengkode.encode(data)
+
+    def _tulis(self, teks):
+        if self._biner:
+            teks = teks.encode("utf-8")
+        self.berkas.write(teks)
+
+    def tulis(self, objek):
+        """Menulis sebuah objek.
+
+        :param objek: Objek KBBI, Entri, atau hasil serialisasinya
+        :type objek: KBBI, Entri, atau dict
+        """
+        if not isinstance(objek, dict):
+            objek = objek.serialisasi(self.fitur_pengguna)
+        teks = self._kodekan(objek)
+        if not self.larik:
+            self._tulis(teks + "\n")
+        elif self.indentasi is None:
+            self._tulis(("[" if not self.jumlah else ", ") + teks)
+        else:
+            awal = "[" if not self.jumlah else ","
+            self._tulis(awal + self._jeda + teks.replace("\n", self._jeda))
+        self.jumlah += 1
+
+    def tulis_banyak(self, daftar_objek):
+        """Menulis banyak objek.
+
+        :param daftar_objek: Kumpulan objek yang akan ditulis
+        :type daftar_objek: iterable
+        :returns: Jumlah objek yang ditulis
+        :rtype: int
+        """
+        jumlah = self.jumlah
+        for objek in daftar_objek:
+            self.tulis(objek)
+        return self.jumlah - jumlah
+
+    def tutup(self):
+        """Mengakhiri larik JSON (jika ada) tanpa menutup berkas."""
+        if self.larik:
+            if not self.jumlah:
+                self._tulis("[")
+            elif self.indentasi is not None:
+                self._tulis("\n")
+            self._tulis("]")
+            self.larik = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.tutup()
+
+
+class HasilPencarian(
+    namedtuple("HasilPencarian", ["kueri", "objek", "galat"])
+):
+    """Hasil pencarian sebuah kueri dari KBBI.banyak.
+
+    Atribut objek berisi objek KBBI (juga ketika entri tidak ditemukan)
+    atau None jika terjadi galat lain, sedangkan atribut galat berisi galat
+    yang terjadi (jika ada).
+    """
+
+    __slots__ = ()
+
+
+class Peristiwa(
+    namedtuple("Peristiwa", ["tahap", "kueri", "durasi", "bita", "galat"])
+):
+    """Catatan sebuah tahap pembuatan atau serialisasi objek KBBI.
+
+    Tahap yang dicatat adalah "ambil" (pengambilan laman), "cek_autentikasi",
+    "cek_galat", "init_entri" (penguraian semua entri), "entri" (penguraian
+    sebuah entri), dan "serialisasi". Atribut durasi berisi lama tahap
+    tersebut dalam detik, bita berisi ukuran laman dalam UTF-8 (atau None
+    untuk tahap "entri" dan "serialisasi"), dan galat berisi galat yang
+    muncul pada tahap tersebut (jika ada).
+    """
+
+    __slots__ = ()
+
+
+_pengamat = ()
+_kunci_pengamat = threading.Lock()
+
+
+def tambah_pengamat(pengamat):
+    """Menambahkan pengamat yang dipanggil setiap kali sebuah tahap selesai.
+
+    Pengamat dipanggil dengan sebuah objek Peristiwa di utas tempat tahap
+    tersebut berjalan. Galat yang muncul dari pengamat akan diteruskan ke
+    pemanggil.
+
+    Tidak semua tahap dapat diamati pada setiap cara penguraian:
+
+    - Tahap "entri" hanya dicatat ketika entri diurai dengan BeautifulSoup.
+      Pengurai "pengekstrak" mengurai semua entri dalam satu lintasan,
+      sedangkan eksekutor_urai berupa ProcessPoolExecutor mengurai entri di
+      proses lain. Penguraian keduanya hanya tercakup dalam tahap
+      "init_entri" (termasuk waktu menunggu eksekutor).
+    - Dengan malas=True, tahap "init_entri" dan "entri" hanya mencakup
+      pemisahan HTML setiap entri. Penguraian makna, etimologi, dan kata
+      terkait terjadi saat atribut tersebut pertama kali diakses dan tidak
+      dicatat sebagai tahap tersendiri (misalnya tercakup dalam tahap
+      "serialisasi").
+
+    :param pengamat: Fungsi yang menerima sebuah objek Peristiwa
+    :type pengamat: callable
+    """
+    global _pengamat
+    with _kunci_pengamat:
+        _pengamat = _pengamat + (pengamat,)
+
+
+def hapus_pengamat(pengamat):
+    """Menghapus pengamat yang ditambahkan dengan tambah_pengamat.
+
+    :param pengamat: Fungsi yang sebelumnya ditambahkan
+    :type pengamat: callable
+    """
+    global _pengamat
+    with _kunci_pengamat:
+        daftar = list(_pengamat)
+        daftar.remove(pengamat)
+        _pengamat = tuple(daftar)
+
+
+@contextmanager
+def amati(pengamat):
+    """Menambahkan pengamat selama blok with berjalan.
+
+    :param pengamat: Fungsi yang menerima sebuah objek Peristiwa
+    :type pengamat: callable
+    """
+    tambah_pengamat(pengamat)
+    try:
+        yield pengamat
+    finally:
+        hapus_pengamat(pengamat)
+
+
+class _Pengukur:
+    __slots__ = ("tahap", "kueri", "bita", "_mulai")
+
+    def __init__(self, tahap, kueri, bita):
+        self.tahap = tahap
+        self.kueri = kueri
+        self.bita = bita
+
+    def __enter__(self):
+        self._mulai = time.perf_counter()
+        return self
+
+    def __exit__(self, tipe, galat, tb):
+        peristiwa = Peristiwa(
+            self.tahap,
+            self.kueri,
+            time.perf_counter() - self._mulai,
+            self.bita,
+            galat,
+        )
+        for pengamat in _pengamat:
+            pengamat(peristiwa)
+
+
+class _TanpaPengukur:
+    __slots__ = ()
+
+    def __enter__(self):
+        return None
+
+    def __exit__(self, *args):
+        pass
+
+
+_TANPA_PENGUKUR = _TanpaPengukur()
+
+
+def _ukur_tahap(tahap, kueri, bita=None):
+    """Mengembalikan context manager yang mencatat durasi sebuah tahap.
+
+    Jika tidak ada pengamat, context manager tersebut tidak melakukan apa pun
+    dan menghasilkan None.
+    """
+    if not _pengamat:
+        return _TANPA_PENGUKUR
+    return _Pengukur(tahap, kueri, bita)
+
+
+def _ukuran_laman(laman):
+    return len(laman.text.encode("utf-8"))
+
+
+def _buat_sesi(ukuran_pool):
+    sesi = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=ukuran_pool, pool_maxsize=ukuran_pool
+    )
+    sesi.mount("https://", adapter)
+    sesi.mount("http://", adapter)
+    return sesi
+
+
+_sesi_bersama = None
+_kunci_sesi_bersama = threading.Lock()
+
+
+def sesi_bersama():
+    """Mengembalikan sesi bersama untuk pencarian tanpa autentikasi.
+
+    Sesi ini dibuat ketika pertama kali dibutuhkan dan digunakan oleh semua
+    objek KBBI yang dibuat tanpa auth maupun sesi sehingga koneksi ke KBBI
+    daring (keep-alive, dengan kompresi gzip) dapat digunakan kembali.
+
+    :returns: Sesi bersama
+    :rtype: requests.Session
+    """
+    global _sesi_bersama
+    with _kunci_sesi_bersama:
+        if _sesi_bersama is None:
+            _sesi_bersama = _buat_sesi(requests.adapters.DEFAULT_POOLSIZE)
+        return _sesi_bersama
+
+
+def atur_sesi_bersama(ukuran_pool=None, sesi=None):
+    """Mengganti sesi bersama dan menutup sesi bersama yang lama.
+
+    :param ukuran_pool: Jumlah maksimum koneksi yang disimpan untuk
+        digunakan kembali
+    :type ukuran_pool: int
+    :param sesi: Sesi yang akan digunakan sebagai sesi bersama, sesi baru
+        akan dibuat jika tidak diberikan
+    :type sesi: requests.Session
+    :returns: Sesi bersama yang baru
+    :rtype: requests.Session
+    """
+    global _sesi_bersama
+    if sesi is None:
+        sesi = _buat_sesi(ukuran_pool or requests.adapters.DEFAULT_POOLSIZE)
+    with _kunci_sesi_bersama:
+        lama, _sesi_bersama = _sesi_bersama, sesi
+    if lama is not None:
+        lama.close()
+    return sesi
+
+
+def tutup_sesi_bersama():
+    """Menutup sesi bersama beserta koneksi-koneksinya (jika ada)."""
+    global _sesi_bersama
+    with _kunci_sesi_bersama:
+        lama, _sesi_bersama = _sesi_bersama, None
+    if lama is not None:
+        lama.close()
+
+
+atexit.register(tutup_sesi_bersama)
+
+
+def _jumlah_pekerja(pekerja, proses, bawaan):
+    # Setiap utas pekerja menunggu hingga lamannya selesai diurai, jadi
+    # diperlukan lebih banyak utas daripada proses agar semua proses sibuk.
+    if pekerja is not None:
+        return pekerja
+    if proses is None:
+        return bawaan
+    return max(bawaan, 2 * (proses or os.cpu_count() or 1))
+
+
+def _urai_entri(html, kueri, terautentikasi, pengurai):
+    """Menguraikan entri-entri sebuah laman (dijalankan oleh eksekutor)."""
+    kbbi = KBBI.__new__(KBBI)
+    kbbi.nama = kueri
+    kbbi.entri = []
+    kbbi.terautentikasi = terautentikasi
+    kbbi._pengurai = pengurai
+    kbbi._init_entri(Laman(None, html))
+    return kbbi.entri
+
+
+def _petakan(eksekutor, fungsi, iterabel, batas, berurutan):
+    """Memetakan fungsi ke setiap item dengan maksimum batas tugas aktif."""
+    from concurrent.futures import FIRST_COMPLETED, wait
+
+    iterator = iter(iterabel)
+    tertunda = deque()
+    for item in islice(iterator, batas):
+        tertunda.append(eksekutor.submit(fungsi, item))
+    while tertunda:
+        if berurutan:
+            selesai = [tertunda.popleft()]
+        else:
+            selesai, _ = wait(tertunda, return_when=FIRST_COMPLETED)
+            tertunda = deque(t for t in tertunda if t not in selesai)
+        for tugas in selesai:
+            for item in islice(iterator, 1):
+                tertunda.append(eksekutor.submit(fungsi, item))
+            yield tugas.result()
+
+
+class Laman:
+    """Sebuah laman KBBI daring yang dimuat dari tembolok."""
+
+    status_code = 200
+    basi = False
+
+    def __init__(self, url, text, headers=None):
+        self.url = url
+        self.text = text
+        self.headers = headers or {}
+
+
+_LAMAN_GALAT = ("Beranda/Error", "Beranda/BatasSehari", "Account/Banned")
+_HR_POLOS = re.compile(r"<hr\s*/?>")
+
+
+def _laman_galat(url):
+    return any(galat in url for galat in _LAMAN_GALAT)
+
+
+def _validator_laman(laman):
+    """Mengembalikan pasangan (ETag, Last-Modified) laman jika ada."""
+    headers = getattr(laman, "headers", None) or {}
+    return headers.get("ETag"), headers.get("Last-Modified")
+
+
+def _status_berhasil(laman):
+    return 200 <= getattr(laman, "status_code", 200) < 300
+
+
+def _tidak_diubah(laman):
+    return getattr(laman, "status_code", None) == 304
+
+
+def _sidik_entri(teks):
+    """Mengembalikan sidik (hash) bagian entri dalam HTML laman.
+
+    Bagian lain laman (misalnya token formulir) dapat berubah pada setiap
+    permintaan sehingga tidak diikutsertakan.
+    """
+    import hashlib
+
+    mulai = max(teks.find("<hr"), 0)
+    akhir = _akhir_bagian_entri(teks)
+    if akhir == -1:
+        akhir = len(teks)
+    return hashlib.blake2b(
+        teks[mulai:akhir].encode("utf-8"), digest_size=16
+    ).digest()
+
+
+def _akhir_bagian_entri(teks):
+    """Mencari indeks akhir bagian entri dalam (potongan awal) HTML laman.
+
+    Bagian entri dimulai dari <hr> pertama dan diakhiri oleh <hr> tanpa
+    atribut berikutnya. Jika entri tidak ditemukan, bagian tersebut (beserta
+    saran entri) diakhiri oleh <footer>.
+
+    :returns: Indeks akhir bagian entri atau -1 jika belum ditemukan
+    :rtype: int
+    """
+    mulai = teks.find("<hr")
+    if mulai == -1:
+        return -1
+    hr = _HR_POLOS.search(teks, mulai + 3)
+    if hr is None:
+        return -1
+    if "Entri tidak ditemukan." in teks[mulai : hr.start()]:
+        return teks.find("<footer", hr.start())
+    return hr.end()
+
+
+def ambil_laman_alir(sesi, url, ukuran_potongan=4096, headers=None):
+    """Mengambil laman secara bertahap hingga bagian entri selesai.
+
+    Sisa laman (misalnya bagian bawah laman dan skrip) tidak akan diunduh.
+    Jika laman dialihkan ke laman galat, isi laman tidak diunduh sama
+    sekali.
+
+    :param sesi: Sesi yang digunakan untuk mengambil laman
+    :type sesi: requests.Session
+    :param url: URL laman yang akan diambil
+    :type url: str
+    :param ukuran_potongan: Ukuran potongan yang dibaca setiap tahap (bita)
+    :type ukuran_potongan: int
+    :param headers: Header tambahan untuk permintaan tersebut
+    :type headers: dict
+    :returns: Laman yang berisi potongan awal HTML hingga bagian entri
+    :rtype: Laman
+    """
+    with sesi.get(url, stream=True, headers=headers) as respons:
+        laman = Laman(respons.url, _baca_alir(respons, ukuran_potongan))
+        laman.headers = respons.headers
+        # Status asli diperlukan, misalnya oleh KebijakanCobaUlang.periksa.
+        laman.status_code = respons.status_code
+        return laman
+
+
+def _baca_alir(respons, ukuran_potongan):
+    if _laman_galat(respons.url) or _tidak_diubah(respons):
+        return ""
+    pengawasandi = codecs.getincrementaldecoder(respons.encoding or "utf-8")(
+        errors="replace"
+    )
+    teks = ""
+    for potongan in respons.iter_content(ukuran_potongan):
+        teks += pengawasandi.decode(potongan)
+        akhir = _akhir_bagian_entri(teks)
+        if akhir != -1:
+            return teks[:akhir]
+    return teks + pengawasandi.decode(b"", final=True)
+
+
+_pembatas_laju = None
+
+
+def atur_pembatas_laju(pembatas=None):
+    """Mengatur pembatas laju yang digunakan oleh semua objek KBBI dalam
+    proses ini, selain pembatas yang diberikan kepada masing-masing objek.
+
+    :param pembatas: objek PembatasLaju, None untuk menonaktifkan
+    :type pembatas: PembatasLaju
+    """
+    global _pembatas_laju
+    _pembatas_laju = pembatas
+
+
 class AutentikasiKBBI:
     """Gunakan fitur pengguna terdaftar."""
 
     host = "https://kbbi.kemdikbud.go.id"
     lokasi = "Account/Login"
     lokasi_kuki = DATA_DIR / "kuki.json"
+    coba_ulang = None
 
-    def __init__(self, posel=None, sandi=None, lokasi_kuki=None):
+    def __init__(
+        self, posel=None, sandi=None, lokasi_kuki=None, coba_ulang=None
+    ):
         """Melakukan autentikasi dengan alamat posel dan sandi yang diberikan.
         Objek AutentikasiKBBI dapat digunakan dalam pembuatan objek KBBI
         untuk mendapatkan fitur pengguna terdaftar.
@@ -525,49 +1839,79 @@ class AutentikasiKBBI:
         :type sandi: str
         :param lokasi_kuki: Lokasi kuki yang akan dimuat/disimpan
         :type lokasi_kuki: str atau PathLike
+        :param coba_ulang: objek KebijakanCobaUlang untuk mengulangi
+            autentikasi yang gagal sementara
+        :type coba_ulang: KebijakanCobaUlang
         """
-        self.sesi = requests.Session()
         self.lokasi_kuki = lokasi_kuki or self.lokasi_kuki
+        self.coba_ulang = coba_ulang
         if posel is None and sandi is None:
+            from .kuki import PenyimpanKuki
+
+            # Semua objek yang menggunakan berkas kuki yang sama dalam satu
+            # proses menggunakan satu sesi (dan pool koneksi) yang sama.
             try:
-                self.ambil_kuki()
+                self.sesi = PenyimpanKuki.bersama(self.lokasi_kuki).sesi()
             except FileNotFoundError as e:
                 raise KukiTidakDitemukan(self.lokasi_kuki) from e
         else:
-            token = self._ambil_token()
-            self._autentikasi(posel, sandi, token)
+            self.sesi = requests.Session()
+            token = self._coba(self._ambil_token)
+            self._coba(self._autentikasi, posel, sandi, token)
+
+    def _coba(self, fungsi, *args):
+        if self.coba_ulang is None:
+            return fungsi(*args)
+        return self.coba_ulang.jalankan(fungsi, *args)
 
     def simpan_kuki(self):
         kuki_aspnet = self.sesi.cookies.get(".AspNet.ApplicationCookie")
         kuki_sesi = {".AspNet.ApplicationCookie": kuki_aspnet}
-        with open(self.lokasi_kuki, "w") as kuki:
-            json.dump(kuki_sesi, kuki)
+        from .kuki import PenyimpanKuki
+
+        PenyimpanKuki.bersama(self.lokasi_kuki).simpan(kuki_sesi)
 
     def ambil_kuki(self):
-        with open(self.lokasi_kuki) as kuki:
-            self.sesi.cookies.update(json.load(kuki))
+        from .kuki import PenyimpanKuki
+
+        kuki = PenyimpanKuki.bersama(self.lokasi_kuki).ambil()
+        self.sesi.cookies.update(kuki)
 
     def _ambil_token(self):
         laman = self.sesi.get(f"{self.host}/{self.lokasi}")
+        return self._cari_token(laman.text)
+
+    @staticmethod
+    def _cari_token(teks):
         token = re.search(
             r"<input name=\"__RequestVerificationToken\".*value=\"(.*)\" />",
-            laman.text,
+            teks,
         )
         if not token:
             raise TerjadiKesalahan()
         return token.group(1)
 
     def _autentikasi(self, posel, sandi, token):
-        payload = {
+        laman = self.sesi.post(
+            f"{self.host}/{self.lokasi}",
+            data=self._payload(posel, sandi, token),
+        )
+        self._cek_galat_autentikasi(laman.url)
+
+    @staticmethod
+    def _payload(posel, sandi, token):
+        return {
             "__RequestVerificationToken": token,
             "Posel": posel,
             "KataSandi": sandi,
             "IngatSaya": True,
         }
-        laman = self.sesi.post(f"{self.host}/{self.lokasi}", data=payload)
-        if "Beranda/Error" in laman.url:
+
+    @staticmethod
+    def _cek_galat_autentikasi(url):
+        if "Beranda/Error" in url:
             raise TerjadiKesalahan()
-        if "Account/Login" in laman.url:
+        if "Account/Login" in url:
             raise GagalAutentikasi()
 
 
@@ -583,6 +1927,34 @@ class TidakDitemukan(Galat):
         self.objek = objek
 
 
+class LamanTidakValid(Galat):
+    """Galat ketika laman dari KBBI Daring tidak dapat diurai, misalnya
+    respons galat HTTP atau laman pemeliharaan."""
+
+    def __init__(self, kueri, status=None):
+        pesan = f"Laman untuk {kueri} tidak dapat diurai"
+        if status is not None:
+            pesan += f" (status HTTP {status})"
+        super().__init__(f"{pesan}.")
+        self.kueri = kueri
+        self.status = status
+
+    def __reduce__(self):
+        return type(self), (self.kueri, self.status)
+
+
+class EntriTidakValid(Galat):
+    """Galat ketika isi entri yang penguraiannya ditunda (malas) tidak dapat
+    diurai."""
+
+    def __init__(self, nama):
+        super().__init__(f"Entri {nama} tidak dapat diurai.")
+        self.nama = nama
+
+    def __reduce__(self):
+        return type(self), (self.nama,)
+
+
 class TerjadiKesalahan(Galat):
     """Galat ketika terjadi kesalahan dari pihak KBBI.
     Laman: https://kbbi.kemdikbud.go.id/Beranda/Error
@@ -603,6 +1975,13 @@ class BatasSehari(Galat):
         )
 
 
+class KuotaHabis(BatasSehari):
+    """Galat ketika kuota harian pada PembatasLaju telah habis."""
+
+    def __init__(self):
+        Galat.__init__(self, "Kuota harian pencarian telah habis.")
+
+
 class AkunDibekukan(Galat):
     """Galat ketika Akun sedang dibekukan.
 
@@ -616,6 +1995,23 @@ class AkunDibekukan(Galat):
         super().__init__("Akun ini sedang dibekukan, tidak dapat digunakan.")
 
 
+class SirkuitTerbuka(Galat):
+    """Galat ketika KBBI Daring dianggap sedang tidak dapat diakses setelah
+    terlalu banyak kegagalan berturut-turut."""
+
+    def __init__(self):
+        super().__init__(
+            "KBBI Daring sedang tidak dapat diakses. Coba lagi nanti."
+        )
+
+
+class TidakAdaDiTembolok(Galat):
+    """Galat ketika laman tidak tersedia di tembolok dalam mode luring."""
+
+    def __init__(self, kueri):
+        super().__init__(f"{kueri} tidak tersedia di tembolok.")
+
+
 class GagalAutentikasi(Galat):
     """Galat ketika gagal melakukan autentikasi dengan KBBI."""
 
@@ -641,6 +2037,8 @@ class KukiTidakDitemukan(GagalAutentikasi):
 
 
 def _parse_args_autentikasi(args):
+    import argparse
+
     parser = argparse.ArgumentParser(
         description=(
             "Melakukan autentikasi dengan alamat posel dan sandi "
@@ -734,12 +2132,19 @@ def autentikasi(argv=None):
 
 
 def _parse_args_utama(args):
+    import argparse
+
     parser = argparse.ArgumentParser(
-        description=("Mengambil sebuah laman dalam KBBI Daring."),
+        description=("Mengambil laman dalam KBBI Daring."),
         add_help=False,
     )
     parser.add_argument(
-        "laman", help='laman yang ingin diambil, contoh: "cinta"'
+        "laman",
+        help=(
+            'laman yang ingin diambil, contoh: "cinta"; gunakan "-" untuk'
+            " membaca laman dari masukan standar (satu laman per baris)"
+        ),
+        nargs="+",
     )
     parser.add_argument(
         "-h",
@@ -780,6 +2185,14 @@ def _parse_args_utama(args):
         ),
         action="store_true",
     )
+    parser.add_argument(
+        "--jsonl",
+        help=(
+            "tampilkan hasil dalam bentuk JSON Lines (satu objek JSON per"
+            " baris untuk setiap laman)"
+        ),
+        action="store_true",
+    )
     parser.add_argument(
         "-i",
         "--indentasi",
@@ -793,16 +2206,72 @@ def _parse_args_utama(args):
         help="lokasi menuju berkas kuki yang akan digunakan untuk autentikasi",
         metavar="L",
     )
-    return parser.parse_args(args)
+    parser.add_argument(
+        "-T",
+        "--tembolok",
+        help="simpan dan gunakan laman dari tembolok",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--luring",
+        help="hanya gunakan laman dari tembolok tanpa mengakses KBBI Daring",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--umur-tembolok",
+        help="umur maksimum laman dalam tembolok (dalam detik)",
+        type=float,
+        metavar="DETIK",
+    )
+    parser.add_argument(
+        "--lokasi-tembolok",
+        help="lokasi menuju berkas tembolok yang akan digunakan",
+        metavar="LOKASI",
+    )
+    parser.add_argument(
+        "--saran",
+        help=(
+            "berkas daftar kata (satu kata per baris) untuk mencari saran"
+            " entri yang mirip apabila laman tidak ditemukan"
+        ),
+        metavar="BERKAS",
+    )
+    parser.add_argument(
+        "--pekerja",
+        help=(
+            "jumlah laman yang diambil bersamaan jika lebih dari satu laman"
+            " diberikan (bawaan: 1, atau dua kali jumlah proses jika --proses"
+            " diberikan)"
+        ),
+        type=int,
+        metavar="N",
+    )
+    parser.add_argument(
+        "--proses",
+        help=(
+            "jumlah proses untuk menguraikan laman jika lebih dari satu laman"
+            " diberikan (0: sejumlah inti CPU)"
+        ),
+        type=int,
+        metavar="N",
+    )
+    args = parser.parse_args(args)
+    args.pekerja = _jumlah_pekerja(args.pekerja, args.proses, 1)
+    if args.jsonl:
+        args.json = True
+        args.indentasi = None
+    return args
 
 
 def _keluaran(laman, args):
     if args.json:
-        return json.dumps(
-            laman.serialisasi(args.pengguna), indent=args.indentasi
+        penulis = PenulisJSON(
+            sys.stdout, indentasi=args.indentasi, fitur_pengguna=args.pengguna
         )
+        penulis.tulis(laman)
     else:
-        return laman.__str__(args.contoh, args.terkait, args.pengguna)
+        print(laman.__str__(args.contoh, args.terkait, args.pengguna))
+    sys.stdout.flush()
 
 
 def main(argv=None):
@@ -819,26 +2288,95 @@ def main(argv=None):
     elif args.lokasi_kuki:
         print(KukiTidakDitemukan(lokasi_kuki, posel_sandi=False))
         return 1
+    tembolok = None
+    if args.tembolok or args.luring or args.lokasi_tembolok:
+        from .tembolok import TembolokLaman
+
+        tembolok = TembolokLaman(
+            args.lokasi_tembolok, args.umur_tembolok, luring=args.luring
+        )
+    indeks_saran = None
+    if args.saran:
+        from .saran import IndeksSaran
+
+        indeks_saran = IndeksSaran.dari_berkas(args.saran)
+    if args.laman != ["-"] and len(args.laman) == 1:
+        return _cari_satu(args.laman[0], args, auth, tembolok, indeks_saran)
+    return _cari_banyak(
+        _daftar_kueri(args.laman, sys.stdin),
+        args,
+        auth,
+        tembolok,
+        indeks_saran,
+    )
+
+
+def _cari_satu(kueri, args, auth, tembolok, indeks_saran):
     try:
-        laman = KBBI(args.laman, auth)
+        laman = KBBI(kueri, auth, tembolok=tembolok, indeks_saran=indeks_saran)
     except TidakDitemukan as e:
         laman = e.objek
         if not args.json:
             print(e)
         if (laman.saran_entri and args.pengguna) or args.json:
-            print(_keluaran(laman, args))
+            _keluaran(laman, args)
         return 1
     except Galat as e:
         print(e)
         return 1
     else:
-        print(_keluaran(laman, args))
+        _keluaran(laman, args)
         return 0
 
 
+def _daftar_kueri(daftar_laman, masukan):
+    for laman in daftar_laman:
+        if laman != "-":
+            yield laman
+            continue
+        for baris in masukan:
+            kueri = baris.strip()
+            if kueri:
+                yield kueri
+
+
+def _cari_banyak(daftar_kueri, args, auth, tembolok, indeks_saran):
+    kode = 0
+    pertama = True
+    for hasil in KBBI.banyak(
+        daftar_kueri,
+        auth,
+        pekerja=args.pekerja,
+        proses=args.proses,
+        tembolok=tembolok,
+        indeks_saran=indeks_saran,
+    ):
+        if hasil.galat is not None:
+            kode = 1
+        if hasil.objek is None:
+            print(f"{hasil.kueri}: {hasil.galat}", file=sys.stderr, flush=True)
+            if isinstance(hasil.galat, (BatasSehari, AkunDibekukan)):
+                break
+            continue
+        if not args.json:
+            if not pertama:
+                print()
+            if hasil.galat is not None:
+                print(hasil.galat, flush=True)
+        pertama = False
+        if (
+            hasil.galat is None
+            or args.json
+            or (hasil.objek.saran_entri and args.pengguna)
+        ):
+            _keluaran(hasil.objek, args)
+    return kode
+
+
 def init():
     if __name__ == "__main__":
         return sys.exit(main())
 
 
-init()
+if __name__ == "__main__":
+    init()
@@ -0,0 +1,220 @@
+"""
+:mod:`kbbi.kuki` -- Penyimpan kuki KBBI Python
+==============================================
+
+.. module:: kbbi.kuki
+   :platform: Unix, Windows, Mac
+   :synopsis: Modul ini mengandung penyimpan kuki yang aman antarproses.
+.. moduleauthor:: sage <laymonage@gmail.com>
+"""
+
+import json
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+from .kbbi import _buat_sesi, _ModulMalas
+
+requests = _ModulMalas("requests", globals())
+
+
+def _kunci_eksklusif(berkas):
+    if os.name == "nt":
+        import msvcrt
+
+        berkas.seek(0)
+        msvcrt.locking(berkas.fileno(), msvcrt.LK_LOCK, 1)
+    else:
+        import fcntl
+
+        fcntl.flock(berkas.fileno(), fcntl.LOCK_EX)
+
+
+def _lepas_kunci(berkas):
+    if os.name == "nt":
+        import msvcrt
+
+        berkas.seek(0)
+        msvcrt.locking(berkas.fileno(), msvcrt.LK_UNLCK, 1)
+    else:
+        import fcntl
+
+        fcntl.flock(berkas.fileno(), fcntl.LOCK_UN)
+
+
+@contextmanager
+def _kunci_berkas(lokasi):
+    """Mengunci berkas lokasi secara eksklusif antarproses.
+
+    Berkas kunci dihapus sebelum kuncinya dilepas. Proses yang terlanjur
+    membuka berkas yang telah dihapus tersebut akan mengulang dengan berkas
+    kunci yang baru.
+    """
+    while True:
+        berkas = open(lokasi, "a+b")
+        try:
+            _kunci_eksklusif(berkas)
+            try:
+                berlaku = os.path.samestat(
+                    os.fstat(berkas.fileno()), os.stat(lokasi)
+                )
+            except FileNotFoundError:
+                berlaku = False
+            if berlaku:
+                break
+            _lepas_kunci(berkas)
+        except BaseException:
+            berkas.close()
+            raise
+        berkas.close()
+    try:
+        yield
+    finally:
+        try:
+            os.remove(lokasi)
+        except OSError:
+            # Windows tidak dapat menghapus berkas yang sedang dibuka.
+            pass
+        _lepas_kunci(berkas)
+        berkas.close()
+
+
+def _tanda_berkas(status):
+    # Berkas yang diganti dengan os.replace memiliki inode yang berbeda
+    # meskipun waktu modifikasinya sama.
+    return status.st_mtime_ns, status.st_size, status.st_ino
+
+
+class PenyimpanKuki:
+    """Berkas kuki autentikasi yang digunakan bersama oleh banyak proses.
+
+    Kuki ditulis ke berkas sementara lalu dipindahkan dengan os.replace
+    sehingga pembaca tidak pernah mendapati berkas yang setengah tertulis,
+    sedangkan penulisan diserialkan dengan penguncian berkas "<lokasi>.kunci"
+    yang dihapus setelah penulisan selesai. Isi berkas disimpan di memori
+    dan baru dibaca ulang jika waktu modifikasi, ukuran, atau inode berkas
+    berubah. Gunakan
+    PenyimpanKuki.bersama agar semua objek dalam satu proses menggunakan
+    penyimpan dan sesi yang sama.
+    """
+
+    _semua = {}
+    _kunci_semua = threading.Lock()
+
+    def __init__(self, lokasi):
+        """Membuat penyimpan kuki untuk berkas pada lokasi yang diberikan.
+
+        :param lokasi: Lokasi berkas kuki
+        :type lokasi: str atau PathLike
+        """
+        self.lokasi = Path(lokasi)
+        self.lokasi_kunci = self.lokasi.with_name(f"{self.lokasi.name}.kunci")
+        self._kunci = threading.RLock()
+        self._kuki = None
+        self._tanda = None
+        self._sesi = None
+        self._tanda_sesi = None
+        self.dibaca = 0
+
+    @classmethod
+    def bersama(cls, lokasi):
+        """Mengembalikan penyimpan kuki bersama untuk lokasi tersebut.
+
+        :param lokasi: Lokasi berkas kuki
+        :type lokasi: str atau PathLike
+        :returns: Objek PenyimpanKuki yang sama untuk lokasi yang sama
+        :rtype: PenyimpanKuki
+        """
+        kunci = Path(lokasi).resolve()
+        with cls._kunci_semua:
+            penyimpan = cls._semua.get(kunci)
+            if penyimpan is None:
+                penyimpan = cls._semua[kunci] = cls(lokasi)
+            return penyimpan
+
+    def ambil(self):
+        """Mengembalikan kuki yang tersimpan.
+
+        Berkas hanya dibaca jika telah berubah sejak terakhir dibaca.
+        FileNotFoundError akan dimunculkan jika berkas kuki tidak ada.
+
+        :returns: Dictionary nama dan nilai kuki
+        :rtype: dict
+        """
+        with self._kunci:
+            return dict(self._ambil())
+
+    def _ambil(self):
+        tanda = _tanda_berkas(os.stat(self.lokasi))
+        if tanda != self._tanda:
+            with open(self.lokasi, encoding="utf-8") as berkas:
+                tanda = _tanda_berkas(os.fstat(berkas.fileno()))
+                self._kuki = json.load(berkas)
+            self._tanda = tanda
+            self.dibaca += 1
+        return self._kuki
+
+    def simpan(self, kuki):
+        """Menyimpan kuki secara atomik.
+
+        :param kuki: Dictionary nama dan nilai kuki
+        :type kuki: dict
+        """
+        import tempfile
+
+        self.lokasi.parent.mkdir(parents=True, exist_ok=True)
+        with self._kunci, _kunci_berkas(self.lokasi_kunci):
+            deskriptor, sementara = tempfile.mkstemp(
+                prefix=f"{self.lokasi.name}.", dir=self.lokasi.parent
+            )
+            try:
+                with open(deskriptor, "w", encoding="utf-8") as berkas:
+                    json.dump(kuki, berkas)
+                    berkas.flush()
+                    os.fsync(berkas.fileno())
+                os.replace(sementara, self.lokasi)
+            except BaseException:
+                os.remove(sementara)
+                raise
+            self._kuki = dict(kuki)
+            self._tanda = _tanda_berkas(os.stat(self.lokasi))
+
+    def sesi(self):
+        """Mengembalikan sesi bersama yang menggunakan kuki tersimpan.
+
+        Sesi yang sama (dengan pool koneksinya) dikembalikan setiap kali
+        method ini dipanggil. Sebelum setiap permintaan melalui sesi
+        tersebut, kuki dalam sesi diperbarui jika berkas kuki telah berubah
+        (misalnya karena proses lain melakukan autentikasi ulang).
+
+        :returns: Sesi dengan kuki tersimpan
+        :rtype: requests.Session
+        """
+        with self._kunci:
+            if self._sesi is None:
+                sesi = _buat_sesi(requests.adapters.DEFAULT_POOLSIZE)
+                permintaan = sesi.request
+
+                def request(*args, **kwargs):
+                    self._perbarui_sesi()
+                    return permintaan(*args, **kwargs)
+
+                sesi.request = request
+                self._sesi = sesi
+            self._perbarui_sesi(wajib=True)
+            return self._sesi
+
+    def _perbarui_sesi(self, wajib=False):
+        with self._kunci:
+            try:
+                kuki = self._ambil()
+            except FileNotFoundError:
+                # Kuki yang sudah ada di sesi tetap digunakan jika berkas
+                # kuki dihapus setelah sesi dibuat.
+                if wajib:
+                    raise
+                return
+            if self._tanda_sesi != self._tanda:
+                self._sesi.cookies.update(kuki)
+                self._tanda_sesi = self._tanda
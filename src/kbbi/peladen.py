@@ -0,0 +1,359 @@
+"""
+:mod:`kbbi.peladen` -- Peladen HTTP KBBI Python
+===============================================
+
+.. module:: kbbi.peladen
+   :platform: Unix, Windows, Mac
+   :synopsis: Modul ini mengandung implementasi peladen HTTP untuk kbbi.
+.. moduleauthor:: sage <laymonage@gmail.com>
+
+Peladen ini menjaga sesi (beserta kuki autentikasi jika ada) dan tembolok
+objek KBBI tetap hidup sehingga aplikasi lain dapat mencari laman KBBI tanpa
+menanggung biaya memulai proses dan membuka koneksi baru.
+
+- ``GET /entri/<kueri>``: hasil KBBI.serialisasi dalam JSON. Jika laman
+  tidak ditemukan, hasil serialisasi (beserta saran entri) dikembalikan
+  dengan status 404.
+- ``GET /status``: statistik tembolok objek.
+
+Galat lainnya dikembalikan dalam bentuk ``{"galat": ..., "pesan": ...}``.
+"""
+
+import argparse
+import json
+import signal
+import socket
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+from socketserver import ThreadingMixIn
+from urllib.parse import unquote, urlsplit
+
+import requests
+
+from .kbbi import (
+    KBBI,
+    AkunDibekukan,
+    AutentikasiKBBI,
+    BatasSehari,
+    Galat,
+    KukiTidakDitemukan,
+    SirkuitTerbuka,
+    TidakDitemukan,
+    atur_sesi_bersama,
+)
+from .saran import IndeksSaran
+from .tembolok import TembolokLaman, TembolokObjek
+
+_STATUS_GALAT = (
+    (TidakDitemukan, 404),
+    (BatasSehari, 429),
+    (AkunDibekukan, 403),
+    (SirkuitTerbuka, 503),
+)
+
+
+class PenanganKBBI(BaseHTTPRequestHandler):
+    """Penangan permintaan HTTP untuk PeladenKBBI."""
+
+    protocol_version = "HTTP/1.1"
+    server_version = "kbbi-peladen"
+    # Koneksi yang terlalu lama menganggur akan ditutup.
+    timeout = 60
+
+    def do_GET(self):
+        lokasi = urlsplit(self.path).path
+        if lokasi.startswith("/entri/"):
+            kueri = unquote(lokasi[len("/entri/") :]).strip()
+            if kueri:
+                self._kirim(*self.server.cari(kueri))
+            else:
+                self._kirim_galat(400, "KueriKosong", "Kueri tidak diberikan.")
+        elif lokasi == "/status":
+            self._kirim(200, self.server.status())
+        else:
+            self._kirim_galat(
+                404, "LamanTidakAda", f"Laman {lokasi} tidak tersedia."
+            )
+
+    def _kirim_galat(self, status, galat, pesan):
+        self._kirim(status, {"galat": galat, "pesan": pesan})
+
+    def _kirim(self, status, data):
+        isi = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(isi)))
+        self.end_headers()
+        self.wfile.write(isi)
+
+    def log_message(self, format, *args):
+        if self.server.catat:
+            super().log_message(format, *args)
+
+
+class PeladenKBBI(ThreadingMixIn, HTTPServer):
+    """Peladen HTTP yang melayani pencarian KBBI secara bersamaan.
+
+    Setiap permintaan ditangani dalam utasnya sendiri. Ketika peladen
+    ditutup, permintaan yang sedang berjalan akan diselesaikan terlebih
+    dahulu.
+    """
+
+    kelas_kbbi = KBBI
+    daemon_threads = False
+    block_on_close = True
+
+    def __init__(
+        self,
+        alamat=("127.0.0.1", 8080),
+        auth=None,
+        maks_objek=1024,
+        umur_objek=3600,
+        catat=True,
+        **kwargs,
+    ):
+        """Membuat peladen baru.
+
+        Argumen lainnya akan diteruskan ke konstruktor KBBI.
+
+        :param alamat: Pasangan alamat dan port yang digunakan
+        :type alamat: tuple
+        :param auth: objek AutentikasiKBBI
+        :type auth: AutentikasiKBBI
+        :param maks_objek: Jumlah maksimum objek dalam tembolok objek
+        :type maks_objek: int
+        :param umur_objek: Umur maksimum objek dalam tembolok objek (dalam
+            detik) sebelum diambil ulang, None berarti tidak kedaluwarsa
+        :type umur_objek: int atau float
+        :param catat: Catat setiap permintaan ke standard error
+        :type catat: bool
+        """
+        self.auth = auth
+        self.catat = catat
+        self.kwargs = kwargs
+        self.tembolok_objek = TembolokObjek(maks_objek, umur=umur_objek)
+        self.tembolok_objek.kelas_kbbi = self.kelas_kbbi
+        self._utas = {}
+        self._kunci_utas = threading.Lock()
+        super().__init__(alamat, PenanganKBBI)
+
+    def cari(self, kueri):
+        """Mencari sebuah kueri dan mengembalikan status HTTP beserta isinya.
+
+        :param kueri: Kata kunci pencarian
+        :type kueri: str
+        :returns: Pasangan status HTTP dan data yang akan dikirim
+        :rtype: tuple
+        """
+        try:
+            objek = self.tembolok_objek.ambil(kueri, self.auth, **self.kwargs)
+        except TidakDitemukan as e:
+            return 404, e.objek.serialisasi()
+        except Galat as e:
+            for galat, status in _STATUS_GALAT:
+                if isinstance(e, galat):
+                    break
+            else:
+                status = 502
+            return status, {"galat": type(e).__name__, "pesan": str(e)}
+        except requests.RequestException as e:
+            return 502, {"galat": type(e).__name__, "pesan": str(e)}
+        return 200, objek.serialisasi()
+
+    def status(self):
+        """Mengembalikan status peladen.
+
+        :returns: Dictionary berisi statistik tembolok objek
+        :rtype: dict
+        """
+        return {
+            "terautentikasi": self.auth is not None,
+            "tembolok": self.tembolok_objek.statistik(),
+        }
+
+    def process_request(self, request, client_address):
+        # Utas dan koneksinya dicatat sendiri agar server_close dapat
+        # menutup koneksi yang menganggur (dan juga berlaku di Python 3.6).
+        utas = threading.Thread(
+            target=self._proses_dan_lepas, args=(request, client_address)
+        )
+        with self._kunci_utas:
+            self._utas[utas] = request
+        utas.start()
+
+    def _proses_dan_lepas(self, request, client_address):
+        try:
+            self.process_request_thread(request, client_address)
+        finally:
+            with self._kunci_utas:
+                self._utas.pop(threading.current_thread(), None)
+
+    def server_close(self):
+        """Menutup peladen setelah semua permintaan selesai ditangani.
+
+        Koneksi yang menganggur langsung ditutup, sedangkan permintaan yang
+        sedang ditangani tetap dapat mengirimkan responsnya.
+        """
+        HTTPServer.server_close(self)
+        with self._kunci_utas:
+            semua = dict(self._utas)
+        for request in semua.values():
+            try:
+                request.shutdown(socket.SHUT_RD)
+            except OSError:
+                pass
+        for utas in semua:
+            utas.join()
+
+
+def _parse_args(args):
+    parser = argparse.ArgumentParser(
+        description="Menjalankan peladen HTTP untuk mencari laman KBBI.",
+        add_help=False,
+    )
+    parser.add_argument(
+        "-h",
+        "-b",
+        "--help",
+        "--bantuan",
+        action="help",
+        default=argparse.SUPPRESS,
+        help="tampilkan pesan bantuan ini dan keluar",
+    )
+    parser.add_argument(
+        "--alamat",
+        help="alamat yang digunakan peladen (bawaan: 127.0.0.1)",
+        default="127.0.0.1",
+    )
+    parser.add_argument(
+        "--port",
+        "-p",
+        help="port yang digunakan peladen (bawaan: 8080)",
+        type=int,
+        default=8080,
+    )
+    parser.add_argument(
+        "--lokasi-kuki",
+        "-l",
+        help="lokasi menuju berkas kuki yang akan digunakan untuk autentikasi",
+        metavar="L",
+    )
+    parser.add_argument(
+        "--koneksi",
+        help="jumlah koneksi ke KBBI Daring yang disimpan (bawaan: 10)",
+        type=int,
+        default=10,
+        metavar="N",
+    )
+    parser.add_argument(
+        "--maks-objek",
+        help="jumlah maksimum objek dalam tembolok memori (bawaan: 1024)",
+        type=int,
+        default=1024,
+        metavar="N",
+    )
+    parser.add_argument(
+        "--umur-objek",
+        help=(
+            "umur maksimum objek dalam tembolok memori sebelum diambil ulang"
+            " (dalam detik, bawaan: 3600)"
+        ),
+        type=float,
+        default=3600,
+        metavar="DETIK",
+    )
+    parser.add_argument(
+        "-T",
+        "--tembolok",
+        help="simpan dan gunakan laman dari tembolok",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--umur-tembolok",
+        help="umur maksimum laman dalam tembolok (dalam detik)",
+        type=float,
+        metavar="DETIK",
+    )
+    parser.add_argument(
+        "--lokasi-tembolok",
+        help="lokasi menuju berkas tembolok yang akan digunakan",
+        metavar="LOKASI",
+    )
+    parser.add_argument(
+        "--saran",
+        help=(
+            "berkas daftar kata (satu kata per baris) untuk mencari saran"
+            " entri yang mirip apabila laman tidak ditemukan"
+        ),
+        metavar="BERKAS",
+    )
+    parser.add_argument(
+        "-s",
+        "--senyap",
+        help="jangan catat setiap permintaan",
+        action="store_false",
+        dest="catat",
+    )
+    return parser.parse_args(args)
+
+
+def main(argv=None):
+    """Program CLI untuk menjalankan peladen."""
+    if argv is None:
+        argv = sys.argv[1:]
+    args = _parse_args(argv)
+    auth = None
+    lokasi_kuki = AutentikasiKBBI.lokasi_kuki
+    if args.lokasi_kuki:
+        lokasi_kuki = Path(args.lokasi_kuki)
+    if lokasi_kuki.exists():
+        auth = AutentikasiKBBI(lokasi_kuki=lokasi_kuki)
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=args.koneksi, pool_maxsize=args.koneksi
+        )
+        auth.sesi.mount("https://", adapter)
+    elif args.lokasi_kuki:
+        print(KukiTidakDitemukan(lokasi_kuki, posel_sandi=False))
+        return 1
+    else:
+        atur_sesi_bersama(ukuran_pool=args.koneksi)
+    kwargs = {}
+    if args.tembolok or args.lokasi_tembolok:
+        kwargs["tembolok"] = TembolokLaman(
+            args.lokasi_tembolok, args.umur_tembolok
+        )
+    if args.saran:
+        kwargs["indeks_saran"] = IndeksSaran.dari_berkas(args.saran)
+    peladen = PeladenKBBI(
+        (args.alamat, args.port),
+        auth,
+        maks_objek=args.maks_objek,
+        umur_objek=args.umur_objek,
+        catat=args.catat,
+        **kwargs,
+    )
+
+    def hentikan(nomor, frame):
+        # shutdown harus dipanggil dari utas selain utas serve_forever.
+        threading.Thread(target=peladen.shutdown).start()
+
+    signal.signal(signal.SIGINT, hentikan)
+    signal.signal(signal.SIGTERM, hentikan)
+    alamat, port = peladen.server_address[:2]
+    print(f"Peladen KBBI berjalan di http://{alamat}:{port}/", flush=True)
+    try:
+        peladen.serve_forever()
+    finally:
+        peladen.server_close()
+        if "tembolok" in kwargs:
+            kwargs["tembolok"].tutup()
+        if auth is not None:
+            auth.sesi.close()
+    print("Peladen KBBI dihentikan.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,180 @@
+"""
+:mod:`kbbi.pembatas` -- Pembatas laju KBBI Python
+=================================================
+
+.. module:: kbbi.pembatas
+   :platform: Unix, Windows, Mac
+   :synopsis: Modul ini mengandung implementasi pembatas laju permintaan.
+.. moduleauthor:: sage <laymonage@gmail.com>
+"""
+
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from .kbbi import DATA_DIR, KuotaHabis
+
+_WIB = timezone(timedelta(hours=7))
+
+
+class PembatasLaju:
+    """Pembatas laju permintaan ke KBBI Daring dengan algoritme token bucket.
+
+    Setiap permintaan mengambil satu token. Token terisi kembali sebanyak
+    laju token per detik hingga kapasitas. Jika kuota_harian diberikan,
+    jumlah permintaan dalam sehari (menurut WIB, sesuai KBBI Daring) dicatat
+    di basis data SQLite sehingga dapat digunakan bersama oleh beberapa
+    proses dan tetap tersimpan ketika program dijalankan kembali.
+    """
+
+    lokasi_kuota = DATA_DIR / "kuota.sqlite3"
+    _waktu = staticmethod(time.monotonic)
+    _tidur = staticmethod(time.sleep)
+
+    def __init__(
+        self,
+        laju=None,
+        kapasitas=None,
+        kuota_harian=None,
+        lokasi_kuota=None,
+        nama_kuota="bawaan",
+    ):
+        """Membuat pembatas laju baru.
+
+        :param laju: Jumlah permintaan per detik, None berarti tidak
+            dibatasi
+        :type laju: int atau float
+        :param kapasitas: Jumlah maksimum permintaan yang dapat dilakukan
+            sekaligus (bawaan: laju, minimal 1)
+        :type kapasitas: int
+        :param kuota_harian: Jumlah maksimum permintaan dalam sehari, None
+            berarti tidak dibatasi
+        :type kuota_harian: int
+        :param lokasi_kuota: Lokasi berkas basis data kuota harian
+        :type lokasi_kuota: str atau PathLike
+        :param nama_kuota: Nama kuota harian, pembatas dengan nama dan lokasi
+            kuota yang sama menggunakan kuota yang sama
+        :type nama_kuota: str
+        """
+        self.laju = laju
+        self.kapasitas = kapasitas or max(1, laju or 1)
+        self.kuota_harian = kuota_harian
+        self.nama_kuota = nama_kuota
+        self._token = self.kapasitas
+        self._terakhir = self._waktu()
+        self._kunci = threading.Lock()
+        self._koneksi = None
+        if kuota_harian is not None:
+            self.lokasi_kuota = Path(lokasi_kuota or self.lokasi_kuota)
+            self.lokasi_kuota.parent.mkdir(parents=True, exist_ok=True)
+            import sqlite3
+
+            self._koneksi = sqlite3.connect(
+                str(self.lokasi_kuota),
+                check_same_thread=False,
+                isolation_level=None,
+                timeout=30,
+            )
+            self._koneksi.execute(
+                "CREATE TABLE IF NOT EXISTS kuota ("
+                "tanggal TEXT NOT NULL, "
+                "nama TEXT NOT NULL, "
+                "terpakai INTEGER NOT NULL, "
+                "habis INTEGER NOT NULL, "
+                "PRIMARY KEY (tanggal, nama))"
+            )
+
+    @staticmethod
+    def _tanggal():
+        return datetime.now(_WIB).date().isoformat()
+
+    def _pakai_kuota(self):
+        kunci = (self._tanggal(), self.nama_kuota)
+        self._koneksi.execute("BEGIN IMMEDIATE")
+        try:
+            self._koneksi.execute(
+                "INSERT OR IGNORE INTO kuota VALUES (?, ?, 0, 0)", kunci
+            )
+            terpakai, habis = self._koneksi.execute(
+                "SELECT terpakai, habis FROM kuota "
+                "WHERE tanggal = ? AND nama = ?",
+                kunci,
+            ).fetchone()
+            if habis or terpakai >= self.kuota_harian:
+                raise KuotaHabis()
+            self._koneksi.execute(
+                "UPDATE kuota SET terpakai = terpakai + 1 "
+                "WHERE tanggal = ? AND nama = ?",
+                kunci,
+            )
+        finally:
+            self._koneksi.execute("COMMIT")
+
+    def ambil(self):
+        """Mengambil izin untuk melakukan sebuah permintaan.
+
+        Method ini akan menunggu hingga token tersedia. Galat KuotaHabis
+        akan dimunculkan jika kuota harian telah habis.
+
+        :returns: Lama waktu menunggu (dalam detik)
+        :rtype: float
+        """
+        with self._kunci:
+            if self._koneksi is not None:
+                self._pakai_kuota()
+            if self.laju is None:
+                return 0
+            sekarang = self._waktu()
+            self._token = min(
+                self.kapasitas,
+                self._token + (sekarang - self._terakhir) * self.laju,
+            )
+            self._terakhir = sekarang
+            self._token -= 1
+            tunggu = max(0, -self._token / self.laju)
+        if tunggu:
+            self._tidur(tunggu)
+        return tunggu
+
+    def sisa_kuota(self):
+        """Mengembalikan sisa kuota harian.
+
+        :returns: Sisa kuota hari ini atau None jika kuota tidak dibatasi
+        :rtype: int
+        """
+        if self._koneksi is None:
+            return None
+        with self._kunci:
+            baris = self._koneksi.execute(
+                "SELECT terpakai, habis FROM kuota "
+                "WHERE tanggal = ? AND nama = ?",
+                (self._tanggal(), self.nama_kuota),
+            ).fetchone()
+        if baris is None:
+            return self.kuota_harian
+        terpakai, habis = baris
+        return 0 if habis else max(0, self.kuota_harian - terpakai)
+
+    def tandai_habis(self):
+        """Menandai kuota hari ini telah habis, misalnya setelah KBBI Daring
+        menyatakan pencarian telah mencapai batas maksimum dalam sehari."""
+        if self._koneksi is None:
+            return
+        kunci = (self._tanggal(), self.nama_kuota)
+        with self._kunci:
+            self._koneksi.execute("BEGIN IMMEDIATE")
+            self._koneksi.execute(
+                "INSERT OR IGNORE INTO kuota VALUES (?, ?, 0, 0)", kunci
+            )
+            self._koneksi.execute(
+                "UPDATE kuota SET habis = 1 WHERE tanggal = ? AND nama = ?",
+                kunci,
+            )
+            self._koneksi.execute("COMMIT")
+
+    def tutup(self):
+        """Menutup koneksi ke basis data kuota."""
+        if self._koneksi is not None:
+            self._koneksi.close()
+            self._koneksi = None
@@ -0,0 +1,494 @@
+"""
+:mod:`kbbi.pengekstrak` -- Pengekstrak entri KBBI Python
+========================================================
+
+.. module:: kbbi.pengekstrak
+   :platform: Unix, Windows, Mac
+   :synopsis: Modul ini mengandung pengekstrak entri berbasis peristiwa.
+.. moduleauthor:: sage <laymonage@gmail.com>
+
+Pengekstrak ini membaca bagian entri laman KBBI Daring (tata letak untuk
+pengguna yang tidak terautentikasi) dalam satu lintasan atas peristiwa
+html.parser.HTMLParser tanpa membangun pohon BeautifulSoup. Hanya label yang
+sedang terbuka yang disimpan dalam tumpukan. Hasilnya berupa objek Entri,
+Makna, dan KelasKata yang sama dengan hasil penguraian dengan BeautifulSoup
+(yang tetap menjadi implementasi acuan).
+"""
+
+import sys
+from html.parser import HTMLParser
+
+from .kbbi import Entri, KelasKata, LamanTidakValid, Makna
+
+_LABEL_KOSONG = frozenset(
+    (
+        "area",
+        "base",
+        "br",
+        "col",
+        "embed",
+        "hr",
+        "img",
+        "input",
+        "link",
+        "meta",
+        "param",
+        "source",
+        "track",
+        "wbr",
+    )
+)
+
+
+class _Selesai(Exception):
+    pass
+
+
+class _Simpul:
+    """Label yang sedang terbuka beserta data untuk menentukan .string-nya."""
+
+    __slots__ = ("nama", "anak", "string", "tangkapan")
+
+    def __init__(self, nama):
+        self.nama = nama
+        self.anak = 0
+        self.string = None
+        self.tangkapan = 0
+
+
+class _Tautan:
+    """Label <a> (atau <b> dalam varian) beserta teks dan <sup>-nya."""
+
+    __slots__ = ("kedalaman", "buka", "teks", "sup", "merah")
+
+    def __init__(self, kedalaman):
+        self.kedalaman = kedalaman
+        self.buka = True
+        self.teks = []
+        self.sup = None
+        self.merah = False
+
+
+class _Kelas:
+    __slots__ = ("judul", "teks")
+
+    def __init__(self, judul, teks):
+        self.judul = judul
+        self.teks = teks
+
+
+def _gabung(bagian):
+    return bagian if isinstance(bagian, str) else "".join(bagian)
+
+
+def _kelas_kata(kode, judul):
+    pisah = judul.strip().split(": ")
+    nama = pisah[0].strip()
+    deskripsi = pisah[1].strip() if len(pisah) > 1 else ""
+    return KelasKata.buat(kode, nama, deskripsi)
+
+
+class _Makna:
+    """Data yang dikumpulkan dari sebuah <li> atau label prakategorial."""
+
+    __slots__ = (
+        "kedalaman",
+        "prakategorial",
+        "judul",
+        "buka",
+        "teks",
+        "bagian",
+        "tautan",
+        "merah",
+        "merah_buka",
+        "kelas",
+        "hijau",
+        "saudara",
+        "tunggu",
+    )
+
+    def __init__(self, kedalaman, teks, prakategorial=False, judul=""):
+        self.kedalaman = kedalaman
+        self.prakategorial = prakategorial
+        self.judul = judul
+        self.buka = True
+        self.teks = teks
+        self.bagian = []
+        self.tautan = None
+        self.merah = None
+        self.merah_buka = False
+        self.kelas = []
+        self.hijau = None
+        self.saudara = []
+        self.tunggu = 0
+
+    def buat(self):
+        makna = Makna.__new__(Makna)
+        teks = "".join(self.teks)
+        tautan = self.tautan
+        if self.prakategorial:
+            submakna = " ".join(_gabung(s).strip() for s in self.saudara)
+            makna.kelas = [_kelas_kata(teks.strip(), self.judul)]
+        else:
+            if tautan is not None and not tautan.merah:
+                submakna = "→ " + "".join(t.strip() for t in tautan.teks)
+                if tautan.sup is not None:
+                    submakna += f" ({''.join(tautan.sup).strip()})"
+            else:
+                submakna = "".join(b or "" for b in self.bagian)
+                submakna = submakna.strip().rstrip(":")
+            makna.kelas = [
+                _kelas_kata("".join(k.teks).strip(), k.judul)
+                for k in self.kelas
+            ]
+        makna.info = ""
+        if self.hijau is not None:
+            info = "".join(self.hijau).strip()
+            if not any(info == k["kode"] for k in makna.kelas):
+                makna.info = sys.intern(info)
+        indeks = teks.find(": ")
+        if indeks != -1:
+            makna.contoh = teks[indeks + 2 :].strip().split("; ")
+        else:
+            makna.contoh = []
+        makna.submakna = submakna.split("; ")
+        return makna
+
+
+class _Entri:
+    """Data yang dikumpulkan dari label-label sebuah entri."""
+
+    def __init__(self):
+        self.judul = None
+        self.judul_buka = False
+        self.nama = []
+        self.italic = None
+        self.italic_buka = False
+        self.nama_italic = []
+        self.nomor = None
+        self.akar = None
+        self.akar_kedalaman = None
+        self.kata_dasar = []
+        self.pelafalan = None
+        self.kecil = None
+        self.kecil_buka = False
+        self.varian = None
+        self.tebal = None
+        self.bentuk_tidak_baku = []
+        self.makna = []
+        self.prakategorial = None
+
+    def buat(self):
+        entri = Entri.__new__(Entri)
+        entri._entri = entri._kunci = None
+        entri.terautentikasi = False
+        nama = self.nama if self.italic is None else self.nama_italic
+        entri.nama = "".join(t.strip() for t in nama)
+        entri.nomor = "".join(self.nomor or ()).strip()
+        entri.kata_dasar = []
+        for akar in self.kata_dasar:
+            kata = "".join(t.strip() for t in akar.teks)
+            if akar.sup is not None:
+                kata = f"{kata} ({''.join(akar.sup).strip()})"
+            entri.kata_dasar.append(kata)
+        entri.pelafalan = "".join(self.pelafalan or ()).strip()
+        entri.bentuk_tidak_baku = []
+        entri.varian = []
+        if self.bentuk_tidak_baku:
+            for tebal in self.bentuk_tidak_baku:
+                nama = "".join(tebal.teks[:1]).strip().lstrip(", ")
+                if tebal.sup is not None:
+                    nama = f"{nama} ({''.join(tebal.sup).strip()})"
+                entri.bentuk_tidak_baku.append(nama)
+        elif self.varian is not None:
+            varian = "".join(self.varian)
+            entri.varian = varian[len("varian: ") :].strip().split(", ")
+        if self.prakategorial is not None:
+            entri.makna = [self.prakategorial.buat()]
+        else:
+            entri.makna = [makna.buat() for makna in self.makna]
+        entri.terkait = None
+        entri.etimologi = None
+        return entri
+
+
+class PengekstrakEntri(HTMLParser):
+    """Pengekstrak entri dari peristiwa-peristiwa html.parser.
+
+    Pengekstrakan dimulai setelah <hr> pertama (awal bagian entri) dan
+    berhenti pada <hr> tanpa atribut style berikutnya yang setingkat.
+    Kedalaman sebuah label adalah panjang tumpukan setelah label tersebut
+    dibuka, sedangkan teks merupakan anak dari label teratas tumpukan.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.entri = []
+        self._tumpukan = []
+        self._teks = []
+        self._tangkapan = []
+        self._mulai = False
+        self._lewati = None
+        self._sekarang = _Entri()
+        self._li = []
+
+    def _tangkap(self):
+        # Daftar ini menerima semua teks hingga label teratas ditutup.
+        tangkapan = []
+        self._tangkapan.append(tangkapan)
+        self._tumpukan[-1].tangkapan += 1
+        return tangkapan
+
+    def handle_data(self, data):
+        if self._mulai:
+            self._teks.append(data)
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in _LABEL_KOSONG:
+            self.handle_endtag(tag)
+
+    def handle_starttag(self, tag, attrs):
+        self._buang_teks()
+        if not self._mulai:
+            self._mulai = tag == "hr"
+            return
+        atribut = dict(attrs)
+        kedalaman = len(self._tumpukan) + 1
+        if self._lewati is None and kedalaman == 1:
+            self._label_teratas(tag, atribut)
+        self._tumpukan.append(_Simpul(tag))
+        if self._lewati is None:
+            self._mulai_label(tag, atribut, kedalaman)
+        if tag in _LABEL_KOSONG:
+            self._tutup()
+
+    def handle_endtag(self, tag):
+        self._buang_teks()
+        if not self._mulai or tag in _LABEL_KOSONG:
+            return
+        for i in range(len(self._tumpukan) - 1, -1, -1):
+            if self._tumpukan[i].nama == tag:
+                break
+        else:
+            return
+        while len(self._tumpukan) > i:
+            self._tutup()
+
+    def _label_teratas(self, tag, atribut):
+        if tag == "hr" and atribut.get("style") is None:
+            raise _Selesai()
+        if tag != "h2":
+            return
+        if atribut.get("style") == "color:gray":  # Lampiran
+            self._lewati = 1
+        elif self._sekarang.judul is not None:
+            self.entri.append(self._sekarang.buat())
+            self._sekarang = _Entri()
+
+    def _mulai_label(self, tag, atribut, kedalaman):
+        entri = self._sekarang
+        warna = atribut.get("color")
+        if entri.judul_buka:
+            self._mulai_judul(entri, tag, atribut, kedalaman)
+        elif tag == "h2" and entri.judul is None:
+            entri.judul = kedalaman
+            entri.judul_buka = True
+        prakategorial = entri.prakategorial
+        if prakategorial is None:
+            if warna == "darkgreen":
+                entri.prakategorial = _Makna(
+                    kedalaman,
+                    self._tangkap(),
+                    prakategorial=True,
+                    judul=atribut.get("title", ""),
+                )
+        elif prakategorial.buka:
+            if warna == "green" and prakategorial.hijau is None:
+                prakategorial.hijau = self._tangkap()
+        elif prakategorial.tunggu in (1, 2):
+            if kedalaman == prakategorial.kedalaman:
+                if prakategorial.tunggu == 1:
+                    prakategorial.saudara.append("")
+                prakategorial.saudara.append(self._tangkap())
+                prakategorial.tunggu = 3
+        for li in self._li:
+            self._mulai_li(li, tag, atribut, warna, kedalaman)
+        if tag == "li":
+            li = _Makna(kedalaman, self._tangkap())
+            entri.makna.append(li)
+            self._li.append(li)
+
+    def _mulai_judul(self, entri, tag, atribut, kedalaman):
+        kelas = (atribut.get("class") or "").split()
+        if tag == "i" and entri.italic is None:
+            entri.italic = kedalaman
+            entri.italic_buka = True
+        elif tag == "sup":
+            if kedalaman == entri.judul + 1 and entri.nomor is None:
+                entri.nomor = self._tangkap()
+            akar = entri.akar
+            if akar is not None and akar.buka and akar.sup is None:
+                akar.sup = self._tangkap()
+            tebal = entri.tebal
+            if tebal is not None and tebal.sup is None:
+                tebal.sup = self._tangkap()
+        elif tag == "a":
+            if entri.akar_kedalaman is not None and entri.akar is None:
+                entri.akar = _Tautan(kedalaman)
+        elif tag == "small" and entri.kecil is None:
+            entri.kecil = kedalaman
+            entri.kecil_buka = True
+            entri.varian = self._tangkap()
+        elif tag == "b" and entri.kecil_buka and entri.tebal is None:
+            entri.tebal = _Tautan(kedalaman)
+        if "rootword" in kelas and entri.akar_kedalaman is None:
+            entri.akar_kedalaman = kedalaman
+        if "syllable" in kelas and entri.pelafalan is None:
+            entri.pelafalan = self._tangkap()
+
+    def _mulai_li(self, li, tag, atribut, warna, kedalaman):
+        tautan = li.tautan
+        if tautan is None:
+            if tag == "a":
+                li.tautan = _Tautan(kedalaman)
+        elif tautan.buka:
+            if tag == "span" and atribut.get("style") == "color:red":
+                tautan.merah = True
+            elif tag == "sup" and tautan.sup is None:
+                tautan.sup = self._tangkap()
+        if li.merah is None:
+            if warna == "red":
+                li.merah = kedalaman
+                li.merah_buka = True
+        elif li.merah_buka and tag == "span":
+            li.kelas.append(_Kelas(atribut.get("title", ""), self._tangkap()))
+        if warna == "green" and li.hijau is None:
+            li.hijau = self._tangkap()
+
+    def _buang_teks(self):
+        if not self._teks:
+            return
+        teks = "".join(self._teks)
+        self._teks = []
+        kedalaman = len(self._tumpukan)
+        if kedalaman:
+            induk = self._tumpukan[-1]
+            induk.anak += 1
+            induk.string = teks
+        if self._lewati is not None:
+            return
+        for tangkapan in self._tangkapan:
+            tangkapan.append(teks)
+        entri = self._sekarang
+        prakategorial = entri.prakategorial
+        if prakategorial is not None and prakategorial.tunggu == 1:
+            if kedalaman == prakategorial.kedalaman - 1:
+                prakategorial.saudara.append(teks)
+                prakategorial.tunggu = 2
+        if entri.judul_buka:
+            if kedalaman == entri.judul:
+                entri.nama.append(teks)
+            if entri.italic_buka and kedalaman == entri.italic:
+                entri.nama_italic.append(teks)
+            akar = entri.akar
+            if akar is not None and akar.buka and kedalaman == akar.kedalaman:
+                akar.teks.append(teks)
+            if entri.tebal is not None:
+                entri.tebal.teks.append(teks)
+        for li in self._li:
+            if kedalaman == li.kedalaman:
+                li.bagian.append(teks)
+            tautan = li.tautan
+            if tautan is not None and tautan.buka:
+                if kedalaman == tautan.kedalaman:
+                    tautan.teks.append(teks)
+
+    def _tutup(self):
+        kedalaman = len(self._tumpukan)
+        simpul = self._tumpukan.pop()
+        if simpul.tangkapan:
+            # Tangkapan label yang lebih dalam sudah dibuang lebih dulu.
+            del self._tangkapan[-simpul.tangkapan :]
+        string = simpul.string if simpul.anak == 1 else None
+        if self._tumpukan:
+            induk = self._tumpukan[-1]
+            induk.anak += 1
+            induk.string = string
+        if self._lewati is not None:
+            if kedalaman == self._lewati:
+                self._lewati = None
+            return
+        entri = self._sekarang
+        prakategorial = entri.prakategorial
+        if prakategorial is not None and prakategorial.buka:
+            if kedalaman == prakategorial.kedalaman:
+                prakategorial.buka = False
+                prakategorial.tunggu = 1
+        if entri.judul_buka:
+            self._tutup_judul(entri, kedalaman)
+        for li in self._li:
+            if kedalaman == li.kedalaman + 1 and simpul.nama != "font":
+                li.bagian.append(string)
+            tautan = li.tautan
+            if tautan is not None and tautan.buka:
+                tautan.buka = kedalaman != tautan.kedalaman
+            if li.merah_buka:
+                li.merah_buka = kedalaman != li.merah
+        if self._li and kedalaman == self._li[-1].kedalaman:
+            self._li.pop()
+
+    def _tutup_judul(self, entri, kedalaman):
+        if entri.italic_buka:
+            entri.italic_buka = kedalaman != entri.italic
+        akar = entri.akar
+        if akar is not None and akar.buka:
+            akar.buka = kedalaman != akar.kedalaman
+        if kedalaman == entri.akar_kedalaman:
+            if akar is not None:
+                entri.kata_dasar.append(akar)
+            entri.akar = entri.akar_kedalaman = None
+        tebal = entri.tebal
+        if tebal is not None and kedalaman == tebal.kedalaman:
+            entri.bentuk_tidak_baku.append(tebal)
+            entri.tebal = None
+        if entri.kecil_buka:
+            entri.kecil_buka = kedalaman != entri.kecil
+        entri.judul_buka = kedalaman != entri.judul
+
+    def selesai(self):
+        """Mengakhiri pengekstrakan dan mengembalikan daftar Entri.
+
+        :returns: Daftar objek Entri
+        :rtype: list
+        """
+        self._buang_teks()
+        if self._sekarang.judul is not None:
+            self.entri.append(self._sekarang.buat())
+            self._sekarang = _Entri()
+        return self.entri
+
+
+def ekstrak_entri(html, kueri=None):
+    """Mengekstrak entri-entri dari HTML laman KBBI Daring.
+
+    Hanya tata letak untuk pengguna yang tidak terautentikasi yang didukung
+    (tanpa etimologi dan kata terkait).
+
+    :param html: HTML laman KBBI Daring
+    :type html: str
+    :param kueri: Kata kunci pencarian laman tersebut (untuk pesan galat)
+    :type kueri: str
+    :returns: Daftar objek Entri
+    :rtype: list
+    :raises LamanTidakValid: jika bagian entri tidak diakhiri <hr>
+        (misalnya laman terpotong)
+    """
+    pengekstrak = PengekstrakEntri()
+    try:
+        pengekstrak.feed(html)
+    except _Selesai:
+        return pengekstrak.selesai()
+    if pengekstrak._mulai:
+        raise LamanTidakValid(kueri)
+    return pengekstrak.selesai()
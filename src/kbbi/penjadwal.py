@@ -0,0 +1,117 @@
+"""
+:mod:`kbbi.penjadwal` -- Penjadwal pencarian KBBI Python
+========================================================
+
+.. module:: kbbi.penjadwal
+   :platform: Unix, Windows, Mac
+   :synopsis: Modul ini mengandung penjadwal pencarian berprioritas.
+.. moduleauthor:: sage <laymonage@gmail.com>
+"""
+
+import heapq
+import threading
+
+from .kbbi import (
+    KBBI,
+    BatasSehari,
+    Galat,
+    HasilPencarian,
+    TidakDitemukan,
+    _ModulMalas,
+    _petakan,
+)
+
+requests = _ModulMalas("requests", globals())
+
+
+class PenjadwalPencarian:
+    """Penjadwal pencarian yang mendahulukan kueri dengan prioritas tertinggi.
+
+    Pencarian dihentikan ketika kuota harian habis (KuotaHabis) atau KBBI
+    Daring menyatakan batas sehari telah tercapai (BatasSehari). Kueri yang
+    belum dicari tetap berada dalam antrean sehingga dapat dilanjutkan
+    kemudian.
+    """
+
+    kelas_kbbi = KBBI
+
+    def __init__(self, auth=None, pekerja=4, **kwargs):
+        """Membuat penjadwal pencarian baru.
+
+        Argumen lainnya (misalnya pembatas) akan diteruskan ke konstruktor
+        KBBI.
+
+        :param auth: objek AutentikasiKBBI
+        :type auth: AutentikasiKBBI
+        :param pekerja: Jumlah maksimum pencarian yang berjalan bersamaan
+        :type pekerja: int
+        """
+        self.auth = auth
+        self.pekerja = pekerja
+        self.kwargs = kwargs
+        self._antrean = []
+        self._urutan = 0
+        self._kunci = threading.Lock()
+        self.galat = None
+
+    def tambah(self, kueri, prioritas=0):
+        """Menambahkan kueri ke dalam antrean.
+
+        :param kueri: Kata kunci pencarian
+        :type kueri: str
+        :param prioritas: Prioritas kueri, semakin besar semakin didahulukan
+        :type prioritas: int atau float
+        """
+        with self._kunci:
+            heapq.heappush(self._antrean, (-prioritas, self._urutan, kueri))
+            self._urutan += 1
+
+    def _ambil_antrean(self):
+        while self.galat is None:
+            with self._kunci:
+                if not self._antrean:
+                    return
+                item = heapq.heappop(self._antrean)
+            yield item
+
+    def _cari(self, item):
+        if self.galat is not None:
+            with self._kunci:
+                heapq.heappush(self._antrean, item)
+            return None
+        kueri = item[2]
+        try:
+            objek = self.kelas_kbbi(kueri, self.auth, **self.kwargs)
+        except BatasSehari as e:
+            with self._kunci:
+                heapq.heappush(self._antrean, item)
+                self.galat = e
+            return None
+        except TidakDitemukan as e:
+            return HasilPencarian(kueri, e.objek, e)
+        except (Galat, requests.RequestException) as e:
+            return HasilPencarian(kueri, None, e)
+        return HasilPencarian(kueri, objek, None)
+
+    def jalankan(self):
+        """Menjalankan pencarian sesuai urutan prioritas.
+
+        :returns: Generator HasilPencarian sesuai urutan selesainya
+        :rtype: generator
+        """
+        self.galat = None
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(self.pekerja) as eksekutor:
+            for hasil in _petakan(
+                eksekutor,
+                self._cari,
+                self._ambil_antrean(),
+                self.pekerja,
+                berurutan=False,
+            ):
+                if hasil is not None:
+                    yield hasil
+
+    def __len__(self):
+        return len(self._antrean)
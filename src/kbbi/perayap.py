@@ -0,0 +1,466 @@
+"""
+:mod:`kbbi.perayap` -- Perayap KBBI Python
+==========================================
+
+.. module:: kbbi.perayap
+   :platform: Unix, Windows, Mac
+   :synopsis: Modul ini mengandung implementasi perayap untuk kbbi.
+.. moduleauthor:: sage <laymonage@gmail.com>
+
+Perayap menelusuri KBBI Daring mulai dari kata-kata benih melalui kata dasar,
+kata terkait (kata turunan, gabungan kata, peribahasa, dan idiom), serta
+makna rujukan (makna yang diawali "→") setiap entri.
+
+Keadaan perayapan dicatat dalam sebuah jurnal (JSON Lines) yang hanya
+ditambahi: setiap kueri yang masuk antrean dan setiap kueri yang selesai
+dicatat satu baris. Perayapan yang terhenti (misalnya karena BatasSehari)
+dapat dilanjutkan dari jurnal tersebut tanpa mengambil ulang laman yang
+telah selesai.
+"""
+
+import argparse
+import json
+import re
+import sys
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+
+import requests
+
+from .kbbi import (
+    KBBI,
+    AkunDibekukan,
+    AutentikasiKBBI,
+    BatasSehari,
+    Galat,
+    HasilPencarian,
+    KukiTidakDitemukan,
+    LamanTidakValid,
+    SirkuitTerbuka,
+    TerjadiKesalahan,
+    TidakAdaDiTembolok,
+    TidakDitemukan,
+    _jumlah_pekerja,
+)
+from .pembatas import PembatasLaju
+from .tembolok import TembolokObjek
+
+JENIS_TAUTAN = (
+    "kata_dasar",
+    "kata_turunan",
+    "gabungan_kata",
+    "peribahasa",
+    "idiom",
+    "rujukan",
+)
+
+# Galat yang menghentikan perayapan; kueri tersebut dikembalikan ke antrean
+# sehingga diambil ulang ketika perayapan dilanjutkan.
+_GALAT_BERHENTI = (
+    BatasSehari,
+    AkunDibekukan,
+    SirkuitTerbuka,
+    TerjadiKesalahan,
+    LamanTidakValid,
+    requests.RequestException,
+)
+
+_NOMOR_HOMONIM = re.compile(r"\s*\(\d+\)$")
+
+
+def _kueri_tautan(teks):
+    teks = _NOMOR_HOMONIM.sub("", teks.lstrip("→").strip())
+    return TembolokObjek.normalisasi(teks)
+
+
+def ambil_tautan(kbbi, jenis_tautan=JENIS_TAUTAN):
+    """Mengambil kueri-kueri yang ditautkan oleh entri-entri sebuah laman.
+
+    Nomor homonim (misalnya "(2)" pada "campak (2)") dihapus dari kueri.
+
+    :param kbbi: Objek KBBI yang tautannya akan diambil
+    :type kbbi: KBBI
+    :param jenis_tautan: Jenis tautan yang diambil, lihat JENIS_TAUTAN
+    :type jenis_tautan: iterable
+    :returns: Kueri-kueri tanpa duplikat sesuai urutan kemunculannya
+    :rtype: list
+    """
+    jenis_tautan = set(jenis_tautan)
+    tautan = {}
+    for entri in kbbi.entri:
+        if "kata_dasar" in jenis_tautan:
+            for kata in entri.kata_dasar:
+                tautan.setdefault(_kueri_tautan(kata))
+        for jenis, daftar in (entri.terkait or {}).items():
+            if jenis in jenis_tautan:
+                for kata in daftar:
+                    tautan.setdefault(_kueri_tautan(kata))
+        if "rujukan" in jenis_tautan:
+            for makna in entri.makna:
+                for submakna in makna.submakna:
+                    if submakna.startswith("→"):
+                        tautan.setdefault(_kueri_tautan(submakna))
+    tautan.pop("", None)
+    return list(tautan)
+
+
+class Perayap:
+    """Perayap yang menelusuri KBBI Daring secara bersamaan.
+
+    Perayapan dihentikan ketika batas pencarian harian tercapai
+    (BatasSehari, termasuk KuotaHabis dari PembatasLaju), akun dibekukan,
+    sirkuit KebijakanCobaUlang terbuka, atau terjadi galat sementara
+    lainnya (misalnya galat jaringan atau respons HTTP 5xx). Kueri yang
+    belum selesai tetap tercatat di jurnal sehingga perayapan dapat
+    dilanjutkan dengan membuat Perayap baru dengan jurnal yang sama.
+    """
+
+    kelas_kbbi = KBBI
+
+    def __init__(
+        self,
+        benih=(),
+        auth=None,
+        jurnal=None,
+        pekerja=4,
+        jenis_tautan=JENIS_TAUTAN,
+        kedalaman_maks=None,
+        **kwargs,
+    ):
+        """Membuat perayap baru atau melanjutkan perayapan dari jurnal.
+
+        Argumen lainnya (misalnya pembatas dan coba_ulang) akan diteruskan
+        ke konstruktor KBBI.
+
+        :param benih: Kumpulan kueri awal (kueri yang sudah pernah masuk
+            antrean dalam jurnal akan diabaikan)
+        :type benih: iterable
+        :param auth: objek AutentikasiKBBI (kata terkait hanya tersedia
+            untuk pengguna terautentikasi)
+        :type auth: AutentikasiKBBI
+        :param jurnal: Lokasi berkas jurnal, tanpa jurnal perayapan tidak
+            dapat dilanjutkan
+        :type jurnal: str atau PathLike
+        :param pekerja: Jumlah maksimum pencarian yang berjalan bersamaan
+        :type pekerja: int
+        :param jenis_tautan: Jenis tautan yang diikuti, lihat JENIS_TAUTAN
+        :type jenis_tautan: iterable
+        :param kedalaman_maks: Kedalaman maksimum dari kueri benih (None
+            untuk tanpa batas)
+        :type kedalaman_maks: int
+        """
+        self.auth = auth
+        self.pekerja = pekerja
+        self.jenis_tautan = tuple(jenis_tautan)
+        self.kedalaman_maks = kedalaman_maks
+        self.kwargs = kwargs
+        self.galat = None
+        self.jumlah_selesai = 0
+        self._antrean = deque()
+        self._dikenal = set()
+        self._jurnal = None
+        if jurnal is not None:
+            self._muat_jurnal(jurnal)
+            self._jurnal = open(jurnal, "a", encoding="utf-8")
+        self.tambah(benih)
+
+    def _muat_jurnal(self, lokasi):
+        try:
+            berkas = open(lokasi, encoding="utf-8")
+        except FileNotFoundError:
+            return
+        antre = {}
+        selesai = set()
+        with berkas:
+            for baris in berkas:
+                try:
+                    catatan = json.loads(baris)
+                except ValueError:
+                    continue  # baris terakhir yang tidak selesai ditulis
+                for kueri, kedalaman in catatan.get("antre", ()):
+                    antre.setdefault(kueri, kedalaman)
+                if "selesai" in catatan:
+                    selesai.add(catatan["selesai"])
+        self._dikenal.update(antre)
+        self.jumlah_selesai = len(selesai)
+        self._antrean.extend(
+            (kueri, kedalaman)
+            for kueri, kedalaman in antre.items()
+            if kueri not in selesai
+        )
+
+    def _catat(self, catatan):
+        if self._jurnal is not None:
+            self._jurnal.write(json.dumps(catatan, ensure_ascii=False) + "\n")
+            self._jurnal.flush()
+
+    def tambah(self, daftar_kueri, kedalaman=0):
+        """Menambahkan kueri-kueri yang belum dikenal ke dalam antrean.
+
+        :param daftar_kueri: Kumpulan kata kunci pencarian
+        :type daftar_kueri: iterable
+        :param kedalaman: Kedalaman kueri-kueri tersebut
+        :type kedalaman: int
+        """
+        baru = []
+        for kueri in daftar_kueri:
+            kueri = TembolokObjek.normalisasi(kueri)
+            if kueri and kueri not in self._dikenal:
+                self._dikenal.add(kueri)
+                baru.append((kueri, kedalaman))
+        if baru:
+            self._antrean.extend(baru)
+            self._catat({"antre": baru})
+
+    def _cari(self, kueri):
+        try:
+            objek = self.kelas_kbbi(kueri, self.auth, **self.kwargs)
+        except TidakDitemukan as e:
+            return HasilPencarian(kueri, e.objek, e)
+        except (Galat, requests.RequestException) as e:
+            return HasilPencarian(kueri, None, e)
+        return HasilPencarian(kueri, objek, None)
+
+    def jalankan(self):
+        """Menjalankan perayapan hingga antrean habis atau terhenti.
+
+        Kueri baru dicatat selesai di jurnal setelah hasilnya diproses oleh
+        pemanggil (yaitu ketika generator dilanjutkan), sehingga hasil yang
+        belum sempat diproses akan diambil ulang ketika perayapan
+        dilanjutkan.
+
+        Galat sementara (BatasSehari, AkunDibekukan, SirkuitTerbuka, galat
+        jaringan, serta respons galat atau laman yang tidak dapat diurai)
+        menghentikan perayapan dan kueri tersebut dikembalikan ke antrean.
+        Kueri yang tidak ada di tembolok dalam mode luring tidak dicatat
+        selesai sehingga akan diambil ketika perayapan dilanjutkan.
+
+        :returns: Generator HasilPencarian sesuai urutan selesainya (tidak
+            termasuk kueri yang terhenti karena galat sementara)
+        :rtype: generator
+        """
+        self.galat = None
+        tertunda = {}
+        with ThreadPoolExecutor(self.pekerja) as eksekutor:
+            while True:
+                while (
+                    self._antrean
+                    and self.galat is None
+                    and len(tertunda) < self.pekerja
+                ):
+                    kueri, kedalaman = self._antrean.popleft()
+                    tugas = eksekutor.submit(self._cari, kueri)
+                    tertunda[tugas] = kedalaman
+                if not tertunda:
+                    break
+                selesai, _ = wait(tertunda, return_when=FIRST_COMPLETED)
+                for tugas in selesai:
+                    kedalaman = tertunda.pop(tugas)
+                    hasil = tugas.result()
+                    if isinstance(hasil.galat, _GALAT_BERHENTI):
+                        self.galat = hasil.galat
+                        self._antrean.appendleft((hasil.kueri, kedalaman))
+                        continue
+                    if hasil.objek is not None and (
+                        self.kedalaman_maks is None
+                        or kedalaman < self.kedalaman_maks
+                    ):
+                        self.tambah(
+                            ambil_tautan(hasil.objek, self.jenis_tautan),
+                            kedalaman + 1,
+                        )
+                    yield hasil
+                    if isinstance(hasil.galat, TidakAdaDiTembolok):
+                        continue
+                    catatan = {"selesai": hasil.kueri}
+                    if hasil.objek is None:
+                        catatan["galat"] = str(hasil.galat)
+                    self._catat(catatan)
+                    self.jumlah_selesai += 1
+
+    def tutup(self):
+        """Menutup berkas jurnal."""
+        if self._jurnal is not None:
+            self._jurnal.close()
+            self._jurnal = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.tutup()
+
+    def __len__(self):
+        return len(self._antrean)
+
+
+def _parse_args(args):
+    parser = argparse.ArgumentParser(
+        description=(
+            "Menelusuri KBBI Daring dari kata-kata benih dan menuliskan hasil"
+            " serialisasi setiap laman yang ditemukan dalam JSON Lines."
+        ),
+        epilog=(
+            "Jika perayapan terhenti, jalankan kembali perintah yang sama"
+            " untuk melanjutkannya."
+        ),
+        add_help=False,
+    )
+    parser.add_argument(
+        "benih",
+        help="kata-kata benih (gunakan - untuk masukan standar)",
+        nargs="*",
+    )
+    parser.add_argument(
+        "-h",
+        "-b",
+        "--help",
+        "--bantuan",
+        action="help",
+        default=argparse.SUPPRESS,
+        help="tampilkan pesan bantuan ini dan keluar",
+    )
+    parser.add_argument(
+        "-o",
+        "--keluaran",
+        help="berkas JSON Lines tujuan (ditambahi, bawaan: keluaran standar)",
+        metavar="BERKAS",
+    )
+    parser.add_argument(
+        "-j",
+        "--jurnal",
+        help="berkas jurnal untuk melanjutkan perayapan yang terhenti",
+        metavar="BERKAS",
+    )
+    parser.add_argument(
+        "--pekerja",
+        help=(
+            "jumlah laman yang diambil bersamaan (bawaan: 4, atau dua kali"
+            " jumlah proses jika --proses diberikan)"
+        ),
+        type=int,
+        metavar="N",
+    )
+    parser.add_argument(
+        "--proses",
+        help="jumlah proses untuk menguraikan laman (0: sejumlah inti CPU)",
+        type=int,
+        metavar="N",
+    )
+    parser.add_argument(
+        "--kedalaman",
+        help="kedalaman maksimum dari kata benih (bawaan: tanpa batas)",
+        type=int,
+        metavar="N",
+    )
+    parser.add_argument(
+        "--tautan",
+        help=(
+            "jenis tautan yang diikuti, dipisahkan koma (bawaan: "
+            f"{','.join(JENIS_TAUTAN)})"
+        ),
+        default=",".join(JENIS_TAUTAN),
+        metavar="JENIS",
+    )
+    parser.add_argument(
+        "--laju",
+        help="jumlah maksimum permintaan per detik",
+        type=float,
+        metavar="N",
+    )
+    parser.add_argument(
+        "--kuota-harian",
+        help="jumlah maksimum permintaan per hari",
+        type=int,
+        metavar="N",
+    )
+    parser.add_argument(
+        "--lokasi-kuki",
+        "-l",
+        help="lokasi menuju berkas kuki yang akan digunakan untuk autentikasi",
+        metavar="L",
+    )
+    return parser.parse_args(args)
+
+
+def main(argv=None):
+    """Program CLI untuk menjalankan perayap."""
+    if argv is None:
+        argv = sys.argv[1:]
+    args = _parse_args(argv)
+    jenis_tautan = [j.strip() for j in args.tautan.split(",") if j.strip()]
+    tidak_dikenal = set(jenis_tautan) - set(JENIS_TAUTAN)
+    if tidak_dikenal:
+        print(
+            f"Jenis tautan tidak dikenal: {', '.join(sorted(tidak_dikenal))}"
+        )
+        return 1
+    auth = None
+    lokasi_kuki = AutentikasiKBBI.lokasi_kuki
+    if args.lokasi_kuki:
+        lokasi_kuki = Path(args.lokasi_kuki)
+    if lokasi_kuki.exists():
+        auth = AutentikasiKBBI(lokasi_kuki=lokasi_kuki)
+    elif args.lokasi_kuki:
+        print(KukiTidakDitemukan(lokasi_kuki, posel_sandi=False))
+        return 1
+    kwargs = {}
+    if args.laju or args.kuota_harian:
+        kwargs["pembatas"] = PembatasLaju(
+            laju=args.laju, kuota_harian=args.kuota_harian
+        )
+    if args.proses is not None:
+        from concurrent.futures import ProcessPoolExecutor
+
+        kwargs["eksekutor_urai"] = ProcessPoolExecutor(args.proses or None)
+    benih = []
+    for kueri in args.benih:
+        if kueri == "-":
+            benih.extend(baris.strip() for baris in sys.stdin)
+        else:
+            benih.append(kueri)
+    keluaran = sys.stdout
+    if args.keluaran:
+        keluaran = open(args.keluaran, "a", encoding="utf-8")
+    try:
+        with Perayap(
+            benih,
+            auth,
+            jurnal=args.jurnal,
+            pekerja=_jumlah_pekerja(args.pekerja, args.proses, 4),
+            jenis_tautan=jenis_tautan,
+            kedalaman_maks=args.kedalaman,
+            **kwargs,
+        ) as perayap:
+            for hasil in perayap.jalankan():
+                if hasil.galat is None:
+                    keluaran.write(
+                        json.dumps(
+                            hasil.objek.serialisasi(), ensure_ascii=False
+                        )
+                        + "\n"
+                    )
+                    keluaran.flush()
+                elif not isinstance(hasil.galat, TidakDitemukan):
+                    print(f"{hasil.kueri}: {hasil.galat}", file=sys.stderr)
+    finally:
+        if keluaran is not sys.stdout:
+            keluaran.close()
+        if "pembatas" in kwargs:
+            kwargs["pembatas"].tutup()
+        if "eksekutor_urai" in kwargs:
+            kwargs["eksekutor_urai"].shutdown()
+    print(
+        f"{perayap.jumlah_selesai} laman selesai, {len(perayap)} laman"
+        " dalam antrean.",
+        file=sys.stderr,
+    )
+    if perayap.galat is not None:
+        print(perayap.galat, file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,189 @@
+"""
+:mod:`kbbi.saran` -- Indeks saran KBBI Python
+=============================================
+
+.. module:: kbbi.saran
+   :platform: Unix, Windows, Mac
+   :synopsis: Modul ini mengandung indeks saran entri tanpa jaringan.
+.. moduleauthor:: sage <laymonage@gmail.com>
+"""
+
+
+class IndeksSaran:
+    """Indeks kata untuk mencari saran entri yang mirip tanpa jaringan.
+
+    Setiap kata disimpan bersama varian-varian hasil penghapusan hingga
+    jarak_maks huruf dari awalannya (seperti SymSpell) sehingga pencarian
+    hanya perlu menghitung jarak edit terhadap sedikit kandidat. Saran
+    diurutkan berdasarkan jarak edit, lalu urutan kata saat ditambahkan
+    (misalnya dari yang paling sering digunakan).
+    """
+
+    def __init__(self, daftar_kata=(), jarak_maks=2, panjang_awalan=7):
+        """Membuat indeks saran baru.
+
+        :param daftar_kata: Kumpulan kata yang akan dimasukkan ke indeks
+        :type daftar_kata: iterable
+        :param jarak_maks: Jarak edit maksimum antara kueri dan saran
+        :type jarak_maks: int
+        :param panjang_awalan: Panjang awalan kata yang diindeks
+        :type panjang_awalan: int
+        """
+        self.jarak_maks = jarak_maks
+        self.panjang_awalan = panjang_awalan
+        self._kata = {}
+        self._hapusan = {}
+        for kata in daftar_kata:
+            self.tambah(kata)
+
+    @classmethod
+    def dari_berkas(cls, lokasi, **kwargs):
+        """Membuat indeks saran dari berkas berisi satu kata per baris.
+
+        Argumen lainnya akan diteruskan ke konstruktor IndeksSaran.
+
+        :param lokasi: Lokasi berkas daftar kata
+        :type lokasi: str atau PathLike
+        :returns: Objek IndeksSaran berisi kata-kata dalam berkas
+        :rtype: IndeksSaran
+        """
+        with open(lokasi, encoding="utf-8") as berkas:
+            return cls(berkas, **kwargs)
+
+    @staticmethod
+    def _varian(kata, jarak):
+        hasil = {kata}
+        lapisan = {kata}
+        for _ in range(jarak):
+            lapisan = {
+                k[:i] + k[i + 1 :] for k in lapisan for i in range(len(k))
+            }
+            hasil |= lapisan
+        return hasil
+
+    def tambah(self, kata):
+        """Menambahkan sebuah kata ke dalam indeks.
+
+        :param kata: Kata yang akan ditambahkan
+        :type kata: str
+        """
+        kata = " ".join(kata.split())
+        kunci = kata.lower()
+        if not kunci:
+            return
+        if kunci in self._kata:
+            bentuk = self._kata[kunci][1]
+            if kata not in bentuk:
+                bentuk.append(kata)
+            return
+        self._kata[kunci] = (len(self._kata), [kata])
+        awalan = kunci[: self.panjang_awalan]
+        for varian in self._varian(awalan, self.jarak_maks):
+            ada = self._hapusan.get(varian)
+            if ada is None:
+                self._hapusan[varian] = kunci
+            elif isinstance(ada, str):
+                self._hapusan[varian] = [ada, kunci]
+            else:
+                ada.append(kunci)
+
+    def saran(self, kueri, batas=10, jarak_maks=None):
+        """Mencari kata-kata dalam indeks yang mirip dengan kueri.
+
+        :param kueri: Kata yang dicari
+        :type kueri: str
+        :param batas: Jumlah maksimum saran yang dikembalikan
+        :type batas: int
+        :param jarak_maks: Jarak edit maksimum (tidak dapat melebihi
+            jarak_maks indeks). Jika tidak diberikan, jarak maksimum untuk
+            kueri dengan panjang 5 huruf atau kurang adalah 1.
+        :type jarak_maks: int
+        :returns: Daftar saran yang terurut dari yang paling mirip
+        :rtype: list
+        """
+        kueri = " ".join(kueri.split()).lower()
+        if jarak_maks is None:
+            jarak_maks = 1 if len(kueri) <= 5 else self.jarak_maks
+        jarak_maks = min(jarak_maks, self.jarak_maks)
+        kandidat = set()
+        for varian in self._varian(kueri[: self.panjang_awalan], jarak_maks):
+            ada = self._hapusan.get(varian)
+            if ada is None:
+                continue
+            if isinstance(ada, str):
+                kandidat.add(ada)
+            else:
+                kandidat.update(ada)
+        # Kandidat diperiksa sesuai urutannya sehingga begitu sudah ada
+        # cukup saran dengan jarak d, kandidat berikutnya hanya relevan jika
+        # jaraknya kurang dari d.
+        panjang = len(kueri)
+        kandidat = sorted(
+            (self._kata[k][0], k)
+            for k in kandidat
+            if abs(len(k) - panjang) <= jarak_maks
+        )
+        tabel = _tabel_pola(kueri)
+        per_jarak = [[] for _ in range(jarak_maks + 1)]
+        jumlah = [0] * (jarak_maks + 1)
+        for _, kunci in kandidat:
+            if abs(len(kunci) - panjang) > jarak_maks:
+                continue
+            jarak = _jarak_edit(kueri, kunci, jarak_maks, tabel)
+            if jarak > jarak_maks:
+                continue
+            bentuk = self._kata[kunci][1]
+            per_jarak[jarak].extend(bentuk)
+            for d in range(jarak, jarak_maks + 1):
+                jumlah[d] += len(bentuk)
+            while jarak_maks >= 0 and jumlah[jarak_maks] >= batas:
+                jarak_maks -= 1
+            if jarak_maks < 0:
+                break
+        return [kata for bentuk in per_jarak for kata in bentuk][:batas]
+
+    def __contains__(self, kata):
+        return " ".join(kata.split()).lower() in self._kata
+
+    def __len__(self):
+        return len(self._kata)
+
+
+def _tabel_pola(pola):
+    tabel = {}
+    for i, huruf in enumerate(pola):
+        tabel[huruf] = tabel.get(huruf, 0) | (1 << i)
+    return tabel
+
+
+def _jarak_edit(a, b, batas, tabel=None):
+    # Jarak Damerau-Levenshtein (optimal string alignment) dengan algoritme
+    # bit-paralel Hyyrö. Mengembalikan batas + 1 jika jarak melebihi batas.
+    if a == b:
+        return 0
+    if abs(len(a) - len(b)) > batas:
+        return batas + 1
+    if not a:
+        return min(len(b), batas + 1)
+    if tabel is None:
+        tabel = _tabel_pola(a)
+    topeng = (1 << len(a)) - 1
+    tertinggi = 1 << (len(a) - 1)
+    vp, vn, d0, pm_lama = topeng, 0, 0, 0
+    jarak = len(a)
+    for huruf in b:
+        pm = tabel.get(huruf, 0)
+        tr = ((~d0 & pm) << 1) & pm_lama
+        d0 = (((pm & vp) + vp) ^ vp) | pm | vn | tr
+        hp = vn | (~(d0 | vp) & topeng)
+        hn = d0 & vp
+        if hp & tertinggi:
+            jarak += 1
+        elif hn & tertinggi:
+            jarak -= 1
+        hp = ((hp << 1) | 1) & topeng
+        hn = (hn << 1) & topeng
+        vp = hn | (~(d0 | hp) & topeng)
+        vn = d0 & hp
+        pm_lama = pm
+    return min(jarak, batas + 1)
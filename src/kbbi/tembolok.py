@@ -0,0 +1,397 @@
+"""
+:mod:`kbbi.tembolok` -- Tembolok KBBI Python
+============================================
+
+.. module:: kbbi.tembolok
+   :platform: Unix, Windows, Mac
+   :synopsis: Modul ini mengandung implementasi tembolok laman dan objek KBBI.
+.. moduleauthor:: sage <laymonage@gmail.com>
+"""
+
+import sys
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+from .kbbi import (
+    DATA_DIR,
+    KBBI,
+    Entri,
+    Etimologi,
+    Laman,
+    Makna,
+    TidakDitemukan,
+    _laman_galat,
+    _status_berhasil,
+    _validator_laman,
+)
+
+
+class TembolokLaman:
+    """Tembolok (cache) persisten untuk laman KBBI daring.
+
+    Laman disimpan dalam basis data SQLite berdasarkan lokasi laman dan
+    status autentikasi sesi yang digunakan untuk mengambilnya. Laman
+    kedaluwarsa yang memiliki ETag/Last-Modified tidak langsung dibuang,
+    tetapi divalidasi ulang ke KBBI Daring dengan permintaan bersyarat.
+
+    Waktu akses laman hanya dicatat jika ukuran_maks diberikan, dan
+    ditulis sekaligus untuk banyak laman (sebelum laman berlebih dibuang,
+    saat tembolok ditutup, atau setelah maks_akses_tertunda akses).
+    """
+
+    lokasi_tembolok = DATA_DIR / "tembolok.sqlite3"
+    maks_akses_tertunda = 256
+
+    def __init__(
+        self, lokasi_tembolok=None, umur=None, ukuran_maks=None, luring=False
+    ):
+        """Membuka (atau membuat) tembolok pada lokasi yang diberikan.
+
+        :param lokasi_tembolok: Lokasi berkas basis data tembolok
+        :type lokasi_tembolok: str atau PathLike
+        :param umur: Umur maksimum laman dalam tembolok (dalam detik),
+            None berarti tidak kedaluwarsa
+        :type umur: int atau float
+        :param ukuran_maks: Ukuran total maksimum laman dalam tembolok
+            (dalam bita), laman yang paling lama tidak diakses akan dibuang
+            terlebih dahulu
+        :type ukuran_maks: int
+        :param luring: Hanya gunakan tembolok tanpa mengakses KBBI daring
+        :type luring: bool
+        """
+        self.lokasi_tembolok = Path(lokasi_tembolok or self.lokasi_tembolok)
+        self.umur = umur
+        self.ukuran_maks = ukuran_maks
+        self.luring = luring
+        self.direvalidasi = 0
+        self._akses_tertunda = {}
+        self._kunci = threading.Lock()
+        self.lokasi_tembolok.parent.mkdir(parents=True, exist_ok=True)
+        import sqlite3
+
+        self._koneksi = sqlite3.connect(
+            str(self.lokasi_tembolok), check_same_thread=False, timeout=30
+        )
+        with self._koneksi:
+            self._koneksi.execute(
+                "CREATE TABLE IF NOT EXISTS laman ("
+                "lokasi TEXT NOT NULL, "
+                "terautentikasi INTEGER NOT NULL, "
+                "url TEXT NOT NULL, "
+                "teks TEXT NOT NULL, "
+                "ukuran INTEGER NOT NULL, "
+                "disimpan REAL NOT NULL, "
+                "diakses REAL NOT NULL, "
+                "etag TEXT, "
+                "diubah TEXT, "
+                "PRIMARY KEY (lokasi, terautentikasi))"
+            )
+
+    def ambil(self, lokasi, terautentikasi, basi=False):
+        """Mengambil laman dari tembolok.
+
+        :param basi: Kembalikan juga laman kedaluwarsa yang dapat divalidasi
+            ulang (dengan atribut basi bernilai True)
+        :type basi: bool
+        :returns: Laman yang tersimpan atau None jika tidak ada/kedaluwarsa
+        :rtype: Laman
+        """
+        kunci = (lokasi, int(terautentikasi))
+        with self._kunci, self._koneksi:
+            baris = self._koneksi.execute(
+                "SELECT url, teks, disimpan, etag, diubah FROM laman "
+                "WHERE lokasi = ? AND terautentikasi = ?",
+                kunci,
+            ).fetchone()
+            if baris is None:
+                return None
+            url, teks, disimpan, etag, diubah = baris
+            headers = {}
+            if etag:
+                headers["ETag"] = etag
+            if diubah:
+                headers["Last-Modified"] = diubah
+            laman = Laman(url, teks, headers)
+            if self._kedaluwarsa(disimpan) and not self.luring:
+                if basi and headers:
+                    laman.basi = True
+                    return laman
+                self._koneksi.execute(
+                    "DELETE FROM laman "
+                    "WHERE lokasi = ? AND terautentikasi = ?",
+                    kunci,
+                )
+                return None
+            if self.ukuran_maks is not None:
+                self._akses_tertunda[kunci] = time.time()
+                if len(self._akses_tertunda) >= self.maks_akses_tertunda:
+                    self._tulis_akses()
+        return laman
+
+    def _tulis_akses(self):
+        if not self._akses_tertunda:
+            return
+        self._koneksi.executemany(
+            "UPDATE laman SET diakses = ? "
+            "WHERE lokasi = ? AND terautentikasi = ?",
+            [
+                (diakses, *kunci)
+                for kunci, diakses in self._akses_tertunda.items()
+            ],
+        )
+        self._akses_tertunda.clear()
+
+    def perbarui(self, lokasi, terautentikasi):
+        """Menandai laman dalam tembolok masih berlaku setelah divalidasi
+        ulang, sehingga umurnya dihitung kembali dari sekarang.
+        """
+        sekarang = time.time()
+        with self._kunci, self._koneksi:
+            self._akses_tertunda.pop((lokasi, int(terautentikasi)), None)
+            self._koneksi.execute(
+                "UPDATE laman SET disimpan = ?, diakses = ? "
+                "WHERE lokasi = ? AND terautentikasi = ?",
+                (sekarang, sekarang, lokasi, int(terautentikasi)),
+            )
+            self.direvalidasi += 1
+
+    def simpan(self, lokasi, terautentikasi, laman):
+        """Menyimpan laman ke dalam tembolok.
+
+        Laman galat dan laman yang seharusnya terautentikasi tetapi tidak
+        (misalnya karena kuki kedaluwarsa) tidak akan disimpan.
+        """
+        if _laman_galat(laman.url) or not _status_berhasil(laman):
+            return
+        if terautentikasi and "loginLink" in laman.text:
+            return
+        sekarang = time.time()
+        etag, diubah = _validator_laman(laman)
+        with self._kunci, self._koneksi:
+            self._akses_tertunda.pop((lokasi, int(terautentikasi)), None)
+            self._koneksi.execute(
+                "INSERT OR REPLACE INTO laman (lokasi, terautentikasi, url,"
+                " teks, ukuran, disimpan, diakses, etag, diubah)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    lokasi,
+                    int(terautentikasi),
+                    laman.url,
+                    laman.text,
+                    len(laman.text.encode()),
+                    sekarang,
+                    sekarang,
+                    etag,
+                    diubah,
+                ),
+            )
+            self._buang_berlebih()
+
+    def _kedaluwarsa(self, disimpan):
+        return self.umur is not None and time.time() - disimpan > self.umur
+
+    def _buang_berlebih(self):
+        if self.ukuran_maks is None:
+            return
+        self._tulis_akses()
+        (total,) = self._koneksi.execute(
+            "SELECT COALESCE(SUM(ukuran), 0) FROM laman"
+        ).fetchone()
+        if total <= self.ukuran_maks:
+            return
+        dibuang = []
+        for rowid, ukuran in self._koneksi.execute(
+            "SELECT rowid, ukuran FROM laman ORDER BY diakses"
+        ):
+            if total <= self.ukuran_maks:
+                break
+            dibuang.append((rowid,))
+            total -= ukuran
+        self._koneksi.executemany("DELETE FROM laman WHERE rowid = ?", dibuang)
+
+    def bersihkan(self):
+        """Menghapus semua laman dalam tembolok."""
+        with self._kunci, self._koneksi:
+            self._akses_tertunda.clear()
+            self._koneksi.execute("DELETE FROM laman")
+
+    def tutup(self):
+        """Menutup koneksi ke basis data tembolok."""
+        with self._kunci, self._koneksi:
+            self._tulis_akses()
+        self._koneksi.close()
+
+    def __len__(self):
+        with self._kunci:
+            (jumlah,) = self._koneksi.execute(
+                "SELECT COUNT(*) FROM laman"
+            ).fetchone()
+        return jumlah
+
+
+class TembolokObjek:
+    """Tembolok dalam memori untuk objek KBBI yang telah dibuat.
+
+    Objek dibuang berdasarkan urutan akses (LRU) apabila jumlah objek atau
+    perkiraan ukuran total objek melebihi batas yang diberikan, serta
+    dibuat ulang jika umurnya melebihi batas umur. Objek yang dikembalikan
+    dapat digunakan bersama, jangan ubah isinya.
+    """
+
+    kelas_kbbi = KBBI
+    _waktu = staticmethod(time.monotonic)
+
+    def __init__(self, maks_objek=1024, maks_bita=None, umur=None):
+        """Membuat tembolok objek baru.
+
+        :param maks_objek: Jumlah maksimum objek dalam tembolok
+        :type maks_objek: int
+        :param maks_bita: Perkiraan ukuran total maksimum objek dalam
+            tembolok (dalam bita)
+        :type maks_bita: int
+        :param umur: Umur maksimum objek dalam tembolok (dalam detik),
+            None berarti tidak kedaluwarsa
+        :type umur: int atau float
+        """
+        self.maks_objek = maks_objek
+        self.maks_bita = maks_bita
+        self.umur = umur
+        self.kena = 0
+        self.luput = 0
+        self.bita = 0
+        self._objek = OrderedDict()
+        self._dimuat = {}
+        self._kunci = threading.Lock()
+
+    @staticmethod
+    def normalisasi(kueri):
+        """Menormalisasi kueri dengan menghapus spasi berlebih."""
+        return " ".join(kueri.split())
+
+    def ambil(self, kueri, auth=None, **kwargs):
+        """Mengambil objek KBBI dari tembolok atau membuatnya jika belum ada.
+
+        Argumen lainnya akan diteruskan ke konstruktor KBBI dan menjadi
+        bagian dari kunci tembolok (sehingga harus hashable), misalnya
+        objek dengan malas=True disimpan terpisah dari objek biasa. Galat
+        TidakDitemukan juga disimpan dan akan dimunculkan kembali dengan
+        objek (beserta saran entri) yang sama. Jika beberapa utas meminta
+        kueri yang sama dan belum ada di tembolok, hanya satu utas yang
+        membuat objeknya, utas lainnya menunggu hasilnya.
+
+        :param kueri: Kata kunci pencarian
+        :type kueri: str
+        :param auth: objek AutentikasiKBBI
+        :type auth: AutentikasiKBBI
+        :returns: Objek KBBI untuk kueri yang diberikan
+        :rtype: KBBI
+        """
+        kueri = self.normalisasi(kueri)
+        kunci = (kueri, auth is not None, tuple(sorted(kwargs.items())))
+        while True:
+            with self._kunci:
+                tersimpan = self._objek.get(kunci)
+                if tersimpan is not None and self._kedaluwarsa(tersimpan[3]):
+                    del self._objek[kunci]
+                    self.bita -= tersimpan[2]
+                    tersimpan = None
+                if tersimpan is not None:
+                    self._objek.move_to_end(kunci)
+                    self.kena += 1
+                    break
+                dimuat = self._dimuat.get(kunci)
+                if dimuat is None:
+                    self.luput += 1
+                    dimuat = self._dimuat[kunci] = threading.Event()
+                    break
+            # Utas lain sedang membuat objek yang sama, tunggu lalu periksa
+            # kembali tembolok (atau buat sendiri jika utas itu gagal).
+            dimuat.wait()
+        if tersimpan is not None:
+            objek, ditemukan, _, _ = tersimpan
+            if not ditemukan:
+                raise TidakDitemukan(objek.nama, objek=objek)
+            return objek
+        try:
+            try:
+                objek = self.kelas_kbbi(kueri, auth, **kwargs)
+            except TidakDitemukan as e:
+                self._simpan(kunci, e.objek, False)
+                raise
+            self._simpan(kunci, objek, True)
+            return objek
+        finally:
+            with self._kunci:
+                del self._dimuat[kunci]
+            dimuat.set()
+
+    def _simpan(self, kunci, objek, ditemukan):
+        ukuran = 0
+        if self.maks_bita is not None:
+            ukuran = _perkiraan_ukuran(objek)
+        with self._kunci:
+            lama = self._objek.pop(kunci, None)
+            if lama is not None:
+                self.bita -= lama[2]
+            self._objek[kunci] = (objek, ditemukan, ukuran, self._waktu())
+            self.bita += ukuran
+            while self._objek and (
+                len(self._objek) > self.maks_objek
+                or (self.maks_bita is not None and self.bita > self.maks_bita)
+            ):
+                _, (_, _, dibuang, _) = self._objek.popitem(last=False)
+                self.bita -= dibuang
+
+    def _kedaluwarsa(self, disimpan):
+        return self.umur is not None and self._waktu() - disimpan > self.umur
+
+    def statistik(self):
+        """Mengembalikan statistik penggunaan tembolok.
+
+        :returns: Dictionary berisi jumlah kena (hit), luput (miss), objek,
+            dan perkiraan ukuran total objek dalam tembolok
+        :rtype: dict
+        """
+        with self._kunci:
+            return {
+                "kena": self.kena,
+                "luput": self.luput,
+                "objek": len(self._objek),
+                "bita": self.bita,
+            }
+
+    def bersihkan(self):
+        """Menghapus semua objek dalam tembolok beserta statistiknya."""
+        with self._kunci:
+            self._objek.clear()
+            self.kena = self.luput = self.bita = 0
+
+    def __len__(self):
+        return len(self._objek)
+
+
+def _perkiraan_ukuran(objek):
+    # Hanya data entri yang dihitung (bukan sesi, pembatas, dan sebagainya)
+    # dan slot dibaca langsung agar entri malas tidak ikut diurai.
+    if isinstance(objek, KBBI):
+        return sys.getsizeof(objek) + sum(
+            _perkiraan_ukuran(getattr(objek, atribut))
+            for atribut in ("nama", "entri", "saran_entri")
+        )
+    ukuran = sys.getsizeof(objek)
+    if isinstance(objek, dict):
+        ukuran += sum(_perkiraan_ukuran(v) for v in objek.values())
+    elif isinstance(objek, (list, tuple)):
+        ukuran += sum(_perkiraan_ukuran(v) for v in objek)
+    elif isinstance(objek, (Entri, Makna, Etimologi)):
+        for atribut in objek.__slots__:
+            if atribut == "_kunci":
+                continue
+            try:
+                nilai = object.__getattribute__(objek, atribut)
+            except AttributeError:
+                continue
+            ukuran += _perkiraan_ukuran(nilai)
+    return ukuran
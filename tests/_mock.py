@@ -5,11 +5,11 @@ class MockKBBI(KBBI):
     host = "http://localhost:8000"
     _host = KBBI.host
 
-    def __init__(self, kueri, auth=None, lokasi=None):
+    def __init__(self, kueri, auth=None, lokasi=None, **kwargs):
         self._auth = auth
         self._lokasi = lokasi
         self.lokasi = lokasi
-        super().__init__(kueri, auth)
+        super().__init__(kueri, auth, **kwargs)
 
     def _cek_autentikasi(self, laman):
         super()._cek_autentikasi(laman)
@@ -20,9 +20,9 @@ class MockKBBI(KBBI):
         self.lokasi = self._lokasi
 
     @classmethod
-    def _init_aman(cls, kueri, auth=None, lokasi=None):
+    def _init_aman(cls, kueri, auth=None, lokasi=None, **kwargs):
         try:
-            return cls(kueri, auth, lokasi)
+            return cls(kueri, auth, lokasi, **kwargs)
         except TidakDitemukan as e:
             e.objek._kembalikan_host_lokasi()
             return e.objek
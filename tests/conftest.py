@@ -81,8 +81,8 @@ def kbbi_mock(monkeypatch, request, autentikasi):
 
     ___init__ = MockKBBI.__init__
 
-    def __init__(self, kueri, auth=None):
-        ___init__(self, kueri, auth=_auth, lokasi=lokasi)
+    def __init__(self, kueri, auth=None, **kwargs):
+        ___init__(self, kueri, auth=_auth, lokasi=lokasi, **kwargs)
 
     monkeypatch.setattr(MockKBBI, "__init__", __init__)
     monkeypatch.setattr(kbbi.kbbi, "KBBI", MockKBBI)
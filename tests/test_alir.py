@@ -0,0 +1,49 @@
+import json
+import pathlib
+
+import pytest
+import requests
+
+import kbbi
+from _mock import MockKBBI
+
+DIR_KASUS = pathlib.Path(__file__).resolve(strict=True).parent / "kasus"
+
+kasus = [
+    (auth, berkas)
+    for auth in ("auth", "nonauth")
+    for berkas in sorted((DIR_KASUS / auth / "serialisasi").iterdir())
+]
+
+
+@pytest.mark.parametrize(
+    "auth,berkas", kasus, ids=lambda v: getattr(v, "stem", v)
+)
+def test_alir_hasil_sama(auth, berkas, autentikasi):
+    autentikasi = autentikasi if auth == "auth" else None
+    objek = MockKBBI._init_aman(berkas.stem, autentikasi, alir=True)
+    assert objek.serialisasi() == json.loads(berkas.read_text())
+
+
+@pytest.mark.parametrize("kueri", ["alam", "huk", "idn45"])
+def test_alir_berhenti_setelah_bagian_entri(kueri):
+    url = f"{MockKBBI.host}/auth/entri/{kueri}.html"
+    with requests.Session() as sesi:
+        utuh = sesi.get(url).text
+        laman = kbbi.ambil_laman_alir(sesi, url, ukuran_potongan=512)
+    assert utuh.startswith(laman.text)
+    assert len(laman.text) < len(utuh)
+    assert "<footer" not in laman.text
+
+
+@pytest.mark.parametrize(
+    "lokasi,galat",
+    [
+        ("Beranda/Error.html", kbbi.TerjadiKesalahan),
+        ("Beranda/BatasSehari.html", kbbi.BatasSehari),
+        ("Account/Banned.html", kbbi.AkunDibekukan),
+    ],
+)
+def test_alir_laman_galat(lokasi, galat):
+    with pytest.raises(galat):
+        MockKBBI("coba", lokasi=lokasi, alir=True)
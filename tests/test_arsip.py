@@ -0,0 +1,104 @@
+import json
+import multiprocessing
+import pathlib
+
+import pytest
+
+import kbbi
+from kbbi.arsip import Arsip, PembuatArsip, buat_arsip
+
+DIR_KASUS = pathlib.Path(__file__).resolve(strict=True).parent / "kasus"
+
+
+def muat_kasus(auth):
+    return {
+        berkas.stem: json.loads(berkas.read_text())
+        for berkas in sorted((DIR_KASUS / auth / "serialisasi").iterdir())
+    }
+
+
+@pytest.fixture(params=["auth", "nonauth"])
+def arsip(request, tmp_path):
+    kasus = muat_kasus(request.param)
+    lokasi = tmp_path / "kbbi.arsip"
+    assert buat_arsip(lokasi, kasus.values()) == len(kasus)
+    with Arsip(lokasi) as arsip:
+        arsip.auth = request.param
+        arsip.kasus = kasus
+        yield arsip
+
+
+def test_arsip_ambil(arsip):
+    assert len(arsip) == len(arsip.kasus)
+    assert sorted(arsip) == sorted(arsip.kasus)
+    for kueri, serialisasi in arsip.kasus.items():
+        assert kueri in arsip
+        assert arsip.ambil(kueri) == serialisasi
+        assert json.loads(arsip.ambil_bita(kueri)) == serialisasi
+
+
+def test_arsip_cari(arsip):
+    for kueri in ("alam", "a.n.", "quo vadis?", "civitas  academica "):
+        objek = arsip.cari(kueri)
+        stem = " ".join(kueri.split())
+        assert objek.serialisasi() == arsip.kasus[stem]
+        str_berkas = DIR_KASUS / arsip.auth / "str" / f"{stem}.txt"
+        assert str(objek) == str_berkas.read_text().strip()
+
+
+def test_arsip_tidak_ditemukan(arsip):
+    with pytest.raises(kbbi.TidakDitemukan) as e:
+        arsip.cari("huk")
+    assert e.value.objek.serialisasi() == arsip.kasus["huk"]
+
+
+def test_arsip_tidak_ada(arsip):
+    assert "tidak-ada" not in arsip
+    assert arsip.ambil("tidak-ada") is None
+    with pytest.raises(kbbi.TidakAdaDiTembolok):
+        arsip.cari("tidak-ada")
+
+
+def test_arsip_kueri_ditimpa(tmp_path):
+    kasus = muat_kasus("nonauth")
+    with PembuatArsip(tmp_path / "kbbi.arsip") as pembuat:
+        pembuat.tambah(kasus["alam"], kueri="kata")
+        pembuat.tambah(kasus["roh"], kueri="kata")
+    with Arsip(tmp_path / "kbbi.arsip") as arsip:
+        assert len(arsip) == 1
+        assert arsip.ambil("kata") == kasus["roh"]
+
+
+def test_arsip_dibatalkan(tmp_path):
+    with pytest.raises(RuntimeError):
+        with PembuatArsip(tmp_path / "kbbi.arsip") as pembuat:
+            pembuat.tambah(muat_kasus("nonauth")["alam"])
+            raise RuntimeError
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_arsip_kosong(tmp_path):
+    buat_arsip(tmp_path / "kbbi.arsip", [])
+    with Arsip(tmp_path / "kbbi.arsip") as arsip:
+        assert len(arsip) == 0
+        assert "alam" not in arsip
+
+
+def test_bukan_arsip(tmp_path):
+    lokasi = tmp_path / "bukan.arsip"
+    lokasi.write_bytes(bytes(64))
+    with pytest.raises(ValueError):
+        Arsip(lokasi)
+
+
+def _ambil_di_proses_lain(lokasi):
+    with Arsip(lokasi) as arsip:
+        return arsip.ambil("alam")
+
+
+def test_arsip_banyak_proses(tmp_path):
+    kasus = muat_kasus("nonauth")
+    buat_arsip(tmp_path / "kbbi.arsip", kasus.values())
+    with multiprocessing.Pool(2) as pool:
+        hasil = pool.map(_ambil_di_proses_lain, [tmp_path / "kbbi.arsip"] * 2)
+    assert hasil == [kasus["alam"]] * 2
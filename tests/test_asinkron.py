@@ -0,0 +1,164 @@
+import asyncio
+import json
+
+import pytest
+
+import kbbi
+from _mock import MockKBBI
+
+asinkron = pytest.importorskip("kbbi.asinkron")
+
+
+class MockAsyncKBBI(MockKBBI, asinkron.AsyncKBBI):
+    pass
+
+
+class MockAsyncAutentikasiKBBI(asinkron.AsyncAutentikasiKBBI):
+    host = MockKBBI.host
+    lokasi = "Account/Login.html"
+
+
+def jalankan(coro):
+    return asyncio.get_event_loop().run_until_complete(coro)
+
+
+@pytest.fixture
+def lokasi_kuki(tmp_path):
+    lokasi = tmp_path / "kuki.json"
+    lokasi.write_text(json.dumps({".AspNet.ApplicationCookie": "kuki"}))
+    return lokasi
+
+
+@pytest.mark.parametrize("kueri", ["alam", "a.n.", "kan"])
+def test_cari_sama_dengan_sinkron(kueri):
+    objek = jalankan(MockAsyncKBBI.cari(kueri))
+    assert objek.serialisasi() == MockKBBI(kueri).serialisasi()
+    assert str(objek) == str(MockKBBI(kueri))
+
+
+def test_cari_tidak_ditemukan():
+    with pytest.raises(kbbi.TidakDitemukan):
+        jalankan(MockAsyncKBBI.cari("idn45"))
+
+
+def test_cari_galat():
+    async def cari():
+        objek = MockAsyncKBBI("coba")
+        objek.lokasi = "Beranda/Error.html"
+        objek.sesi = asinkron.buat_klien()
+        async with objek.sesi:
+            respons = await objek.sesi.get(f"{objek.host}/{objek.lokasi}")
+        objek._proses_laman(kbbi.Laman(str(respons.url), respons.text))
+
+    with pytest.raises(kbbi.TerjadiKesalahan):
+        jalankan(cari())
+
+
+def test_cari_auth_bukan_async():
+    with pytest.raises(ValueError) as e:
+        jalankan(MockAsyncKBBI.cari("alam", object()))
+    assert str(e.value) == "'auth' harus berupa objek AsyncAutentikasiKBBI."
+
+
+def test_autentikasi_dengan_kuki(lokasi_kuki, autentikasi):
+    async def cari():
+        async with await MockAsyncAutentikasiKBBI.buat(
+            lokasi_kuki=lokasi_kuki
+        ) as auth:
+            assert auth.sesi.cookies.get(".AspNet.ApplicationCookie") == "kuki"
+            return await MockAsyncKBBI.cari("roh", auth)
+
+    objek = jalankan(cari())
+    sinkron = MockKBBI("roh", autentikasi)
+    assert objek.terautentikasi
+    assert objek.serialisasi() == sinkron.serialisasi()
+
+
+def test_autentikasi_tanpa_kuki(tmp_path):
+    with pytest.raises(kbbi.KukiTidakDitemukan):
+        jalankan(
+            MockAsyncAutentikasiKBBI.buat(lokasi_kuki=tmp_path / "tidak.json")
+        )
+
+
+def test_autentikasi_gagal():
+    with pytest.raises(kbbi.GagalAutentikasi):
+        jalankan(MockAsyncAutentikasiKBBI.buat("pos@el.saya", "sandi"))
+
+
+def test_banyak():
+    daftar_kueri = ["alam", "idn45", "roh", "lampir"]
+    hasil = jalankan(MockAsyncKBBI.banyak(daftar_kueri, batas=2))
+    assert [h.kueri for h in hasil] == daftar_kueri
+    assert isinstance(hasil[1].galat, kbbi.TidakDitemukan)
+    for h in hasil[::2]:
+        assert h.galat is None
+        assert h.objek.serialisasi() == MockKBBI(h.kueri).serialisasi()
+
+
+def klien_tiruan(*status):
+    """Klien yang menjawab dengan kode status berurutan, lalu 200."""
+    status = list(status)
+    permintaan = []
+    with open("html/nonauth/entri/alam.html", encoding="utf-8") as berkas:
+        teks = berkas.read()
+
+    def jawab(request):
+        permintaan.append(request)
+        kode = status.pop(0) if status else 200
+        return asinkron.httpx.Response(kode, text=teks)
+
+    klien = asinkron.httpx.AsyncClient(
+        transport=asinkron.httpx.MockTransport(jawab)
+    )
+    return klien, permintaan
+
+
+def test_cari_kode_status():
+    klien, _ = klien_tiruan(404)
+    with pytest.raises(kbbi.LamanTidakValid) as e:
+        jalankan(MockAsyncKBBI.cari("alam", klien=klien))
+    assert e.value.status == 404
+
+
+def test_cari_coba_ulang():
+    klien, permintaan = klien_tiruan(503, 429)
+    kebijakan = kbbi.KebijakanCobaUlang(jeda_awal=0)
+    objek = jalankan(
+        MockAsyncKBBI.cari("alam", klien=klien, coba_ulang=kebijakan)
+    )
+    assert len(permintaan) == 3
+    assert kebijakan.gagal_berturut == 0
+    assert objek.serialisasi() == MockKBBI("alam").serialisasi()
+
+
+def test_cari_coba_ulang_habis():
+    klien, permintaan = klien_tiruan(503, 503, 503)
+    kebijakan = kbbi.KebijakanCobaUlang(maks_coba=2, jeda_awal=0)
+    with pytest.raises(asinkron.httpx.HTTPStatusError):
+        jalankan(MockAsyncKBBI.cari("alam", klien=klien, coba_ulang=kebijakan))
+    assert len(permintaan) == 2
+
+
+def test_banyak_pembatas():
+    class Pembatas(kbbi.PembatasLaju):
+        diambil = 0
+
+        def ambil(self):
+            self.diambil += 1
+            return super().ambil()
+
+    pembatas = Pembatas()
+    daftar_kueri = ["alam", "roh"]
+    hasil = jalankan(MockAsyncKBBI.banyak(daftar_kueri, pembatas=pembatas))
+    assert all(h.galat is None for h in hasil)
+    assert pembatas.diambil == 2
+    assert hasil[0].objek._pembatas == (pembatas,)
+
+
+def test_segarkan_tidak_didukung():
+    objek = jalankan(MockAsyncKBBI.cari("alam"))
+    with pytest.raises(NotImplementedError):
+        objek.segarkan()
+    with pytest.raises(NotImplementedError):
+        MockAsyncKBBI.segarkan_banyak([objek])
@@ -0,0 +1,114 @@
+import os
+import pathlib
+
+import pytest
+
+import kbbi
+from _mock import MockKBBI
+
+daftar_kueri = ["alam", "idn45", "lampir", "roh", "kan"]
+urai_entri = kbbi.kbbi._urai_entri
+
+
+def urai_entri_dan_catat_pid(*args):
+    pathlib.Path(os.environ["KBBI_DIR_PID"], str(os.getpid())).touch()
+    return urai_entri(*args)
+
+
+def test_banyak_berurutan():
+    hasil = list(MockKBBI.banyak(daftar_kueri, pekerja=3))
+    assert [h.kueri for h in hasil] == daftar_kueri
+    for h in hasil:
+        if h.kueri == "idn45":
+            assert isinstance(h.galat, kbbi.TidakDitemukan)
+            assert h.objek.entri == []
+        else:
+            assert h.galat is None
+            assert h.objek.serialisasi() == MockKBBI(h.kueri).serialisasi()
+
+
+def test_banyak_tidak_berurutan():
+    hasil = list(MockKBBI.banyak(daftar_kueri, pekerja=2, berurutan=False))
+    assert sorted(h.kueri for h in hasil) == sorted(daftar_kueri)
+
+
+def test_banyak_sesi_bersama():
+    hasil = list(MockKBBI.banyak(["alam", "roh"], pekerja=2))
+    assert hasil[0].objek.sesi is hasil[1].objek.sesi
+
+
+def test_banyak_autentikasi(autentikasi):
+    hasil = list(MockKBBI.banyak(["roh", "huk"], autentikasi))
+    assert hasil[0].objek.terautentikasi
+    assert hasil[0].objek.sesi is autentikasi.sesi
+    assert hasil[1].objek.saran_entri
+
+
+@pytest.mark.parametrize(
+    "lokasi,galat",
+    [
+        ("Beranda/Error.html", kbbi.TerjadiKesalahan),
+        ("Beranda/BatasSehari.html", kbbi.BatasSehari),
+        ("tidak/ada.html", kbbi.LamanTidakValid),
+        ("Account/Login.html", kbbi.LamanTidakValid),
+    ],
+)
+def test_banyak_galat_tidak_menghentikan(monkeypatch, lokasi, galat):
+    ___init__ = MockKBBI.__init__
+
+    def __init__(self, kueri, auth=None, **kwargs):
+        ___init__(
+            self, kueri, auth, lokasi if kueri == "gagal" else None, **kwargs
+        )
+
+    monkeypatch.setattr(MockKBBI, "__init__", __init__)
+    hasil = list(MockKBBI.banyak(["alam", "gagal", "roh"]))
+    assert [h.kueri for h in hasil] == ["alam", "gagal", "roh"]
+    assert hasil[1].objek is None
+    assert isinstance(hasil[1].galat, galat)
+    assert hasil[2].galat is None
+
+
+def test_banyak_proses_pengurai():
+    referensi = list(MockKBBI.banyak(daftar_kueri, pekerja=3))
+    hasil = list(MockKBBI.banyak(daftar_kueri, pekerja=3, proses=2))
+    assert [h.kueri for h in hasil] == daftar_kueri
+    for h, r in zip(hasil, referensi):
+        assert h.objek.serialisasi() == r.objek.serialisasi()
+        assert type(h.galat) is type(r.galat)
+        assert h.objek._eksekutor_urai is None
+
+
+def test_banyak_proses_terpisah(monkeypatch, tmp_path):
+    monkeypatch.setenv("KBBI_DIR_PID", str(tmp_path))
+    monkeypatch.setattr(kbbi.kbbi, "_urai_entri", urai_entri_dan_catat_pid)
+    hasil = list(MockKBBI.banyak(["alam", "roh"], pekerja=2, proses=2))
+    assert all(h.objek.entri for h in hasil)
+    pid = {int(p.name) for p in tmp_path.iterdir()}
+    assert pid
+    assert os.getpid() not in pid
+
+
+def test_eksekutor_urai(autentikasi):
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(1) as eksekutor:
+        objek = MockKBBI("alam", autentikasi, eksekutor_urai=eksekutor)
+    referensi = MockKBBI("alam", autentikasi)
+    assert objek.terautentikasi
+    assert objek.serialisasi() == referensi.serialisasi()
+    assert str(objek) == str(referensi)
+
+
+def test_banyak_proses_laman_tidak_valid(monkeypatch):
+    ___init__ = MockKBBI.__init__
+
+    def __init__(self, kueri, auth=None, **kwargs):
+        lokasi = "Account/Login.html" if kueri == "gagal" else None
+        ___init__(self, kueri, auth, lokasi, **kwargs)
+
+    monkeypatch.setattr(MockKBBI, "__init__", __init__)
+    hasil = list(MockKBBI.banyak(["alam", "gagal"], proses=1))
+    assert hasil[0].galat is None
+    assert isinstance(hasil[1].galat, kbbi.LamanTidakValid)
+    assert str(hasil[1].galat) == "Laman untuk gagal tidak dapat diurai."
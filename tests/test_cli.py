@@ -1,3 +1,6 @@
+import io
+import json
+import pathlib
 import sys as _sys
 
 import pytest
@@ -247,3 +250,90 @@ def test_tidak_ditemukan_tidak_ada_saran_json(capsys, kbbi_mock, lokasi):
     tangkap = capsys.readouterr()
     assert tangkap.out == lokasi.read_text()
     assert hasil == 1
+
+
+DIR_KASUS = pathlib.Path(__file__).resolve(strict=True).parent / "kasus"
+
+
+@pytest.mark.parametrize("kbbi_mock", [None], indirect=True)
+def test_program_utama_banyak_laman_str(capsys, kbbi_mock, tanpa_kuki):
+    hasil = kbbi.main(["alam", "idn45", "roh"])
+    tangkap = capsys.readouterr()
+    folder = DIR_KASUS / "nonauth" / "str"
+    assert tangkap.out == (
+        f"{(folder / 'alam.txt').read_text()}\n"
+        "idn45 tidak ditemukan dalam KBBI.\n\n"
+        f"{(folder / 'roh.txt').read_text()}"
+    )
+    assert hasil == 1
+
+
+@pytest.mark.parametrize(
+    "pekerja",
+    [
+        ["--pekerja", "1"],
+        ["--pekerja", "4"],
+        ["--pekerja", "4", "--proses", "2"],
+    ],
+)
+@pytest.mark.parametrize("kbbi_mock", [None], indirect=True)
+def test_program_utama_jsonl_dari_stdin(
+    monkeypatch, capsys, kbbi_mock, tanpa_kuki, pekerja
+):
+    kueri = ["alam", "idn45", "roh", "lampir", "huk"]
+    monkeypatch.setattr(_sys, "stdin", io.StringIO("\n".join(kueri) + "\n\n"))
+    hasil = kbbi.main(["-", "--jsonl", *pekerja])
+    tangkap = capsys.readouterr()
+    baris = tangkap.out.splitlines()
+    assert [json.loads(b) for b in baris] == [
+        json.loads(
+            (DIR_KASUS / "nonauth" / "serialisasi" / f"{k}.json").read_text()
+        )
+        for k in kueri
+    ]
+    assert tangkap.err == ""
+    assert hasil == 1
+
+
+@pytest.mark.parametrize(
+    "argumen,pekerja",
+    [
+        ([], 1),
+        (["--proses", "3"], 6),
+        (["--proses", "3", "--pekerja", "2"], 2),
+    ],
+)
+def test_pekerja_bawaan(argumen, pekerja):
+    assert kbbi.kbbi._parse_args_utama(["-", *argumen]).pekerja == pekerja
+
+
+@pytest.mark.parametrize("kbbi_mock", [None], indirect=True)
+def test_program_utama_banyak_laman_lanjut_setelah_galat(
+    capsys, kbbi_mock, tanpa_kuki, tmp_path
+):
+    lokasi_tembolok = str(tmp_path / "tembolok.sqlite3")
+    kbbi.main(["alam", "--lokasi-tembolok", lokasi_tembolok])
+    capsys.readouterr()
+    hasil = kbbi.main(
+        ["roh", "alam", "--jsonl", "--luring"]
+        + ["--lokasi-tembolok", lokasi_tembolok]
+    )
+    tangkap = capsys.readouterr()
+    assert tangkap.err == "roh: roh tidak tersedia di tembolok.\n"
+    assert json.loads(tangkap.out) == json.loads(
+        (DIR_KASUS / "nonauth" / "serialisasi" / "alam.json").read_text()
+    )
+    assert hasil == 1
+
+
+@pytest.mark.parametrize(
+    "kbbi_mock", [(None, "Beranda/BatasSehari.html")], indirect=True
+)
+def test_program_utama_banyak_laman_berhenti_batas_sehari(capsys, kbbi_mock):
+    hasil = kbbi.main(["alam", "roh", "lampir"])
+    tangkap = capsys.readouterr()
+    assert tangkap.out == ""
+    assert tangkap.err == (
+        "alam: Pencarian Anda telah mencapai batas maksimum dalam sehari.\n"
+    )
+    assert hasil == 1
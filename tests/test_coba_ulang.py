@@ -0,0 +1,218 @@
+import pathlib
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import requests
+
+import kbbi
+from _mock import MockAutentikasiKBBI
+
+DIR_HTML = pathlib.Path(__file__).resolve(strict=True).parent / "html"
+URL_ALAM = f"{kbbi.KBBI.host}/entri/alam"
+
+
+def respons(status=200, url=URL_ALAM, headers=None):
+    hasil = requests.Response()
+    hasil.status_code = status
+    hasil.url = url
+    hasil.headers.update(headers or {})
+    hasil.encoding = "utf-8"
+    hasil._content = (
+        DIR_HTML / "nonauth" / "entri" / "alam.html"
+    ).read_bytes()
+    hasil._content_consumed = True
+    return hasil
+
+
+class SesiPalsu:
+    def __init__(self, *daftar_respons):
+        self.daftar_respons = list(daftar_respons)
+        self.jumlah_panggilan = 0
+
+    def get(self, url, **kwargs):
+        self.jumlah_panggilan += 1
+        hasil = self.daftar_respons.pop(0)
+        if isinstance(hasil, Exception):
+            raise hasil
+        return hasil
+
+
+class JamPalsu:
+    def __init__(self):
+        self.sekarang = 0.0
+        self.tidur = []
+
+    def waktu(self):
+        return self.sekarang
+
+    def tunggu(self, detik):
+        self.tidur.append(detik)
+        self.sekarang += detik
+
+
+@pytest.fixture
+def jam(monkeypatch):
+    jam = JamPalsu()
+    monkeypatch.setattr(kbbi.KebijakanCobaUlang, "_waktu", jam.waktu)
+    monkeypatch.setattr(kbbi.KebijakanCobaUlang, "_tidur", jam.tunggu)
+    monkeypatch.setattr(
+        kbbi.KebijakanCobaUlang, "_acak", staticmethod(lambda: 1.0)
+    )
+    return jam
+
+
+@pytest.mark.parametrize(
+    "gagal",
+    [
+        respons(503),
+        respons(429),
+        respons(url=f"{kbbi.KBBI.host}/Beranda/Error"),
+        requests.ConnectionError(),
+        requests.Timeout(),
+    ],
+)
+def test_coba_ulang_berhasil(jam, gagal):
+    sesi = SesiPalsu(gagal, gagal, respons())
+    kebijakan = kbbi.KebijakanCobaUlang(jeda_awal=1)
+    alam = kbbi.KBBI("alam", sesi=sesi, coba_ulang=kebijakan)
+    assert alam.entri[0].nama == "alam"
+    assert sesi.jumlah_panggilan == 3
+    assert jam.tidur == [1, 2]
+    assert kebijakan.gagal_berturut == 0
+
+
+def test_coba_ulang_habis(jam):
+    sesi = SesiPalsu(respons(502), respons(502), respons(502), respons())
+    with pytest.raises(requests.HTTPError):
+        kbbi.KBBI(
+            "alam", sesi=sesi, coba_ulang=kbbi.KebijakanCobaUlang(maks_coba=3)
+        )
+    assert sesi.jumlah_panggilan == 3
+
+
+@pytest.mark.parametrize("alir", [False, True])
+def test_coba_ulang_503(jam, alir):
+    sesi = SesiPalsu(respons(503), respons(503), respons(503))
+    with pytest.raises(requests.HTTPError):
+        kbbi.KBBI(
+            "alam",
+            sesi=sesi,
+            alir=alir,
+            coba_ulang=kbbi.KebijakanCobaUlang(maks_coba=3),
+        )
+    assert sesi.jumlah_panggilan == 3
+
+
+@pytest.mark.parametrize("alir", [False, True])
+def test_coba_ulang_503_lalu_berhasil(jam, alir):
+    sesi = SesiPalsu(respons(503), respons())
+    alam = kbbi.KBBI(
+        "alam", sesi=sesi, alir=alir, coba_ulang=kbbi.KebijakanCobaUlang()
+    )
+    assert alam.entri[0].nama == "alam"
+    assert sesi.jumlah_panggilan == 2
+
+
+def test_tanpa_kebijakan_tidak_diulang():
+    sesi = SesiPalsu(respons(url=f"{kbbi.KBBI.host}/Beranda/Error"))
+    with pytest.raises(kbbi.TerjadiKesalahan):
+        kbbi.KBBI("alam", sesi=sesi)
+    assert sesi.jumlah_panggilan == 1
+
+
+@pytest.mark.parametrize(
+    "lokasi,galat",
+    [
+        ("Beranda/BatasSehari", kbbi.BatasSehari),
+        ("Account/Banned", kbbi.AkunDibekukan),
+    ],
+)
+def test_galat_tidak_diulang(jam, lokasi, galat):
+    sesi = SesiPalsu(respons(url=f"{kbbi.KBBI.host}/{lokasi}"), respons())
+    with pytest.raises(galat):
+        kbbi.KBBI("alam", sesi=sesi, coba_ulang=kbbi.KebijakanCobaUlang())
+    assert sesi.jumlah_panggilan == 1
+    assert not kbbi.KebijakanCobaUlang.dapat_diulang(galat())
+
+
+def test_retry_after(jam):
+    tanggal = datetime.now(timezone.utc) + timedelta(seconds=20)
+    sesi = SesiPalsu(
+        respons(503, headers={"Retry-After": "7"}),
+        respons(503, headers={"Retry-After": format_datetime(tanggal)}),
+        respons(),
+    )
+    kbbi.KBBI("alam", sesi=sesi, coba_ulang=kbbi.KebijakanCobaUlang())
+    assert jam.tidur[0] == 7
+    assert 18 < jam.tidur[1] <= 20
+
+
+def test_retry_after_terlalu_lama(jam):
+    sesi = SesiPalsu(respons(429, headers={"Retry-After": "3600"}))
+    kebijakan = kbbi.KebijakanCobaUlang(jeda_maks=30)
+    with pytest.raises(requests.HTTPError):
+        kbbi.KBBI("alam", sesi=sesi, coba_ulang=kebijakan)
+    assert jam.tidur == []
+
+
+def test_pemutus_sirkuit(jam):
+    kebijakan = kbbi.KebijakanCobaUlang(
+        maks_coba=2, ambang_pemutus=3, waktu_pulih=60
+    )
+    sesi = SesiPalsu(*[requests.ConnectionError()] * 3)
+    with pytest.raises(requests.ConnectionError):
+        kbbi.KBBI("alam", sesi=sesi, coba_ulang=kebijakan)
+    with pytest.raises(requests.ConnectionError):
+        kbbi.KBBI("alam", sesi=sesi, coba_ulang=kebijakan)
+    assert sesi.jumlah_panggilan == 3
+    assert kebijakan.sirkuit_terbuka
+
+    sesi = SesiPalsu(respons())
+    with pytest.raises(kbbi.SirkuitTerbuka):
+        kbbi.KBBI("alam", sesi=sesi, coba_ulang=kebijakan)
+    assert sesi.jumlah_panggilan == 0
+
+    jam.sekarang += 60
+    kbbi.KBBI("alam", sesi=sesi, coba_ulang=kebijakan)
+    assert not kebijakan.sirkuit_terbuka
+
+
+def test_pemutus_sirkuit_setengah_terbuka_gagal(jam):
+    kebijakan = kbbi.KebijakanCobaUlang(
+        maks_coba=1, ambang_pemutus=1, waktu_pulih=10
+    )
+    with pytest.raises(requests.ConnectionError):
+        kebijakan.jalankan(SesiPalsu(requests.ConnectionError()).get, "")
+    jam.sekarang += 10
+    with pytest.raises(requests.ConnectionError):
+        kebijakan.jalankan(SesiPalsu(requests.ConnectionError()).get, "")
+    with pytest.raises(kbbi.SirkuitTerbuka):
+        kebijakan.jalankan(SesiPalsu(respons()).get, "")
+
+
+def test_autentikasi_coba_ulang(jam, monkeypatch):
+    ambil_token = MockAutentikasiKBBI._ambil_token
+    gagal = [requests.ConnectionError()]
+
+    def _ambil_token(self):
+        if gagal:
+            raise gagal.pop()
+        return ambil_token(self)
+
+    monkeypatch.setattr(MockAutentikasiKBBI, "_ambil_token", _ambil_token)
+    monkeypatch.setattr(MockAutentikasiKBBI, "paksa_sukses", True)
+    auth = MockAutentikasiKBBI(
+        "posel@saya.tld", "sandi", coba_ulang=kbbi.KebijakanCobaUlang()
+    )
+    assert auth.sesi.cookies.get(".AspNet.ApplicationCookie") == "mockcookie"
+    assert len(jam.tidur) == 1
+
+
+def test_autentikasi_gagal_tidak_diulang(jam, monkeypatch):
+    monkeypatch.setattr(MockAutentikasiKBBI, "buat_galat", True)
+    with pytest.raises(kbbi.GagalAutentikasi):
+        MockAutentikasiKBBI(
+            "posel@saya.tld", "sandi", coba_ulang=kbbi.KebijakanCobaUlang()
+        )
+    assert jam.tidur == []
@@ -0,0 +1,75 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+KODE = """
+import json, sys
+import kbbi
+modul = [
+    "requests",
+    "bs4",
+    "sqlite3",
+    "argparse",
+    "concurrent.futures",
+    "kbbi.tembolok",
+    "kbbi.saran",
+    "kbbi.pembatas",
+    "kbbi.penjadwal",
+    "kbbi.coba_ulang",
+    "kbbi.kuki",
+]
+print(json.dumps({
+    "modul": [m for m in modul if m in sys.modules],
+    "data_dir": str(kbbi.DATA_DIR),
+}))
+"""
+
+
+def jalankan(kode, tmp_path):
+    env = dict(os.environ, HOME=str(tmp_path), XDG_DATA_HOME=str(tmp_path))
+    hasil = subprocess.run(
+        [sys.executable, "-c", kode],
+        stdout=subprocess.PIPE,
+        env=env,
+        check=True,
+        universal_newlines=True,
+    )
+    return hasil.stdout
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="lokasi data berbeda")
+def test_impor_tanpa_efek_samping(tmp_path):
+    hasil = json.loads(jalankan(KODE, tmp_path))
+    assert hasil["modul"] == []
+    assert hasil["data_dir"].startswith(str(tmp_path))
+    assert not os.path.exists(hasil["data_dir"])
+
+
+def test_modul_malas_dimuat_saat_digunakan(tmp_path):
+    kode = (
+        "import sys, kbbi\n"
+        "assert 'bs4' not in sys.modules\n"
+        "entri = kbbi.Entri('<h2>alam</h2><ol><li>dunia</li></ol>')\n"
+        "assert 'bs4' in sys.modules\n"
+        "assert kbbi.kbbi.bs4 is sys.modules['bs4']\n"
+        "print(entri.makna[0].submakna[0])\n"
+    )
+    assert jalankan(kode, tmp_path) == "dunia\n"
+
+
+def test_proksi_modul_tidak_diekspor(tmp_path):
+    kode = (
+        "import sys, kbbi\n"
+        "assert 'requests' not in vars(kbbi)\n"
+        "assert 'bs4' not in vars(kbbi)\n"
+        "assert '__getattr__' not in vars(kbbi)\n"
+        "assert 'requests' not in sys.modules\n"
+        "assert kbbi.requests is sys.modules['requests']\n"
+        "from bs4 import BeautifulSoup\n"
+        "assert kbbi.BeautifulSoup is BeautifulSoup\n"
+        "print(hasattr(kbbi, 'bs4'))\n"
+    )
+    assert jalankan(kode, tmp_path) == "False\n"
@@ -1,6 +1,9 @@
+import glob
 import json
 import pathlib
+import pickle
 
+import bs4
 import pytest
 
 import kbbi
@@ -129,3 +132,86 @@ def test_galat_tidak_ditemukan():
 
 def test_ekstraksi_aman_none():
     assert kbbi.ekstraksi_aman(None) == ""
+
+
+@pytest.mark.parametrize("terautentikasi", [False, True])
+def test_entri_dari_label_sama_dengan_dari_string(terautentikasi):
+    folder = "auth" if terautentikasi else "nonauth"
+    html = (
+        pathlib.Path(__file__).parent / "html" / folder / "entri" / "roh.html"
+    ).read_text()
+    sup = bs4.BeautifulSoup(html, "html.parser")
+    label = sup.find("hr").next_sibling
+    daftar_label = []
+    while not (label.name == "hr" and label.get("style") is None):
+        daftar_label.append(label)
+        label = label.next_sibling
+    estr = "".join(str(label).strip() for label in daftar_label)
+    dari_string = kbbi.Entri(estr, terautentikasi)
+    dari_label = kbbi.Entri(kbbi.bungkus_label(daftar_label), terautentikasi)
+    assert dari_label.serialisasi() == dari_string.serialisasi()
+    assert str(dari_label) == str(dari_string)
+
+
+def test_kelas_kata_digunakan_bersama(autentikasi):
+    alam = MockKBBI("alam", autentikasi)
+    roh = MockKBBI("roh", autentikasi)
+    nomina = alam.entri[0].makna[0].kelas[0]
+    assert nomina == {"kode": "n", "nama": "Nomina", "deskripsi": "kata benda"}
+    assert roh.entri[0].makna[0].kelas[0] is nomina
+    etimologi = alam.entri[0].etimologi, roh.entri[0].etimologi
+    assert etimologi[0].bahasa is etimologi[1].bahasa
+
+
+def test_kelas_kata_tidak_dapat_diubah():
+    kelas = kbbi.KelasKata.buat("n", "Nomina", "kata benda")
+    with pytest.raises(TypeError):
+        kelas["kode"] = "v"
+    with pytest.raises(TypeError):
+        kelas.update(kode="v")
+    assert kelas["kode"] == "n"
+
+
+def test_serialisasi_kelas_kata_dapat_diubah(autentikasi):
+    alam = MockKBBI("alam", autentikasi)
+    kelas = alam.serialisasi()["entri"][0]["makna"][0]["kelas"][0]
+    assert type(kelas) is dict
+    kelas["kode"] = "v"
+    assert alam.entri[0].makna[0].kelas[0]["kode"] == "n"
+
+
+@pytest.mark.parametrize("malas", [False, True])
+def test_pickle_kbbi(autentikasi, malas):
+    alam = MockKBBI("alam", autentikasi, malas=malas)
+    alam.serialisasi()
+    salinan = pickle.loads(pickle.dumps(alam))
+    assert salinan.serialisasi() == alam.serialisasi()
+    kelas = salinan.entri[0].makna[0].kelas[0]
+    assert kelas is alam.entri[0].makna[0].kelas[0]
+    assert not hasattr(salinan.entri[0], "__dict__")
+
+
+@pytest.mark.parametrize(
+    "berkas",
+    sorted(
+        (pathlib.Path(__file__).parent / "kasus" / "auth" / "serialisasi")
+        .resolve(strict=True)
+        .iterdir()
+    ),
+    ids=lambda berkas: berkas.stem,
+)
+def test_dari_html(berkas):
+    kueri = berkas.stem
+    folder = pathlib.Path(__file__).parent / "html" / "auth"
+    (html,) = folder.glob(f"**/{glob.escape(kueri)}.html")
+    try:
+        objek = kbbi.KBBI.dari_html(html.read_text(), kueri)
+    except kbbi.TidakDitemukan as e:
+        objek = e.objek
+    assert objek.terautentikasi
+    assert objek.serialisasi() == json.loads(berkas.read_text())
+
+
+def test_dari_html_galat():
+    with pytest.raises(kbbi.BatasSehari):
+        kbbi.KBBI.dari_html("", "alam", url="https://x/Beranda/BatasSehari")
@@ -0,0 +1,77 @@
+import json
+import pickle
+import pathlib
+
+import pytest
+
+import kbbi
+from _mock import MockKBBI
+
+DIR_KASUS = pathlib.Path(__file__).resolve(strict=True).parent / "kasus"
+
+kasus = [
+    (auth, berkas)
+    for auth in ("auth", "nonauth")
+    for berkas in sorted((DIR_KASUS / auth / "serialisasi").iterdir())
+]
+
+
+@pytest.mark.parametrize(
+    "auth,berkas", kasus, ids=lambda v: getattr(v, "stem", v)
+)
+def test_malas_hasil_sama(auth, berkas, autentikasi):
+    autentikasi = autentikasi if auth == "auth" else None
+    objek = MockKBBI._init_aman(berkas.stem, autentikasi, malas=True)
+    assert objek.serialisasi() == json.loads(berkas.read_text())
+    objek = MockKBBI._init_aman(berkas.stem, autentikasi, malas=True)
+    str_berkas = DIR_KASUS / auth / "str" / f"{berkas.stem}.txt"
+    assert str(objek) == str_berkas.read_text().strip()
+
+
+def test_malas_hanya_judul(autentikasi):
+    objek = MockKBBI("alam", autentikasi, malas=True)
+    entri = objek.entri[0]
+    assert entri.nama == "alam"
+    assert entri._entri is not None
+    makna = entri.makna
+    assert entri.makna is makna
+    assert entri.terkait["kata_turunan"]
+    assert entri._entri is None
+
+
+def test_malas_atribut_tidak_ada():
+    entri = MockKBBI("alam", malas=True).entri[0]
+    with pytest.raises(AttributeError):
+        entri.tidak_ada
+    assert isinstance(entri.makna[0], kbbi.Makna)
+
+
+def test_malas_galat_urai(monkeypatch):
+    entri = MockKBBI("alam", malas=True).entri[0]
+
+    def _init_makna(self, entri):
+        raise AttributeError("makna")
+
+    monkeypatch.setattr(kbbi.Entri, "_init_makna", _init_makna)
+    with pytest.raises(kbbi.EntriTidakValid) as e:
+        entri.makna
+    assert isinstance(e.value.__cause__, AttributeError)
+    assert entri._entri is not None
+
+    monkeypatch.undo()
+    assert isinstance(entri.makna[0], kbbi.Makna)
+    assert entri._entri is None
+    assert entri._kunci is None
+
+
+def test_malas_kunci_per_entri():
+    pertama, kedua = MockKBBI("alam", malas=True).entri[:2]
+    assert pertama._kunci is not kedua._kunci
+
+
+def test_malas_pickle():
+    entri = MockKBBI("alam", malas=True).entri[0]
+    salinan = pickle.loads(pickle.dumps(entri))
+    assert salinan._kunci is not None
+    assert salinan.serialisasi() == entri.serialisasi()
+    assert salinan._kunci is None
@@ -0,0 +1,160 @@
+import json
+import pathlib
+import signal
+import subprocess
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote
+
+import pytest
+import requests
+
+import kbbi
+from _mock import MockKBBI
+from kbbi.peladen import PeladenKBBI
+
+DIR_KASUS = pathlib.Path(__file__).resolve(strict=True).parent / "kasus"
+
+
+class MockPeladenKBBI(PeladenKBBI):
+    kelas_kbbi = MockKBBI
+
+
+@pytest.fixture
+def peladen():
+    peladen = MockPeladenKBBI(("127.0.0.1", 0), catat=False)
+    utas = threading.Thread(target=peladen.serve_forever)
+    utas.start()
+    alamat, port = peladen.server_address
+    peladen.url = f"http://{alamat}:{port}"
+    yield peladen
+    peladen.shutdown()
+    peladen.server_close()
+    utas.join()
+
+
+def serialisasi(kueri):
+    berkas = DIR_KASUS / "nonauth" / "serialisasi" / f"{kueri}.json"
+    return json.loads(berkas.read_text())
+
+
+@pytest.mark.parametrize("kueri", ["alam", "civitas academica", "quo vadis?"])
+def test_peladen_entri(peladen, kueri):
+    respons = requests.get(f"{peladen.url}/entri/{quote(kueri)}")
+    assert respons.status_code == 200
+    assert respons.headers["Content-Type"] == "application/json; charset=utf-8"
+    assert respons.json() == serialisasi(kueri)
+
+
+def test_peladen_tidak_ditemukan(peladen):
+    respons = requests.get(f"{peladen.url}/entri/idn45")
+    assert respons.status_code == 404
+    assert respons.json() == serialisasi("idn45")
+
+
+@pytest.mark.parametrize(
+    "lokasi,galat,status",
+    [
+        ("Beranda/Error.html", "TerjadiKesalahan", 502),
+        ("Beranda/BatasSehari.html", "BatasSehari", 429),
+        ("Account/Banned.html", "AkunDibekukan", 403),
+        ("Account/Login.html", "LamanTidakValid", 502),
+        ("tidak/ada.html", "LamanTidakValid", 502),
+    ],
+)
+def test_peladen_galat(peladen, lokasi, galat, status):
+    peladen.kwargs["lokasi"] = lokasi
+    respons = requests.get(f"{peladen.url}/entri/alam")
+    assert respons.status_code == status
+    assert respons.json()["galat"] == galat
+
+
+@pytest.mark.parametrize("lokasi", ["/entri/", "/entri/%20", "/lain"])
+def test_peladen_laman_tidak_ada(peladen, lokasi):
+    respons = requests.get(f"{peladen.url}{lokasi}")
+    assert respons.status_code in (400, 404)
+    assert "galat" in respons.json()
+
+
+def test_peladen_tembolok_dan_status(peladen):
+    with requests.Session() as sesi:
+        for _ in range(3):
+            sesi.get(f"{peladen.url}/entri/alam")
+        status = sesi.get(f"{peladen.url}/status").json()
+    assert status["terautentikasi"] is False
+    assert status["tembolok"]["kena"] == 2
+    assert status["tembolok"]["luput"] == 1
+
+
+def test_peladen_bersamaan(peladen):
+    kueri = ["alam", "roh", "lampir", "sage", "kan", "makin"] * 3
+
+    def ambil(k):
+        return requests.get(f"{peladen.url}/entri/{k}").json()
+
+    with ThreadPoolExecutor(8) as eksekutor:
+        hasil = list(eksekutor.map(ambil, kueri))
+    assert hasil == [serialisasi(k) for k in kueri]
+
+
+def test_peladen_menunggu_permintaan_berjalan():
+    mulai = threading.Event()
+    lanjut = threading.Event()
+
+    class KBBILambat(MockKBBI):
+        def _proses_laman(self, laman):
+            mulai.set()
+            lanjut.wait(5)
+            super()._proses_laman(laman)
+
+    class PeladenLambat(PeladenKBBI):
+        kelas_kbbi = KBBILambat
+
+    peladen = PeladenLambat(("127.0.0.1", 0), catat=False)
+    utas = threading.Thread(target=peladen.serve_forever)
+    utas.start()
+    alamat, port = peladen.server_address
+    hasil = []
+    klien = threading.Thread(
+        target=lambda: hasil.append(
+            requests.get(f"http://{alamat}:{port}/entri/alam")
+        )
+    )
+    klien.start()
+    assert mulai.wait(5)
+    peladen.shutdown()
+    utas.join()
+    threading.Timer(0.1, lanjut.set).start()
+    peladen.server_close()
+    klien.join()
+    assert hasil[0].status_code == 200
+    assert hasil[0].json() == serialisasi("alam")
+
+
+def test_peladen_main_kuki_tidak_ada(capsys, tanpa_kuki):
+    hasil = kbbi.peladen.main(["--lokasi-kuki", "kukiku.json"])
+    assert (
+        capsys.readouterr().out == "Kuki tidak ditemukan pada kukiku.json!\n"
+    )
+    assert hasil == 1
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGTERM"), reason="tanpa sinyal")
+def test_peladen_main_berhenti_dengan_sigterm():
+    proses = subprocess.Popen(
+        [sys.executable, "-m", "kbbi.peladen", "--port", "0", "--senyap"],
+        stdout=subprocess.PIPE,
+        universal_newlines=True,
+    )
+    try:
+        baris = proses.stdout.readline()
+        url = baris.split()[-1].rstrip("/")
+        respons = requests.get(f"{url}/status")
+        assert respons.json()["tembolok"]["objek"] == 0
+        proses.send_signal(signal.SIGTERM)
+        assert proses.wait(10) == 0
+        assert proses.stdout.read() == "Peladen KBBI dihentikan.\n"
+    finally:
+        proses.kill()
+        proses.stdout.close()
@@ -0,0 +1,152 @@
+import threading
+
+import pytest
+
+import kbbi
+from _mock import MockKBBI
+
+
+class JamPalsu:
+    def __init__(self):
+        self.sekarang = 0.0
+        self.tidur = []
+
+    def waktu(self):
+        return self.sekarang
+
+    def tunggu(self, detik):
+        self.tidur.append(detik)
+        self.sekarang += detik
+
+
+@pytest.fixture
+def jam(monkeypatch):
+    jam = JamPalsu()
+    monkeypatch.setattr(kbbi.PembatasLaju, "_waktu", jam.waktu)
+    monkeypatch.setattr(kbbi.PembatasLaju, "_tidur", jam.tunggu)
+    return jam
+
+
+@pytest.fixture
+def pembatas_proses():
+    yield
+    kbbi.atur_pembatas_laju(None)
+
+
+@pytest.fixture
+def lokasi_kuota(tmp_path):
+    return tmp_path / "kuota.sqlite3"
+
+
+def test_token_bucket(jam):
+    pembatas = kbbi.PembatasLaju(laju=2, kapasitas=2)
+    assert pembatas.ambil() == 0
+    assert pembatas.ambil() == 0
+    assert pembatas.ambil() == 0.5
+    assert pembatas.ambil() == 0.5
+    jam.sekarang += 10
+    assert pembatas.ambil() == 0
+    assert jam.tidur == [0.5, 0.5]
+
+
+def test_tanpa_laju(jam):
+    pembatas = kbbi.PembatasLaju()
+    for _ in range(100):
+        assert pembatas.ambil() == 0
+    assert pembatas.sisa_kuota() is None
+
+
+def test_kuota_harian_disimpan(lokasi_kuota):
+    pembatas = kbbi.PembatasLaju(kuota_harian=3, lokasi_kuota=lokasi_kuota)
+    assert pembatas.sisa_kuota() == 3
+    pembatas.ambil()
+    pembatas.ambil()
+    pembatas.tutup()
+    lain = kbbi.PembatasLaju(kuota_harian=3, lokasi_kuota=lokasi_kuota)
+    assert lain.sisa_kuota() == 1
+    lain.ambil()
+    with pytest.raises(kbbi.KuotaHabis):
+        lain.ambil()
+    assert lain.sisa_kuota() == 0
+    beda_nama = kbbi.PembatasLaju(
+        kuota_harian=3, lokasi_kuota=lokasi_kuota, nama_kuota="auth"
+    )
+    assert beda_nama.sisa_kuota() == 3
+
+
+def test_kuota_harian_bersamaan(lokasi_kuota):
+    pembatas = kbbi.PembatasLaju(kuota_harian=50, lokasi_kuota=lokasi_kuota)
+    berhasil = []
+
+    def pakai():
+        for _ in range(20):
+            try:
+                pembatas.ambil()
+            except kbbi.KuotaHabis:
+                continue
+            berhasil.append(1)
+
+    utas = [threading.Thread(target=pakai) for _ in range(4)]
+    for u in utas:
+        u.start()
+    for u in utas:
+        u.join()
+    assert len(berhasil) == 50
+
+
+def test_kuota_ganti_hari(lokasi_kuota, monkeypatch):
+    pembatas = kbbi.PembatasLaju(kuota_harian=1, lokasi_kuota=lokasi_kuota)
+    pembatas.ambil()
+    monkeypatch.setattr(pembatas, "_tanggal", lambda: "2100-01-01")
+    assert pembatas.sisa_kuota() == 1
+    pembatas.ambil()
+
+
+def test_kbbi_menggunakan_pembatas(lokasi_kuota):
+    pembatas = kbbi.PembatasLaju(kuota_harian=1, lokasi_kuota=lokasi_kuota)
+    MockKBBI("alam", pembatas=pembatas)
+    with pytest.raises(kbbi.BatasSehari) as e:
+        MockKBBI("roh", pembatas=pembatas)
+    assert isinstance(e.value, kbbi.KuotaHabis)
+
+
+def test_tembolok_tidak_memakai_kuota(lokasi_kuota, tmp_path):
+    pembatas = kbbi.PembatasLaju(kuota_harian=5, lokasi_kuota=lokasi_kuota)
+    tembolok = kbbi.TembolokLaman(tmp_path / "tembolok.sqlite3")
+    MockKBBI("alam", tembolok=tembolok, pembatas=pembatas)
+    MockKBBI("alam", tembolok=tembolok, pembatas=pembatas)
+    assert pembatas.sisa_kuota() == 4
+
+
+def test_batas_sehari_menandai_kuota_habis(lokasi_kuota):
+    pembatas = kbbi.PembatasLaju(kuota_harian=5, lokasi_kuota=lokasi_kuota)
+    with pytest.raises(kbbi.BatasSehari):
+        MockKBBI("coba", lokasi="Beranda/BatasSehari.html", pembatas=pembatas)
+    assert pembatas.sisa_kuota() == 0
+
+
+def test_pembatas_proses(lokasi_kuota, pembatas_proses):
+    pembatas = kbbi.PembatasLaju(kuota_harian=5, lokasi_kuota=lokasi_kuota)
+    kbbi.atur_pembatas_laju(pembatas)
+    MockKBBI("alam")
+    MockKBBI("roh")
+    assert pembatas.sisa_kuota() == 3
+
+
+def test_penjadwal_prioritas(lokasi_kuota):
+    pembatas = kbbi.PembatasLaju(kuota_harian=2, lokasi_kuota=lokasi_kuota)
+    penjadwal = kbbi.PenjadwalPencarian(pekerja=1, pembatas=pembatas)
+    penjadwal.kelas_kbbi = MockKBBI
+    for kueri, prioritas in [("roh", 1), ("alam", 5), ("huk", 3), ("sage", 1)]:
+        penjadwal.tambah(kueri, prioritas)
+    hasil = list(penjadwal.jalankan())
+    assert [h.kueri for h in hasil] == ["alam", "huk"]
+    assert isinstance(hasil[1].galat, kbbi.TidakDitemukan)
+    assert isinstance(penjadwal.galat, kbbi.KuotaHabis)
+    assert len(penjadwal) == 2
+
+    penjadwal.kwargs["pembatas"] = None
+    hasil = list(penjadwal.jalankan())
+    assert [h.kueri for h in hasil] == ["roh", "sage"]
+    assert penjadwal.galat is None
+    assert len(penjadwal) == 0
@@ -0,0 +1,80 @@
+import pytest
+
+import kbbi
+from _mock import MockKBBI
+
+
+@pytest.fixture
+def peristiwa():
+    daftar = []
+    with kbbi.amati(daftar.append):
+        yield daftar
+
+
+def test_tahap_diamati(peristiwa, autentikasi):
+    alam = MockKBBI("alam", autentikasi)
+    alam.serialisasi()
+    tahap = [p.tahap for p in peristiwa]
+    assert tahap == [
+        "ambil",
+        "cek_autentikasi",
+        "cek_galat",
+        "entri",
+        "entri",
+        "entri",
+        "init_entri",
+        "serialisasi",
+    ]
+    assert all(p.kueri == "alam" for p in peristiwa)
+    assert all(p.durasi >= 0 and p.galat is None for p in peristiwa)
+    bita = {
+        p.bita for p in peristiwa if p.tahap not in ("entri", "serialisasi")
+    }
+    assert len(bita) == 1 and bita.pop() > 0
+    assert peristiwa[3].bita is None
+
+
+def test_tahap_entri_pengekstrak_tidak_diamati(peristiwa):
+    MockKBBI("alam", pengurai="pengekstrak")
+    assert [p.tahap for p in peristiwa] == [
+        "ambil",
+        "cek_autentikasi",
+        "cek_galat",
+        "init_entri",
+    ]
+
+
+def test_galat_diamati(peristiwa):
+    with pytest.raises(kbbi.TidakDitemukan):
+        MockKBBI("idn45")
+    assert [p.tahap for p in peristiwa] == [
+        "ambil",
+        "cek_autentikasi",
+        "cek_galat",
+    ]
+    assert isinstance(peristiwa[-1].galat, kbbi.TidakDitemukan)
+
+
+def test_dari_html_diamati(peristiwa):
+    with pytest.raises(kbbi.AkunDibekukan):
+        kbbi.KBBI.dari_html("", "alam", url="https://x/Account/Banned")
+    assert [p.tahap for p in peristiwa] == ["cek_autentikasi", "cek_galat"]
+    assert isinstance(peristiwa[-1].galat, kbbi.AkunDibekukan)
+
+
+def test_hapus_pengamat():
+    daftar = []
+    kbbi.tambah_pengamat(daftar.append)
+    MockKBBI("alam")
+    kbbi.hapus_pengamat(daftar.append)
+    jumlah = len(daftar)
+    assert jumlah > 0
+    MockKBBI("alam")
+    assert len(daftar) == jumlah
+    assert not kbbi.kbbi._pengamat
+
+
+def test_tanpa_pengamat():
+    assert kbbi.kbbi._ukur_tahap("ambil", "alam") is (
+        kbbi.kbbi._TANPA_PENGUKUR
+    )
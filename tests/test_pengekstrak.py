@@ -0,0 +1,61 @@
+import pathlib
+
+import pytest
+
+from kbbi import KBBI, Entri, LamanTidakValid, TidakDitemukan
+from kbbi.pengekstrak import ekstrak_entri
+
+DIR_HTML = pathlib.Path(__file__).resolve(strict=True).parent / "html"
+
+laman = sorted(DIR_HTML.glob("*auth/**/*.html"))
+
+
+def urai(html, kueri, pengurai):
+    try:
+        return KBBI.dari_html(html, kueri, pengurai=pengurai)
+    except TidakDitemukan as e:
+        return e.objek
+
+
+@pytest.mark.parametrize(
+    "berkas", laman, ids=lambda b: str(b.relative_to(DIR_HTML))
+)
+def test_pengekstrak_sama_dengan_beautifulsoup(berkas):
+    html = berkas.read_text("utf-8")
+    kueri = berkas.stem
+    referensi = urai(html, kueri, "html.parser")
+    objek = urai(html, kueri, "pengekstrak")
+    assert objek.serialisasi() == referensi.serialisasi()
+    assert str(objek) == str(referensi)
+    if referensi.entri and not referensi.terautentikasi:
+        entri = ekstrak_entri(html)
+        assert [str(e) for e in entri] == [str(e) for e in referensi.entri]
+
+
+def test_pengekstrak_html_tidak_rapi():
+    html = (
+        "<hr></i><h2>a<sup>1</sup></h2><ol><li><font color=red>"
+        "<span title='Nomina: kata benda'>n</span></font> satu</b></li>"
+        "<li>dua; tiga</li></ol><hr><h2>bukan entri</h2>"
+    )
+    (entri,) = ekstrak_entri(html)
+    referensi = Entri(html[4 : html.rfind("<hr>")], pengurai="html.parser")
+    assert entri.serialisasi() == referensi.serialisasi()
+    assert entri.nama == "a"
+    assert entri.nomor == "1"
+    assert [m.submakna for m in entri.makna] == [["satu"], ["dua", "tiga"]]
+    assert entri.makna[0].kelas[0]["nama"] == "Nomina"
+
+
+def test_pengekstrak_tanpa_entri():
+    assert ekstrak_entri("<p>Entri tidak ditemukan.</p>") == []
+
+
+def test_pengekstrak_tanpa_hr_penutup():
+    html = (DIR_HTML / "nonauth" / "entri" / "alam.html").read_text("utf-8")
+    terpotong = html[: html.index("<hr", html.index("<h2")) - 1]
+    with pytest.raises(LamanTidakValid):
+        ekstrak_entri(terpotong, "alam")
+    for pengurai in ("html.parser", "pengekstrak"):
+        with pytest.raises(LamanTidakValid):
+            KBBI.dari_html(terpotong, "alam", pengurai=pengurai)
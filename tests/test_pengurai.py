@@ -0,0 +1,71 @@
+import json
+import pathlib
+from importlib.util import find_spec
+
+import pytest
+from bs4 import FeatureNotFound
+
+import kbbi
+from _mock import MockKBBI
+
+DIR_KASUS = pathlib.Path(__file__).resolve(strict=True).parent / "kasus"
+
+pengurai = [
+    "html.parser",
+    "pengekstrak",
+    pytest.param(
+        "lxml",
+        marks=pytest.mark.skipif(
+            find_spec("lxml") is None,
+            reason="lxml tidak terinstal",
+        ),
+    ),
+]
+
+kasus = [
+    (auth, berkas)
+    for auth in ("auth", "nonauth")
+    for berkas in sorted((DIR_KASUS / auth / "serialisasi").iterdir())
+]
+
+
+@pytest.fixture
+def pengurai_bawaan():
+    yield
+    kbbi.atur_pengurai(None)
+
+
+@pytest.mark.parametrize("nama_pengurai", pengurai)
+@pytest.mark.parametrize(
+    "auth,berkas", kasus, ids=lambda v: getattr(v, "stem", v)
+)
+def test_pengurai_hasil_sama(nama_pengurai, auth, berkas, autentikasi):
+    autentikasi = autentikasi if auth == "auth" else None
+    objek = MockKBBI._init_aman(
+        berkas.stem, autentikasi, pengurai=nama_pengurai
+    )
+    assert objek.serialisasi() == json.loads(berkas.read_text())
+    str_berkas = DIR_KASUS / auth / "str" / f"{berkas.stem}.txt"
+    assert str(objek) == str_berkas.read_text().strip()
+
+
+@pytest.mark.parametrize("nama_pengurai", pengurai)
+def test_atur_pengurai_global(nama_pengurai, pengurai_bawaan):
+    kbbi.atur_pengurai(nama_pengurai)
+    assert kbbi.ambil_pengurai() == nama_pengurai
+    assert kbbi.ambil_pengurai("html5lib") == "html5lib"
+    referensi = MockKBBI("alam", pengurai="html.parser")
+    assert MockKBBI("alam").serialisasi() == referensi.serialisasi()
+
+
+def test_pengurai_otomatis(pengurai_bawaan):
+    kbbi.atur_pengurai(None)
+    if find_spec("lxml") is None:
+        assert kbbi.ambil_pengurai() == "html.parser"
+    else:
+        assert kbbi.ambil_pengurai() == "lxml"
+
+
+def test_pengurai_tidak_ada():
+    with pytest.raises(FeatureNotFound):
+        MockKBBI("alam", pengurai="pengurai-tidak-ada")
@@ -0,0 +1,64 @@
+import io
+import json
+import pathlib
+
+import pytest
+
+import kbbi
+
+DIR_KASUS = pathlib.Path(__file__).resolve(strict=True).parent / "kasus"
+SERIALISASI = [
+    json.loads(berkas.read_text())
+    for berkas in sorted(DIR_KASUS.glob("*/serialisasi/*.json"))
+]
+
+
+def tulis(daftar, **kwargs):
+    berkas = io.StringIO()
+    with kbbi.PenulisJSON(berkas, **kwargs) as penulis:
+        assert penulis.tulis_banyak(daftar) == len(daftar)
+    return berkas.getvalue()
+
+
+@pytest.mark.parametrize("indentasi", [None, 0, 2, 4])
+def test_penulis_larik_sama_dengan_json_dumps(indentasi):
+    hasil = tulis(SERIALISASI, larik=True, indentasi=indentasi)
+    assert hasil == json.dumps(SERIALISASI, indent=indentasi)
+
+
+@pytest.mark.parametrize("indentasi", [None, 2])
+def test_penulis_larik_kosong(indentasi):
+    assert tulis([], larik=True, indentasi=indentasi) == "[]"
+
+
+def test_penulis_jsonl():
+    hasil = tulis(SERIALISASI)
+    assert hasil == "".join(json.dumps(s) + "\n" for s in SERIALISASI)
+
+
+def test_penulis_objek_kbbi_dan_entri():
+    alam = kbbi.KBBI.dari_serialisasi(SERIALISASI[0])
+    hasil = tulis([alam, alam.entri[0]], fitur_pengguna=False)
+    assert hasil.splitlines() == [
+        json.dumps(alam.serialisasi(False)),
+        json.dumps(alam.entri[0].serialisasi(False)),
+    ]
+
+
+def test_penulis_biner():
+    berkas = io.BytesIO()
+    with kbbi.PenulisJSON(berkas, larik=True) as penulis:
+        penulis.tulis_banyak(iter(SERIALISASI))
+    assert json.loads(berkas.getvalue().decode("utf-8")) == SERIALISASI
+
+
+@pytest.mark.parametrize("indentasi", [None, 2])
+def test_penulis_cepat(indentasi):
+    pytest.importorskip("orjson")
+    hasil = tulis(SERIALISASI, larik=True, indentasi=indentasi, cepat=True)
+    assert json.loads(hasil) == SERIALISASI
+
+
+def test_penulis_cepat_indentasi_lain():
+    hasil = tulis(SERIALISASI, larik=True, indentasi=4, cepat=True)
+    assert hasil == json.dumps(SERIALISASI, indent=4)
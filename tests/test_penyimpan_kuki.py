@@ -0,0 +1,99 @@
+import json
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+import kbbi
+from kbbi import PenyimpanKuki
+from _mock import MockKBBI
+
+NAMA = ".AspNet.ApplicationCookie"
+
+
+@pytest.fixture
+def lokasi(tmp_path):
+    return tmp_path / "data" / "kuki.json"
+
+
+def test_simpan_dan_ambil(lokasi):
+    penyimpan = PenyimpanKuki(lokasi)
+    penyimpan.simpan({NAMA: "enak"})
+    assert json.loads(lokasi.read_text()) == {NAMA: "enak"}
+    assert penyimpan.ambil() == {NAMA: "enak"}
+    assert [p.name for p in lokasi.parent.iterdir()] == ["kuki.json"]
+
+
+def test_ambil_dari_memori(lokasi):
+    lokasi.parent.mkdir()
+    lokasi.write_text(json.dumps({NAMA: "lama"}))
+    penyimpan = PenyimpanKuki(lokasi)
+    assert penyimpan.ambil() == {NAMA: "lama"}
+    assert penyimpan.ambil() == {NAMA: "lama"}
+    assert penyimpan.dibaca == 1
+
+    PenyimpanKuki(lokasi).simpan({NAMA: "baru"})
+    assert penyimpan.ambil() == {NAMA: "baru"}
+    assert penyimpan.dibaca == 2
+
+
+def test_ambil_tidak_ada(lokasi):
+    with pytest.raises(FileNotFoundError):
+        PenyimpanKuki(lokasi).ambil()
+
+
+def test_bersama(lokasi, monkeypatch):
+    monkeypatch.setattr(PenyimpanKuki, "_semua", {})
+    lokasi.parent.mkdir()
+    penyimpan = PenyimpanKuki.bersama(lokasi)
+    assert PenyimpanKuki.bersama(str(lokasi)) is penyimpan
+    lain = lokasi.parent / ".." / "data" / lokasi.name
+    assert PenyimpanKuki.bersama(lain) is penyimpan
+    assert PenyimpanKuki.bersama(lokasi.parent / "lain.json") is not penyimpan
+
+
+def test_autentikasi_sesi_bersama(lokasi, monkeypatch):
+    monkeypatch.setattr(PenyimpanKuki, "_semua", {})
+    PenyimpanKuki(lokasi).simpan({NAMA: "enak"})
+    pertama = kbbi.AutentikasiKBBI(lokasi_kuki=lokasi)
+    kedua = kbbi.AutentikasiKBBI(lokasi_kuki=lokasi)
+    assert pertama.sesi is kedua.sesi
+    assert pertama.sesi.cookies.get(NAMA) == "enak"
+    assert PenyimpanKuki.bersama(lokasi).dibaca == 1
+
+    PenyimpanKuki(lokasi).simpan({NAMA: "baru"})
+    ketiga = kbbi.AutentikasiKBBI(lokasi_kuki=lokasi)
+    assert ketiga.sesi is pertama.sesi
+    assert pertama.sesi.cookies.get(NAMA) == "baru"
+
+
+def test_sesi_diperbarui_sebelum_permintaan(lokasi, monkeypatch):
+    monkeypatch.setattr(PenyimpanKuki, "_semua", {})
+    PenyimpanKuki(lokasi).simpan({NAMA: "enak"})
+    auth = kbbi.AutentikasiKBBI(lokasi_kuki=lokasi)
+    PenyimpanKuki(lokasi).simpan({NAMA: "baru"})
+    assert auth.sesi.cookies.get(NAMA) == "enak"
+    auth.sesi.get(f"{MockKBBI.host}/nonauth/entri/alam.html")
+    assert auth.sesi.cookies.get(NAMA) == "baru"
+
+    lokasi.unlink()
+    auth.sesi.get(f"{MockKBBI.host}/nonauth/entri/alam.html")
+    assert auth.sesi.cookies.get(NAMA) == "baru"
+
+
+def tulis_dan_baca(lokasi, nomor, ulang=50):
+    penyimpan = PenyimpanKuki(lokasi)
+    for i in range(ulang):
+        penyimpan.simpan({NAMA: f"{nomor}-{i}"})
+        assert penyimpan.ambil()[NAMA].count("-") == 1
+        assert json.loads(lokasi.read_text())[NAMA].count("-") == 1
+    return ulang
+
+
+def test_banyak_proses(lokasi):
+    PenyimpanKuki(lokasi).simpan({NAMA: "awal"})
+    with ProcessPoolExecutor(4) as eksekutor:
+        hasil = list(eksekutor.map(tulis_dan_baca, [lokasi] * 8, range(8)))
+    assert hasil == [50] * 8
+    nilai = json.loads(lokasi.read_text())[NAMA]
+    assert nilai.endswith("-49")
+    assert [p.name for p in lokasi.parent.iterdir()] == ["kuki.json"]
@@ -0,0 +1,210 @@
+import json
+import pathlib
+
+import pytest
+import requests
+
+from kbbi import KBBI, BatasSehari, Laman, SirkuitTerbuka, TidakAdaDiTembolok
+from kbbi.perayap import Perayap, ambil_tautan
+
+DIR_HTML = pathlib.Path(__file__).resolve(strict=True).parent / "html"
+
+
+class KBBILokal(KBBI):
+    """KBBI yang mengambil laman dari direktori html/auth/entri."""
+
+    batas = None
+    diambil = []
+    gagal = {}
+
+    def _init_sesi(self, auth, sesi=None):
+        self.sesi = None
+
+    def _ambil_laman(self, terautentikasi, tembolok=None, alir=False):
+        url = f"{self.host}/{self.lokasi}"
+        if self.batas is not None and len(self.diambil) >= self.batas:
+            return Laman(f"{self.host}/Beranda/BatasSehari", "")
+        galat = self.gagal.get(self.nama)
+        if isinstance(galat, Exception):
+            raise galat
+        if galat is not None:
+            laman = Laman(url, "<p>Server sedang sibuk.</p>")
+            laman.status_code = galat
+            return laman
+        self.diambil.append(self.nama)
+        berkas = DIR_HTML / "auth" / "entri" / f"{self.nama}.html"
+        if not berkas.exists():
+            return Laman(url, "<p>Entri tidak ditemukan.</p>")
+        return Laman(url, berkas.read_text("utf-8"))
+
+
+class MockPerayap(Perayap):
+    kelas_kbbi = KBBILokal
+
+
+@pytest.fixture(autouse=True)
+def bersihkan(monkeypatch):
+    monkeypatch.setattr(KBBILokal, "diambil", [])
+    monkeypatch.setattr(KBBILokal, "gagal", {})
+
+
+def objek(kueri):
+    berkas = DIR_HTML / "auth" / "entri" / f"{kueri}.html"
+    return KBBI.dari_html(berkas.read_text("utf-8"), kueri)
+
+
+@pytest.mark.parametrize(
+    "kueri,tautan",
+    [
+        ("menjadikan", ["jadi", "menjadikan hati"]),
+        ("me-", ["meng-"]),
+        ("semakin", ["makin"]),
+    ],
+)
+def test_ambil_tautan(kueri, tautan):
+    assert ambil_tautan(objek(kueri)) == tautan
+
+
+def test_ambil_tautan_jenis():
+    tautan = ambil_tautan(objek("tampak"), ["rujukan"])
+    assert tautan == ["campak"]
+    tautan = ambil_tautan(objek("alam"), ["kata_turunan"])
+    assert "kealaman" in tautan
+    assert "alam baka" not in tautan
+
+
+def test_perayap_kedalaman():
+    perayap = MockPerayap(["semakin"], pekerja=2, kedalaman_maks=1)
+    hasil = {h.kueri: h for h in perayap.jalankan()}
+    assert hasil.keys() == {"semakin", "makin"}
+    assert hasil["makin"].galat is None
+    assert len(perayap) == 0
+    assert sorted(KBBILokal.diambil) == ["makin", "semakin"]
+
+
+def test_perayap_tanpa_duplikat():
+    perayap = MockPerayap(["semakin", "makin"], jenis_tautan=["kata_dasar"])
+    hasil = [h.kueri for h in perayap.jalankan()]
+    assert sorted(hasil) == ["makin", "semakin"]
+    assert perayap.jumlah_selesai == 2
+
+
+def test_perayap_tidak_ditemukan():
+    perayap = MockPerayap(["me-"], kedalaman_maks=1)
+    hasil = {h.kueri: h for h in perayap.jalankan()}
+    assert hasil["meng-"].objek is not None
+    assert hasil["meng-"].galat is not None
+
+
+def test_perayap_dilanjutkan(tmp_path, monkeypatch):
+    jurnal = tmp_path / "jurnal.jsonl"
+    monkeypatch.setattr(KBBILokal, "batas", 3)
+    with MockPerayap(["tampak"], jurnal=jurnal, pekerja=3) as perayap:
+        pertama = [h.kueri for h in perayap.jalankan()]
+    assert isinstance(perayap.galat, BatasSehari)
+    assert len(pertama) == 3
+    assert len(perayap) > 0
+
+    monkeypatch.setattr(KBBILokal, "batas", None)
+    with MockPerayap(["tampak"], jurnal=jurnal, pekerja=3) as perayap:
+        assert perayap.jumlah_selesai == 3
+        kedua = [h.kueri for h in perayap.jalankan()]
+    assert perayap.galat is None
+    assert len(perayap) == 0
+    assert not set(pertama) & set(kedua)
+    assert len(KBBILokal.diambil) == len(set(KBBILokal.diambil))
+    assert "campak" in kedua
+
+    catatan = [json.loads(baris) for baris in jurnal.read_text().splitlines()]
+    selesai = [c["selesai"] for c in catatan if "selesai" in c]
+    assert sorted(selesai) == sorted(pertama + kedua)
+
+
+@pytest.mark.parametrize(
+    "galat", [SirkuitTerbuka(), requests.ConnectionError(), 503]
+)
+def test_perayap_galat_sementara(tmp_path, monkeypatch, galat):
+    jurnal = tmp_path / "jurnal.jsonl"
+    kwargs = {"jurnal": jurnal, "pekerja": 1, "jenis_tautan": ["kata_dasar"]}
+    monkeypatch.setattr(KBBILokal, "gagal", {"makin": galat})
+    with MockPerayap(["semakin"], **kwargs) as perayap:
+        hasil = [h.kueri for h in perayap.jalankan()]
+    assert hasil == ["semakin"]
+    assert perayap.galat is not None
+    assert len(perayap) == 1
+
+    monkeypatch.setattr(KBBILokal, "gagal", {})
+    with MockPerayap(**kwargs) as perayap:
+        hasil = [h.kueri for h in perayap.jalankan()]
+    assert hasil == ["makin"]
+    assert perayap.galat is None
+    catatan = [json.loads(baris) for baris in jurnal.read_text().splitlines()]
+    assert [c for c in catatan if "selesai" in c] == [
+        {"selesai": "semakin"},
+        {"selesai": "makin"},
+    ]
+
+
+def test_perayap_luring_tidak_dicatat_selesai(tmp_path, monkeypatch):
+    jurnal = tmp_path / "jurnal.jsonl"
+    kwargs = {"jurnal": jurnal, "jenis_tautan": ["kata_dasar"]}
+    monkeypatch.setattr(
+        KBBILokal, "gagal", {"makin": TidakAdaDiTembolok("makin")}
+    )
+    with MockPerayap(["semakin"], **kwargs) as perayap:
+        hasil = {h.kueri: h for h in perayap.jalankan()}
+    assert isinstance(hasil["makin"].galat, TidakAdaDiTembolok)
+    assert perayap.galat is None
+
+    monkeypatch.setattr(KBBILokal, "gagal", {})
+    with MockPerayap(**kwargs) as perayap:
+        assert len(perayap) == 1
+        assert [h.kueri for h in perayap.jalankan()] == ["makin"]
+
+
+def test_perayap_berhenti_di_tengah(tmp_path):
+    jurnal = tmp_path / "jurnal.jsonl"
+    kwargs = {"jurnal": jurnal, "pekerja": 1, "jenis_tautan": ["kata_dasar"]}
+    with MockPerayap(["semakin"], **kwargs) as perayap:
+        for hasil in perayap.jalankan():
+            break
+    # Hasil yang belum selesai diproses akan diambil ulang.
+    with MockPerayap(**kwargs) as perayap:
+        assert perayap.jumlah_selesai == 0
+        hasil = [h.kueri for h in perayap.jalankan()]
+    assert hasil == ["semakin", "makin"]
+
+
+def test_perayap_jurnal_terpotong(tmp_path):
+    jurnal = tmp_path / "jurnal.jsonl"
+    jurnal.write_text('{"antre": [["makin", 0]]}\n{"selesai": "ma')
+    with MockPerayap(jurnal=jurnal, kedalaman_maks=0) as perayap:
+        assert len(perayap) == 1
+        hasil = [h.kueri for h in perayap.jalankan()]
+    assert hasil == ["makin"]
+
+
+def test_perayap_cli(tmp_path, monkeypatch, capsys):
+    from kbbi import perayap
+
+    monkeypatch.setattr(perayap.Perayap, "kelas_kbbi", KBBILokal)
+    monkeypatch.setattr(KBBILokal, "batas", 1)
+    keluaran = tmp_path / "keluaran.jsonl"
+    jurnal = tmp_path / "jurnal.jsonl"
+    argv = ["semakin", "-o", str(keluaran), "-j", str(jurnal)]
+    assert perayap.main(argv) == 1
+    assert "1 laman selesai, 1 laman dalam antrean." in capsys.readouterr().err
+
+    monkeypatch.setattr(KBBILokal, "batas", None)
+    assert perayap.main(argv) == 0
+    baris = keluaran.read_text().splitlines()
+    assert [json.loads(b) for b in baris] == [
+        objek(k).serialisasi() for k in ("semakin", "makin")
+    ]
+
+
+def test_perayap_cli_tautan_tidak_dikenal(capsys):
+    from kbbi import perayap
+
+    assert perayap.main(["alam", "--tautan", "sinonim"]) == 1
+    assert "sinonim" in capsys.readouterr().out
@@ -0,0 +1,106 @@
+import pytest
+
+import kbbi
+from _mock import MockKBBI
+
+DAFTAR_KATA = [
+    "alam",
+    "Alam",
+    "alami",
+    "salam",
+    "kalam",
+    "lama",
+    "alamat",
+    "buk",
+    "huh",
+    "hak",
+    "hukum",
+    "idealis",
+]
+
+
+@pytest.fixture
+def indeks():
+    return kbbi.IndeksSaran(DAFTAR_KATA)
+
+
+def test_saran_terurut_berdasarkan_jarak(indeks):
+    assert indeks.saran("alma") == ["alam", "Alam", "lama"]
+    assert indeks.saran("alamt") == ["alam", "Alam", "alami", "alamat"]
+    assert indeks.saran("huk") == ["buk", "huh", "hak"]
+
+
+def test_saran_jarak_maks(indeks):
+    assert indeks.saran("idealsi") == ["idealis"]
+    assert indeks.saran("ideasli", jarak_maks=1) == []
+    assert indeks.saran("halamat", jarak_maks=5) == ["alamat"]
+
+
+def test_saran_batas(indeks):
+    assert indeks.saran("alamt", batas=2) == ["alam", "Alam"]
+    assert indeks.saran("alamt", batas=3) == ["alam", "Alam", "alami"]
+
+
+def test_saran_kueri_ada(indeks):
+    assert indeks.saran("  Alam ")[:2] == ["alam", "Alam"]
+    assert "ALAM" in indeks
+    assert "alaam" not in indeks
+    assert len(indeks) == len(DAFTAR_KATA) - 1
+
+
+@pytest.mark.parametrize("jarak", [0, 1, 2, 3])
+def test_jarak_edit(jarak):
+    pasangan = [
+        ("alam", "alam", 0),
+        ("alam", "alma", 1),
+        ("alam", "alamat", 2),
+        ("", "ab", 2),
+        ("kalam", "alami", 2),
+        ("hukum", "huk", 2),
+        ("ab", "ba", 1),
+        ("ca", "abc", 3),
+    ]
+    for a, b, hasil in pasangan:
+        assert kbbi.saran._jarak_edit(a, b, jarak) == min(hasil, jarak + 1)
+        assert kbbi.saran._jarak_edit(b, a, jarak) == min(hasil, jarak + 1)
+
+
+def test_indeks_dari_berkas(tmp_path):
+    berkas = tmp_path / "kata.txt"
+    berkas.write_text("\n".join(DAFTAR_KATA) + "\n\n")
+    indeks = kbbi.IndeksSaran.dari_berkas(berkas)
+    assert len(indeks) == len(DAFTAR_KATA) - 1
+
+
+def test_kbbi_dengan_indeks_saran(indeks):
+    with pytest.raises(kbbi.TidakDitemukan) as e:
+        MockKBBI("huk", indeks_saran=indeks)
+    objek = e.value.objek
+    assert objek.saran_entri == ["buk", "huh", "hak"]
+    assert objek.serialisasi()["saran_entri"] == ["buk", "huh", "hak"]
+    assert str(objek) == (
+        "Berikut beberapa saran entri lain yang mirip.\nbuk, huh, hak"
+    )
+    salinan = kbbi.KBBI.dari_serialisasi(objek.serialisasi())
+    assert not salinan.terautentikasi
+    assert salinan.saran_entri == ["buk", "huh", "hak"]
+
+
+def test_saran_daring_diutamakan(indeks, autentikasi):
+    with pytest.raises(kbbi.TidakDitemukan) as e:
+        MockKBBI("huk", autentikasi, indeks_saran=indeks)
+    assert "hak (1)" in e.value.objek.saran_entri
+
+
+@pytest.mark.parametrize("kbbi_mock", [None], indirect=True)
+def test_program_utama_saran(capsys, kbbi_mock, tanpa_kuki, tmp_path):
+    berkas = tmp_path / "kata.txt"
+    berkas.write_text("\n".join(DAFTAR_KATA))
+    hasil = kbbi.main(["huk", "--saran", str(berkas)])
+    tangkap = capsys.readouterr()
+    assert tangkap.out == (
+        "huk tidak ditemukan dalam KBBI.\n"
+        "Berikut beberapa saran entri lain yang mirip.\n"
+        "buk, huh, hak\n"
+    )
+    assert hasil == 1
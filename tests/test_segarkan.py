@@ -0,0 +1,170 @@
+import pathlib
+
+import pytest
+import requests
+
+import kbbi
+
+DIR_HTML = pathlib.Path(__file__).resolve(strict=True).parent / "html"
+URL_ALAM = f"{kbbi.KBBI.host}/entri/alam"
+HTML_ALAM = (DIR_HTML / "nonauth" / "entri" / "alam.html").read_text("utf-8")
+HTML_ROH = (DIR_HTML / "nonauth" / "entri" / "roh.html").read_text("utf-8")
+
+
+def respons(html=HTML_ALAM, status=200, headers=None):
+    hasil = requests.Response()
+    hasil.status_code = status
+    hasil.url = URL_ALAM
+    hasil.headers.update(headers or {})
+    hasil.encoding = "utf-8"
+    hasil._content = html.encode("utf-8") if status != 304 else b""
+    return hasil
+
+
+class SesiPalsu:
+    def __init__(self, *daftar_respons):
+        self.daftar_respons = list(daftar_respons)
+        self.headers = []
+
+    def get(self, url, headers=None):
+        self.headers.append(headers)
+        return self.daftar_respons.pop(0)
+
+
+@pytest.fixture
+def hitung_urai(monkeypatch):
+    jumlah = []
+    init_entri = kbbi.KBBI._init_entri
+
+    def _init_entri(self, laman):
+        jumlah.append(self.nama)
+        init_entri(self, laman)
+
+    monkeypatch.setattr(kbbi.KBBI, "_init_entri", _init_entri)
+    return jumlah
+
+
+def test_segarkan_direvalidasi(hitung_urai):
+    headers = {
+        "ETag": '"v1"',
+        "Last-Modified": "Mon, 03 May 2021 07:54:10 GMT",
+    }
+    sesi = SesiPalsu(respons(headers=headers), respons(status=304))
+    alam = kbbi.KBBI("alam", sesi=sesi)
+    assert alam._sidik is None
+    entri = alam.entri
+    assert alam.segarkan(sesi=sesi) == "direvalidasi"
+    assert sesi.headers[1] == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Mon, 03 May 2021 07:54:10 GMT",
+    }
+    assert alam.entri is entri
+    assert hitung_urai == ["alam"]
+
+
+def test_segarkan_tidak_berubah(hitung_urai):
+    # Bagian di luar entri (misalnya token formulir) boleh berubah.
+    html_baru = HTML_ALAM.replace("</footer>", "<input value='x'></footer>")
+    assert html_baru != HTML_ALAM
+    sesi = SesiPalsu(respons(), respons(html_baru))
+    alam = kbbi.KBBI("alam", sesi=sesi)
+    entri = alam.entri
+    assert alam.segarkan(sesi=sesi) == "tidak_berubah"
+    assert sesi.headers[1] is None
+    assert alam.entri is entri
+    assert hitung_urai == ["alam"]
+
+
+def test_segarkan_diurai(hitung_urai):
+    sesi = SesiPalsu(respons(), respons(HTML_ROH))
+    alam = kbbi.KBBI("alam", sesi=sesi)
+    assert alam.segarkan(sesi=sesi) == "diurai"
+    assert alam.entri[0].nama == "roh"
+    assert hitung_urai == ["alam", "alam"]
+
+
+def test_segarkan_tidak_ditemukan():
+    html = (DIR_HTML / "nonauth" / "entri" / "idn45.html").read_text("utf-8")
+    sesi = SesiPalsu(respons(), respons(html))
+    alam = kbbi.KBBI("alam", sesi=sesi)
+    assert alam.segarkan(sesi=sesi) == "diurai"
+    assert alam.entri == []
+
+
+def test_segarkan_galat():
+    galat = respons()
+    galat.url = f"{kbbi.KBBI.host}/Beranda/BatasSehari"
+    sesi = SesiPalsu(respons(), galat)
+    alam = kbbi.KBBI("alam", sesi=sesi)
+    entri = alam.entri
+    with pytest.raises(kbbi.BatasSehari):
+        alam.segarkan(sesi=sesi)
+    assert alam.entri is entri
+
+
+def test_segarkan_tetap_terautentikasi(monkeypatch):
+    auth = DIR_HTML / "auth" / "entri"
+    sesi = SesiPalsu(
+        respons((auth / "alam.html").read_text("utf-8")),
+        respons((auth / "roh.html").read_text("utf-8")),
+    )
+    alam = kbbi.KBBI("alam", sesi=sesi)
+    assert alam.terautentikasi
+    monkeypatch.setattr(kbbi.kbbi, "sesi_bersama", None)
+    assert alam.segarkan() == "diurai"
+    assert alam.sesi is sesi
+    assert alam.terautentikasi
+    assert alam.entri[0].nama == "roh"
+
+
+def test_segarkan_gagal_urai():
+    sesi = SesiPalsu(respons(), respons("<html><body></body></html>"))
+    alam = kbbi.KBBI("alam", sesi=sesi)
+    entri = alam.entri
+    sidik = alam._sidik
+    with pytest.raises(kbbi.LamanTidakValid):
+        alam.segarkan()
+    assert alam.entri is entri
+    assert alam._sidik == sidik
+
+
+def test_segarkan_dari_html():
+    alam = kbbi.KBBI.dari_html(HTML_ALAM, "alam")
+    sesi = SesiPalsu(respons())
+    assert alam.segarkan(sesi=sesi) == "tidak_berubah"
+
+
+def test_segarkan_simpan_ke_tembolok(tmp_path):
+    tembolok = kbbi.TembolokLaman(tmp_path / "tembolok.sqlite3")
+    headers = {"ETag": '"v1"'}
+    sesi = SesiPalsu(respons(headers=headers), respons(status=304))
+    alam = kbbi.KBBI("alam", sesi=sesi, tembolok=tembolok)
+    tembolok._koneksi.execute("UPDATE laman SET disimpan = 0")
+    tembolok.umur = 60
+    assert alam.segarkan(sesi=sesi, tembolok=tembolok) == "direvalidasi"
+    assert tembolok.direvalidasi == 1
+    assert tembolok.ambil("entri/alam", False) is not None
+    tembolok.tutup()
+
+
+def test_segarkan_banyak():
+    galat = respons()
+    galat.url = f"{kbbi.KBBI.host}/Beranda/Error"
+    sesi = SesiPalsu(
+        respons(headers={"ETag": '"v1"'}),
+        respons(),
+        respons(),
+        respons(status=304),
+        respons(),
+        respons(HTML_ROH),
+        galat,
+    )
+    daftar_objek = [kbbi.KBBI("alam", sesi=sesi) for _ in range(3)]
+    daftar_objek.append(kbbi.KBBI.dari_html(HTML_ALAM, "alam"))
+    hasil = kbbi.KBBI.segarkan_banyak(daftar_objek, sesi=sesi, pekerja=1)
+    assert hasil == {
+        "direvalidasi": 1,
+        "tidak_berubah": 1,
+        "diurai": 1,
+        "galat": 1,
+    }
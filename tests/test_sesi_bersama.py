@@ -0,0 +1,44 @@
+import pytest
+import requests
+
+import kbbi
+from _mock import MockKBBI
+
+
+@pytest.fixture(autouse=True)
+def sesi_baru():
+    kbbi.tutup_sesi_bersama()
+    yield
+    kbbi.tutup_sesi_bersama()
+
+
+def test_sesi_bersama_digunakan_kembali():
+    alam = MockKBBI("alam")
+    roh = MockKBBI("roh")
+    assert alam.sesi is roh.sesi is kbbi.sesi_bersama()
+
+
+def test_sesi_diberikan_atau_autentikasi(autentikasi):
+    sesi = requests.Session()
+    assert MockKBBI("alam", sesi=sesi).sesi is sesi
+    assert MockKBBI("alam", autentikasi).sesi is autentikasi.sesi
+
+
+def test_atur_sesi_bersama():
+    lama = kbbi.sesi_bersama()
+    baru = kbbi.atur_sesi_bersama(ukuran_pool=32)
+    assert baru is not lama
+    assert baru.get_adapter(MockKBBI.host)._pool_maxsize == 32
+    assert MockKBBI("alam").sesi is baru
+
+
+def test_atur_sesi_bersama_dengan_sesi():
+    sesi = requests.Session()
+    assert kbbi.atur_sesi_bersama(sesi=sesi) is sesi
+    assert kbbi.sesi_bersama() is sesi
+
+
+def test_tutup_sesi_bersama():
+    lama = kbbi.sesi_bersama()
+    kbbi.tutup_sesi_bersama()
+    assert kbbi.sesi_bersama() is not lama
@@ -0,0 +1,134 @@
+import pytest
+
+import kbbi
+from _mock import MockKBBI
+
+
+@pytest.fixture
+def tembolok(tmp_path):
+    tembolok = kbbi.TembolokLaman(tmp_path / "tembolok.sqlite3")
+    yield tembolok
+    tembolok.tutup()
+
+
+def test_simpan_dan_ambil_dari_tembolok(tembolok):
+    daring = MockKBBI("alam", tembolok=tembolok)
+    assert len(tembolok) == 1
+    tembolok.luring = True
+    luring = MockKBBI("alam", tembolok=tembolok)
+    assert luring.serialisasi() == daring.serialisasi()
+
+
+def test_kunci_tembolok_membedakan_autentikasi(tembolok, autentikasi):
+    MockKBBI("alam", tembolok=tembolok)
+    MockKBBI("alam", autentikasi, tembolok=tembolok)
+    assert len(tembolok) == 2
+
+
+def test_luring_tidak_ada_di_tembolok(tembolok):
+    tembolok.luring = True
+    with pytest.raises(kbbi.TidakAdaDiTembolok) as e:
+        MockKBBI("alam", tembolok=tembolok)
+    assert str(e.value) == "alam tidak tersedia di tembolok."
+
+
+def test_laman_tidak_ditemukan_disimpan(tembolok):
+    MockKBBI._init_aman("idn45", tembolok=tembolok)
+    tembolok.luring = True
+    with pytest.raises(kbbi.TidakDitemukan):
+        MockKBBI("idn45", tembolok=tembolok)
+
+
+def test_laman_galat_tidak_disimpan(tembolok):
+    with pytest.raises(kbbi.TerjadiKesalahan):
+        MockKBBI("coba", lokasi="Beranda/Error.html", tembolok=tembolok)
+    assert len(tembolok) == 0
+
+
+def test_tembolok_kedaluwarsa(tembolok):
+    MockKBBI("alam", tembolok=tembolok)
+    tembolok.umur = -1
+    assert tembolok.ambil("nonauth/entri/alam.html", False) is None
+    assert len(tembolok) == 0
+
+
+def test_tembolok_kedaluwarsa_tetap_digunakan_saat_luring(tembolok):
+    MockKBBI("alam", tembolok=tembolok)
+    tembolok.umur = -1
+    tembolok.luring = True
+    assert tembolok.ambil("nonauth/entri/alam.html", False) is not None
+
+
+def test_tembolok_membuang_laman_lama(tembolok):
+    tembolok.ukuran_maks = 20
+    for lokasi in ("entri/a", "entri/b"):
+        tembolok.simpan(lokasi, False, kbbi.Laman(lokasi, "x" * 10))
+    tembolok.ambil("entri/a", False)
+    tembolok.simpan("entri/c", False, kbbi.Laman("entri/c", "x" * 10))
+    assert len(tembolok) == 2
+    assert tembolok.ambil("entri/b", False) is None
+    tembolok.ukuran_maks = 1
+    tembolok.simpan("entri/d", False, kbbi.Laman("entri/d", "x" * 10))
+    assert len(tembolok) == 0
+
+
+def diakses(tembolok, lokasi):
+    (hasil,) = tembolok._koneksi.execute(
+        "SELECT diakses FROM laman WHERE lokasi = ?", (lokasi,)
+    ).fetchone()
+    return hasil
+
+
+def test_waktu_akses_tidak_dicatat_tanpa_ukuran_maks(tembolok):
+    tembolok.simpan("entri/a", False, kbbi.Laman("entri/a", "x"))
+    tembolok._koneksi.execute("UPDATE laman SET diakses = 0")
+    tembolok.ambil("entri/a", False)
+    assert tembolok._akses_tertunda == {}
+    assert diakses(tembolok, "entri/a") == 0
+
+
+def test_waktu_akses_ditulis_sekaligus(tembolok):
+    tembolok.ukuran_maks = 1000
+    tembolok.maks_akses_tertunda = 2
+    for lokasi in ("entri/a", "entri/b"):
+        tembolok.simpan(lokasi, False, kbbi.Laman(lokasi, "x"))
+    tembolok._koneksi.execute("UPDATE laman SET diakses = 0")
+    tembolok.ambil("entri/a", False)
+    assert diakses(tembolok, "entri/a") == 0
+    tembolok.ambil("entri/b", False)
+    assert tembolok._akses_tertunda == {}
+    assert diakses(tembolok, "entri/a") > 0
+
+
+def test_bersihkan_tembolok(tembolok):
+    MockKBBI("alam", tembolok=tembolok)
+    tembolok.bersihkan()
+    assert len(tembolok) == 0
+
+
+@pytest.mark.parametrize("kbbi_mock", [None], indirect=True)
+def test_program_utama_luring_tidak_ada_di_tembolok(
+    capsys, kbbi_mock, tanpa_kuki, tmp_path
+):
+    lokasi_tembolok = tmp_path / "tembolok.sqlite3"
+    hasil = kbbi.main(
+        ["alam", "--luring", "--lokasi-tembolok", str(lokasi_tembolok)]
+    )
+    tangkap = capsys.readouterr()
+    assert tangkap.out == "alam tidak tersedia di tembolok.\n"
+    assert hasil == 1
+
+
+def test_tembolok_kedaluwarsa_divalidasi_ulang(tembolok):
+    daring = MockKBBI("alam", tembolok=tembolok)
+    tembolok.umur = -1
+    basi = tembolok.ambil("nonauth/entri/alam.html", False, basi=True)
+    assert basi.basi
+    assert "Last-Modified" in basi.headers
+    tembolok.umur = None
+    tembolok._koneksi.execute("UPDATE laman SET disimpan = 0")
+    tembolok.umur = 60
+    divalidasi = MockKBBI("alam", tembolok=tembolok)
+    assert tembolok.direvalidasi == 1
+    assert divalidasi.serialisasi() == daring.serialisasi()
+    assert tembolok.ambil("nonauth/entri/alam.html", False) is not None
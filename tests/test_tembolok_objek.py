@@ -0,0 +1,158 @@
+import threading
+
+import pytest
+
+import kbbi
+from _mock import MockKBBI
+
+
+class MockTembolokObjek(kbbi.TembolokObjek):
+    kelas_kbbi = MockKBBI
+
+
+def test_ambil_objek_yang_sama():
+    tembolok = MockTembolokObjek()
+    pertama = tembolok.ambil("alam")
+    kedua = tembolok.ambil("  alam ")
+    assert pertama is kedua
+    assert tembolok.statistik() == {
+        "kena": 1,
+        "luput": 1,
+        "objek": 1,
+        "bita": 0,
+    }
+
+
+def test_kunci_membedakan_autentikasi(autentikasi):
+    tembolok = MockTembolokObjek()
+    nonauth = tembolok.ambil("roh")
+    auth = tembolok.ambil("roh", autentikasi)
+    assert nonauth is not auth
+    assert auth.terautentikasi
+    assert len(tembolok) == 2
+
+
+def test_tidak_ditemukan_disimpan(autentikasi):
+    tembolok = MockTembolokObjek()
+    with pytest.raises(kbbi.TidakDitemukan) as pertama:
+        tembolok.ambil("huk", autentikasi)
+    with pytest.raises(kbbi.TidakDitemukan) as kedua:
+        tembolok.ambil("huk", autentikasi)
+    assert kedua.value.objek is pertama.value.objek
+    assert kedua.value.objek.saran_entri
+    assert tembolok.kena == 1
+
+
+def test_kunci_membedakan_argumen():
+    tembolok = MockTembolokObjek()
+    biasa = tembolok.ambil("alam")
+    malas = tembolok.ambil("alam", malas=True)
+    assert malas is not biasa
+    assert tembolok.ambil("alam", malas=True) is malas
+    assert tembolok.statistik()["luput"] == 2
+
+
+def test_objek_dibuat_sekali():
+    mulai = threading.Event()
+
+    class Lambat(MockKBBI):
+        dibuat = 0
+
+        def __init__(self, *args, **kwargs):
+            type(self).dibuat += 1
+            mulai.wait(5)
+            super().__init__(*args, **kwargs)
+
+    class Tembolok(kbbi.TembolokObjek):
+        kelas_kbbi = Lambat
+
+    tembolok = Tembolok()
+    hasil = []
+    utas = [
+        threading.Thread(target=lambda: hasil.append(tembolok.ambil("alam")))
+        for _ in range(4)
+    ]
+    for u in utas:
+        u.start()
+    mulai.set()
+    for u in utas:
+        u.join()
+    assert Lambat.dibuat == 1
+    assert all(h is hasil[0] for h in hasil)
+    assert tembolok.statistik()["luput"] == 1
+    assert tembolok.statistik()["kena"] == 3
+
+
+def test_pembuatan_gagal_tidak_menahan_utas_lain():
+    class Gagal(MockKBBI):
+        def __init__(self, *args, **kwargs):
+            raise kbbi.TerjadiKesalahan()
+
+    class Tembolok(kbbi.TembolokObjek):
+        kelas_kbbi = Gagal
+
+    tembolok = Tembolok()
+    with pytest.raises(kbbi.TerjadiKesalahan):
+        tembolok.ambil("alam")
+    assert tembolok._dimuat == {}
+    assert len(tembolok) == 0
+
+
+def test_batas_jumlah_objek():
+    tembolok = MockTembolokObjek(maks_objek=2)
+    alam = tembolok.ambil("alam")
+    tembolok.ambil("lampir")
+    tembolok.ambil("alam")
+    tembolok.ambil("roh")
+    assert len(tembolok) == 2
+    assert tembolok.ambil("alam") is alam
+    assert tembolok.luput == 3
+
+
+def test_batas_bita():
+    tembolok = MockTembolokObjek(maks_bita=1)
+    tembolok.ambil("alam")
+    assert len(tembolok) == 0
+    assert tembolok.bita == 0
+    tembolok.maks_bita = 10**7
+    tembolok.ambil("alam")
+    assert tembolok.statistik()["bita"] > 0
+
+
+def test_batas_bita_tanpa_mengurai_entri_malas():
+    tembolok = MockTembolokObjek(maks_bita=10**7)
+    pengamat = []
+    with kbbi.amati(pengamat.append):
+        objek = tembolok.ambil("alam", malas=True)
+    assert tembolok.bita > 0
+    assert all(e._entri is not None for e in objek.entri)
+    assert "serialisasi" not in [p.tahap for p in pengamat]
+
+
+def test_umur_objek(monkeypatch):
+    sekarang = [0.0]
+    monkeypatch.setattr(
+        MockTembolokObjek, "_waktu", staticmethod(lambda: sekarang[0])
+    )
+    tembolok = MockTembolokObjek(umur=60, maks_bita=10**7)
+    alam = tembolok.ambil("alam")
+    sekarang[0] = 60
+    assert tembolok.ambil("alam") is alam
+    sekarang[0] = 61
+    baru = tembolok.ambil("alam")
+    assert baru is not alam
+    assert tembolok.ambil("alam") is baru
+    assert tembolok.statistik()["luput"] == 2
+    assert tembolok.bita == kbbi.tembolok._perkiraan_ukuran(baru)
+
+
+def test_bersihkan():
+    tembolok = MockTembolokObjek()
+    tembolok.ambil("alam")
+    tembolok.bersihkan()
+    assert tembolok.statistik() == {
+        "kena": 0,
+        "luput": 0,
+        "objek": 0,
+        "bita": 0,
+    }
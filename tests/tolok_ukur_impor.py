@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+"""Mengukur waktu impor kbbi dan waktu menjalankan kbbi --bantuan.
+
+Waktu impor diukur dengan "python -X importtime" dan waktu CLI diukur sebagai
+selisih waktu menjalankan "kbbi --bantuan" dengan waktu menjalankan
+interpreter kosong. Median dari beberapa pengulangan dibandingkan dengan
+anggaran waktu; skrip akan keluar dengan status 1 jika anggaran terlampaui.
+
+    python tolok_ukur_impor.py [--ulang N] [--anggaran-impor MS]
+                               [--anggaran-cli MS] [--teratas N]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+KODE_CLI = "import sys, kbbi; sys.argv[0] = 'kbbi'; kbbi.main(['--bantuan'])"
+
+
+def _env():
+    # Bytecode perlu disimpan agar yang terukur bukan waktu kompilasi.
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    return env
+
+
+def waktu_impor(env):
+    """Mengukur waktu impor kumulatif kbbi beserta modul yang diimpornya.
+
+    :returns: Dictionary nama modul dan waktu impornya (dalam mikrodetik)
+    """
+    hasil = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import kbbi"],
+        stderr=subprocess.PIPE,
+        env=env,
+        check=True,
+        universal_newlines=True,
+    )
+    baris = []
+    for teks in hasil.stderr.splitlines():
+        if not teks.startswith("import time:"):
+            continue
+        _, kumulatif, nama = teks.split("|")
+        if kumulatif.strip().isdigit():
+            baris.append((nama[1:], int(kumulatif)))
+    # Modul yang diimpor oleh kbbi dicetak sebelum kbbi dengan indentasi.
+    i = next(i for i, (nama, _) in enumerate(baris) if nama == "kbbi")
+    modul = {"kbbi": baris[i][1]}
+    for nama, kumulatif in reversed(baris[:i]):
+        if not nama.startswith(" "):
+            break
+        modul.setdefault(nama.strip(), kumulatif)
+    return modul
+
+
+def waktu_jalan(kode, env):
+    mulai = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-c", kode],
+        stdout=subprocess.DEVNULL,
+        env=env,
+        check=True,
+    )
+    return time.perf_counter() - mulai
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--ulang",
+        type=int,
+        default=10,
+        help="banyaknya setiap pengukuran diulang (bawaan: 10)",
+    )
+    parser.add_argument(
+        "--anggaran-impor",
+        type=float,
+        default=30,
+        metavar="MS",
+        help="anggaran waktu impor kbbi (bawaan: 30 ms)",
+    )
+    parser.add_argument(
+        "--anggaran-cli",
+        type=float,
+        default=60,
+        metavar="MS",
+        help="anggaran waktu kbbi --bantuan di luar interpreter (bawaan: 60)",
+    )
+    parser.add_argument(
+        "--teratas",
+        type=int,
+        default=10,
+        metavar="N",
+        help="tampilkan N modul dengan waktu impor terlama (bawaan: 10)",
+    )
+    args = parser.parse_args(argv)
+    env = _env()
+    waktu_impor(env)  # pemanasan, sekaligus menyimpan bytecode
+
+    semua = [waktu_impor(env) for _ in range(args.ulang)]
+    impor = statistics.median(m["kbbi"] for m in semua) / 1000
+    kosong = statistics.median(
+        waktu_jalan("pass", env) for _ in range(args.ulang)
+    )
+    cli = statistics.median(
+        waktu_jalan(KODE_CLI, env) for _ in range(args.ulang)
+    )
+    cli = (cli - kosong) * 1000
+
+    print(
+        f"Impor kbbi       : {impor:.1f} ms (anggaran {args.anggaran_impor:g})"
+    )
+    print(f"kbbi --bantuan   : {cli:.1f} ms (anggaran {args.anggaran_cli:g})")
+    print(f"Interpreter      : {kosong * 1000:.1f} ms")
+    print()
+    print("Modul terlama (kumulatif):")
+    terakhir = semua[-1]
+    teratas = sorted(terakhir.items(), key=lambda m: m[1], reverse=True)
+    for nama, waktu in teratas[: args.teratas]:
+        print(f"  {waktu / 1000:>7.1f} ms  {nama}")
+
+    lewat = impor > args.anggaran_impor or cli > args.anggaran_cli
+    if lewat:
+        print()
+        print("Anggaran waktu terlampaui!")
+    return 1 if lewat else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+"""Mengukur memori yang digunakan oleh objek-objek hasil penguraian.
+
+Laman-laman dalam direktori html diurai berulang kali tanpa mengakses
+jaringan, lalu memori yang masih digunakan oleh objek-objek tersebut diukur
+dengan tracemalloc. Jalankan skrip ini pada dua revisi yang berbeda untuk
+membandingkan hasilnya.
+
+    python tolok_ukur_memori.py [--ulang N]
+"""
+import argparse
+import gc
+import pathlib
+import sys
+import tracemalloc
+
+from kbbi import KBBI, Laman, TidakDitemukan
+
+DIR_HTML = pathlib.Path(__file__).resolve(strict=True).parent / "html"
+
+
+class KBBILokal(KBBI):
+    """KBBI yang membaca laman dari direktori html, bukan dari jaringan."""
+
+    def _init_sesi(self, auth, sesi=None):
+        self.sesi = None
+
+    def _ambil_laman(self, terautentikasi, tembolok=None, alir=False):
+        folder = "auth" if terautentikasi else "nonauth"
+        berkas = DIR_HTML / folder / "entri" / f"{self.nama}.html"
+        return Laman(self.lokasi, berkas.read_text(encoding="utf-8"))
+
+
+def urai_semua(ulang):
+    semua = []
+    for folder, auth in (("nonauth", None), ("auth", True)):
+        for berkas in sorted((DIR_HTML / folder / "entri").iterdir()):
+            for _ in range(ulang):
+                try:
+                    semua.append(KBBILokal(berkas.stem, auth))
+                except TidakDitemukan:
+                    pass
+    return semua
+
+
+def ukur(ulang):
+    urai_semua(1)  # pemanasan agar impor dan tembolok internal tidak terukur
+    gc.collect()
+    tracemalloc.start()
+    awal = tracemalloc.get_traced_memory()[0]
+    semua = urai_semua(ulang)
+    gc.collect()
+    terpakai, puncak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    jumlah_entri = sum(len(objek.entri) for objek in semua)
+    return terpakai - awal, puncak - awal, jumlah_entri
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--ulang",
+        type=int,
+        default=20,
+        help="banyaknya setiap laman diurai (bawaan: 20)",
+    )
+    args = parser.parse_args(argv)
+    terpakai, puncak, jumlah_entri = ukur(args.ulang)
+    print(f"Jumlah entri     : {jumlah_entri}")
+    print(f"Memori terpakai  : {terpakai} bita")
+    print(f"Puncak memori    : {puncak} bita")
+    print(f"Bita per entri   : {terpakai / jumlah_entri:.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+"""Membandingkan kecepatan pengekstrak entri dengan BeautifulSoup.
+
+Setiap laman tanpa autentikasi dalam direktori html diurai dengan
+KBBI.dari_html menggunakan pengekstrak serta BeautifulSoup dengan
+html.parser (dan lxml jika terinstal). Median waktu dari beberapa pengulangan
+dilaporkan untuk setiap laman. Skrip akan keluar dengan status 1 jika hasil
+pengekstrak berbeda dengan hasil html.parser.
+
+    python tolok_ukur_pengekstrak.py [--ulang N]
+"""
+
+import argparse
+import pathlib
+import statistics
+import sys
+import time
+from importlib.util import find_spec
+
+from kbbi import KBBI, TidakDitemukan
+
+DIR_HTML = pathlib.Path(__file__).resolve(strict=True).parent / "html"
+
+
+def daftar_laman():
+    """Mengembalikan daftar (kueri, html) untuk setiap laman."""
+    return [
+        (berkas.name[: -len(".html")], berkas.read_text("utf-8"))
+        for berkas in sorted((DIR_HTML / "nonauth").glob("**/*.html"))
+    ]
+
+
+def urai(kueri, html, pengurai):
+    try:
+        return KBBI.dari_html(html, kueri, pengurai=pengurai)
+    except TidakDitemukan as e:
+        return e.objek
+
+
+def ukur_waktu(fungsi, ulang):
+    durasi = []
+    for _ in range(ulang):
+        mulai = time.perf_counter()
+        fungsi()
+        durasi.append(time.perf_counter() - mulai)
+    return statistics.median(durasi)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--ulang",
+        type=int,
+        default=20,
+        help="banyaknya setiap laman diurai ulang (bawaan: 20)",
+    )
+    args = parser.parse_args(argv)
+    semua_pengurai = ["pengekstrak", "html.parser"]
+    if find_spec("lxml") is not None:
+        semua_pengurai.append("lxml")
+
+    semua = daftar_laman()
+    berbeda = []
+    total = dict.fromkeys(semua_pengurai, 0)
+    lebar = max(len(kueri) for kueri, _ in semua)
+    print(f"{'Laman':<{lebar}}", *(f"{p:>13}" for p in semua_pengurai))
+    for kueri, html in semua:
+        hasil = urai(kueri, html, "pengekstrak").serialisasi()
+        if hasil != urai(kueri, html, "html.parser").serialisasi():
+            berbeda.append(kueri)
+        waktu = {}
+        for pengurai in semua_pengurai:
+            waktu[pengurai] = ukur_waktu(
+                lambda: urai(kueri, html, pengurai), args.ulang
+            )
+            total[pengurai] += waktu[pengurai]
+        print(
+            f"{kueri:<{lebar}}",
+            *(f"{waktu[p] * 1000:>10.3f} ms" for p in semua_pengurai),
+        )
+    print(
+        f"{'Total':<{lebar}}",
+        *(f"{total[p] * 1000:>10.3f} ms" for p in semua_pengurai),
+    )
+    print()
+    for pengurai in semua_pengurai[1:]:
+        rasio = total[pengurai] / total["pengekstrak"]
+        print(f"Pengekstrak {rasio:.1f}x lebih cepat daripada {pengurai}")
+    if berbeda:
+        print()
+        print("Hasil pengekstrak berbeda:", ", ".join(berbeda))
+    return 1 if berbeda else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,207 @@
+#!/usr/bin/env python
+"""Mengukur kecepatan penguraian laman-laman dalam direktori html.
+
+Setiap laman diurai dengan KBBI.dari_html tanpa mengakses jaringan. Waktu
+pembuatan KBBI, Entri, Makna, dan Etimologi serta serialisasi dan __str__
+diukur untuk setiap laman, lalu median dari beberapa pengulangan dilaporkan
+bersama jumlah entri per detik dan puncak alokasi memori.
+
+Hasil pengukuran dapat disimpan sebagai acuan dan dibandingkan dengan
+pengukuran berikutnya. Skrip akan keluar dengan status 1 jika ada tahap yang
+lebih lambat daripada acuan melebihi ambang yang diberikan.
+
+    python tolok_ukur_pengurai.py [--ulang N] [--simpan BERKAS]
+                                  [--banding BERKAS] [--ambang PERSEN]
+"""
+import argparse
+import json
+import pathlib
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+from kbbi import KBBI, Entri, Etimologi, Makna, TidakDitemukan
+
+DIR_HTML = pathlib.Path(__file__).resolve(strict=True).parent / "html"
+TAHAP = ("KBBI", "Entri", "Makna", "Etimologi", "serialisasi", "__str__")
+
+
+def daftar_laman():
+    """Mengembalikan daftar (nama, kueri, html) untuk setiap laman."""
+    semua = []
+    for folder in ("auth", "nonauth"):
+        for berkas in sorted((DIR_HTML / folder).glob("**/*.html")):
+            kueri = berkas.name[: -len(".html")]
+            semua.append(
+                (f"{folder}/{kueri}", kueri, berkas.read_text("utf-8"))
+            )
+    return semua
+
+
+def urai(kueri, html, malas=False):
+    try:
+        return KBBI.dari_html(html, kueri, malas=malas)
+    except TidakDitemukan as e:
+        return e.objek
+
+
+def bagian(kueri, html):
+    """Mengembalikan label-label yang diurai oleh Entri, Makna, Etimologi."""
+    kbbi = urai(kueri, html, malas=True)
+    entri, makna, etimologi = [], [], []
+    for objek in kbbi.entri:
+        label = objek._entri
+        entri.append((label, objek.terautentikasi))
+        makna.extend(objek._label_makna(label))
+        label_etimologi = objek._label_etimologi(label)
+        if label_etimologi is not None:
+            etimologi.append(label_etimologi)
+    return kbbi, entri, makna, etimologi
+
+
+def ukur_waktu(fungsi, ulang):
+    durasi = []
+    for _ in range(ulang):
+        mulai = time.perf_counter()
+        fungsi()
+        durasi.append(time.perf_counter() - mulai)
+    return statistics.median(durasi)
+
+
+def ukur_laman(kueri, html, ulang):
+    _, entri, makna, etimologi = bagian(kueri, html)
+    kbbi = urai(kueri, html)
+    return {
+        "KBBI": ukur_waktu(lambda: urai(kueri, html), ulang),
+        "Entri": ukur_waktu(lambda: [Entri(*e) for e in entri], ulang),
+        "Makna": ukur_waktu(lambda: [Makna(m) for m in makna], ulang),
+        "Etimologi": ukur_waktu(
+            lambda: [Etimologi(e) for e in etimologi], ulang
+        ),
+        "serialisasi": ukur_waktu(kbbi.serialisasi, ulang),
+        "__str__": ukur_waktu(kbbi.__str__, ulang),
+    }, len(kbbi.entri)
+
+
+def ukur_memori(semua):
+    tracemalloc.start()
+    hasil = [urai(kueri, html) for _, kueri, html in semua]
+    puncak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del hasil
+    return puncak
+
+
+def ukur(ulang):
+    semua = daftar_laman()
+    for _, kueri, html in semua:  # pemanasan
+        urai(kueri, html)
+    laman = {}
+    jumlah_entri = 0
+    for nama, kueri, html in semua:
+        laman[nama], jumlah = ukur_laman(kueri, html, ulang)
+        jumlah_entri += jumlah
+    total = {
+        tahap: sum(waktu[tahap] for waktu in laman.values()) for tahap in TAHAP
+    }
+    return {
+        "python": platform.python_version(),
+        "ulang": ulang,
+        "jumlah_laman": len(laman),
+        "jumlah_entri": jumlah_entri,
+        "entri_per_detik": jumlah_entri / total["KBBI"],
+        "puncak_memori": ukur_memori(semua),
+        "total": total,
+        "laman": laman,
+    }
+
+
+def cetak(hasil):
+    lebar = max(len(nama) for nama in hasil["laman"])
+    print(f"{'Laman':<{lebar}}", *(f"{t:>11}" for t in TAHAP))
+    for nama, waktu in hasil["laman"].items():
+        print(
+            f"{nama:<{lebar}}",
+            *(f"{waktu[t] * 1000:>8.3f} ms" for t in TAHAP),
+        )
+    print(
+        f"{'Total':<{lebar}}",
+        *(f"{hasil['total'][t] * 1000:>8.3f} ms" for t in TAHAP),
+    )
+    print()
+    print(f"Jumlah laman     : {hasil['jumlah_laman']}")
+    print(f"Jumlah entri     : {hasil['jumlah_entri']}")
+    print(f"Entri per detik  : {hasil['entri_per_detik']:.1f}")
+    print(f"Puncak memori    : {hasil['puncak_memori']} bita")
+
+
+def banding(hasil, acuan, ambang):
+    """Mencetak perbandingan dengan acuan dan mengembalikan jumlah regresi."""
+    regresi = 0
+    print()
+    print(f"Perbandingan dengan acuan (ambang {ambang:.0f}%):")
+    for tahap in TAHAP:
+        lama, baru = acuan["total"][tahap], hasil["total"][tahap]
+        selisih = (baru - lama) / lama * 100
+        tanda = ""
+        if selisih > ambang:
+            tanda = "  <-- REGRESI"
+            regresi += 1
+        print(
+            f"  {tahap:<12}{lama * 1000:>9.3f} ms -> {baru * 1000:>9.3f} ms"
+            f" ({selisih:+.1f}%){tanda}"
+        )
+    for nama, waktu in hasil["laman"].items():
+        lama = acuan["laman"].get(nama, {}).get("KBBI")
+        if lama and (waktu["KBBI"] - lama) / lama * 100 > ambang * 2:
+            print(
+                f"  {nama}: KBBI {lama * 1000:.3f} ms ->"
+                f" {waktu['KBBI'] * 1000:.3f} ms"
+            )
+    lama, baru = acuan["puncak_memori"], hasil["puncak_memori"]
+    selisih = (baru - lama) / lama * 100
+    tanda = ""
+    if selisih > ambang:
+        tanda = "  <-- REGRESI"
+        regresi += 1
+    print(f"  Puncak memori {lama} -> {baru} bita ({selisih:+.1f}%){tanda}")
+    return regresi
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--ulang",
+        type=int,
+        default=20,
+        help="banyaknya setiap tahap diulang per laman (bawaan: 20)",
+    )
+    parser.add_argument(
+        "--simpan", metavar="BERKAS", help="simpan hasil sebagai acuan (JSON)"
+    )
+    parser.add_argument(
+        "--banding", metavar="BERKAS", help="bandingkan dengan berkas acuan"
+    )
+    parser.add_argument(
+        "--ambang",
+        type=float,
+        default=10,
+        help="persentase perlambatan yang dianggap regresi (bawaan: 10)",
+    )
+    args = parser.parse_args(argv)
+    hasil = ukur(args.ulang)
+    cetak(hasil)
+    regresi = 0
+    if args.banding:
+        with open(args.banding, encoding="utf-8") as berkas:
+            regresi = banding(hasil, json.load(berkas), args.ambang)
+    if args.simpan:
+        with open(args.simpan, "w", encoding="utf-8") as berkas:
+            json.dump(hasil, berkas, indent=2)
+    return 1 if regresi else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+"""Mengukur kecepatan dan memori IndeksSaran dengan daftar kata besar.
+
+Jika berkas daftar kata (satu kata per baris) tidak diberikan, sejumlah
+kata acak yang menyerupai kata dasar bahasa Indonesia akan dibuat.
+
+    python tolok_ukur_saran.py [--jumlah N] [--kueri N] [--memori] [BERKAS]
+"""
+import argparse
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+from kbbi import IndeksSaran
+
+SUKU_AWAL = "b c d f g h j k l m n p r s t w y ng ny".split() + [""]
+VOKAL = "aaiiueo"
+SUKU_AKHIR = "k l m n ng r s t h".split() + [""] * 4
+
+
+def buat_suku(acak):
+    return acak.choice(SUKU_AWAL) + acak.choice(VOKAL)
+
+
+def buat_kata(acak):
+    suku = [buat_suku(acak) for _ in range(acak.choice((1, 2, 2, 3, 3, 4)))]
+    return "".join(suku) + acak.choice(SUKU_AKHIR)
+
+
+def buat_daftar_kata(jumlah, acak):
+    daftar = {}
+    while len(daftar) < jumlah:
+        daftar.setdefault(buat_kata(acak), None)
+    return list(daftar)
+
+
+def salah_ketik(kata, acak):
+    huruf = "abcdefghijklmnopqrstuvwxyz"
+    i = acak.randrange(len(kata))
+    jenis = acak.choice(("hapus", "sisip", "ganti", "tukar"))
+    if jenis == "hapus" and len(kata) > 1:
+        return kata[:i] + kata[i + 1 :]
+    if jenis == "sisip":
+        return kata[:i] + acak.choice(huruf) + kata[i:]
+    if jenis == "tukar" and i < len(kata) - 1:
+        return kata[:i] + kata[i + 1] + kata[i] + kata[i + 2 :]
+    return kata[:i] + acak.choice(huruf) + kata[i + 1 :]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("berkas", nargs="?", help="berkas daftar kata")
+    parser.add_argument(
+        "--jumlah",
+        type=int,
+        default=100_000,
+        help="jumlah kata acak jika berkas tidak diberikan (bawaan: 100000)",
+    )
+    parser.add_argument(
+        "--kueri",
+        type=int,
+        default=1000,
+        help="jumlah kueri salah ketik yang diukur (bawaan: 1000)",
+    )
+    parser.add_argument(
+        "--memori",
+        action="store_true",
+        help="ukur juga memori indeks dengan tracemalloc (lebih lambat)",
+    )
+    args = parser.parse_args(argv)
+    acak = random.Random(45)
+    if args.berkas:
+        with open(args.berkas, encoding="utf-8") as berkas:
+            daftar_kata = [baris.strip() for baris in berkas if baris.strip()]
+    else:
+        daftar_kata = buat_daftar_kata(args.jumlah, acak)
+
+    mulai = time.perf_counter()
+    indeks = IndeksSaran(daftar_kata)
+    waktu_bangun = time.perf_counter() - mulai
+    if args.memori:
+        del indeks
+        tracemalloc.start()
+        indeks = IndeksSaran(daftar_kata)
+        memori = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+    durasi = []
+    kena = 0
+    for _ in range(args.kueri):
+        kata = acak.choice(daftar_kata)
+        kueri = salah_ketik(kata, acak)
+        mulai = time.perf_counter()
+        saran = indeks.saran(kueri)
+        durasi.append(time.perf_counter() - mulai)
+        kena += kata in saran
+    durasi.sort()
+    p99 = durasi[len(durasi) * 99 // 100]
+
+    print(f"Jumlah kata      : {len(indeks)}")
+    print(f"Waktu pembuatan  : {waktu_bangun:.2f} s")
+    if args.memori:
+        print(f"Memori indeks    : {memori / 2 ** 20:.1f} MiB")
+    print(f"Rerata kueri     : {statistics.mean(durasi) * 1000:.3f} ms")
+    print(f"Median kueri     : {statistics.median(durasi) * 1000:.3f} ms")
+    print(f"P99 kueri        : {p99 * 1000:.3f} ms")
+    print(f"Kata asli disaran: {kena / args.kueri:.1%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())